@@ -0,0 +1,74 @@
+"""
+Workload-balancing task assignment
+Each task weighs its priority, multiplied when its due date is near; the
+weights are computed in SQL, for the tasks to assign and summed for the
+open tasks employees already have. Tasks are handed out heaviest first,
+each to the employee with the lowest weighted load so far, kept on a
+min-heap; O((tasks + employees) log employees)
+"""
+import heapq
+from datetime import date, timedelta
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from sqlalchemy import and_, case, func, select
+
+from models.employee import Employee, EmployeeStatus
+from models.task import Task, TaskPriority, TaskStatus
+
+PRIORITY_WEIGHTS = {TaskPriority.LOW: 1.0, TaskPriority.MEDIUM: 2.0, TaskPriority.HIGH: 3.0}
+# (due within this many days, weight multiplier), first match wins; overdue
+# tasks fall in the first bucket
+URGENCY = [(0, 2.0), (7, 1.5)]
+
+
+def weight_expression(today: date):
+    """Weight of one task row"""
+    cutoffs = [(today + timedelta(days=days), factor) for days, factor in URGENCY]
+    urgency = case(*[(Task.due_date <= cutoff, factor) for cutoff, factor in cutoffs], else_=1.0)
+    priority = case(*[(Task.priority == p, weight) for p, weight in PRIORITY_WEIGHTS.items()], else_=0.0)
+    return priority * urgency
+
+
+def _loads_select(today: date, department: Optional[str]):
+    query = (
+        select(Employee.id, func.coalesce(func.sum(weight_expression(today)), 0.0))
+        .select_from(Employee)
+        .outerjoin(Task, and_(Task.employee_id == Employee.id, Task.status != TaskStatus.DONE))
+        .where(Employee.status == EmployeeStatus.ACTIVE)
+        .group_by(Employee.id)
+    )
+    if department is not None:
+        query = query.where(Employee.department == department)
+    return query
+
+
+def employee_loads(db, today: date, department: Optional[str] = None) -> Dict[int, float]:
+    """
+    Weighted open-task load of every active employee (optionally in one
+    department), in one aggregate query
+    """
+    return {employee_id: float(load) for employee_id, load in db.execute(_loads_select(today, department))}
+
+
+async def employee_loads_async(db, today: date, department: Optional[str] = None) -> Dict[int, float]:
+    """employee_loads on an AsyncSession"""
+    rows = await db.execute(_loads_select(today, department))
+    return {employee_id: float(load) for employee_id, load in rows}
+
+
+def balance(tasks: Sequence[Tuple[int, float]], loads: Dict[int, float]) -> List[Tuple[int, int]]:
+    """
+    Assign (task id, weight) pairs to the employees in loads, starting from
+    their current loads; returns (task id, employee id) pairs
+    """
+    if not loads:
+        return []
+    heap = [(load, employee_id) for employee_id, load in loads.items()]
+    heapq.heapify(heap)
+    assignments = []
+    # Heaviest first keeps the final loads close (longest-processing-time rule)
+    for task_id, weight in sorted(tasks, key=lambda t: (-t[1], t[0])):
+        load, employee_id = heap[0]
+        heapq.heapreplace(heap, (load + weight, employee_id))
+        assignments.append((task_id, employee_id))
+    return assignments
@@ -0,0 +1,98 @@
+"""
+Helpers for set-based bulk writes
+"""
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Set
+
+from fastapi import HTTPException
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+# Keep IN (...) lists well below SQLite's bound-parameter limit
+IN_CHUNK_SIZE = 500
+
+
+def chunked(values: List[Any], size: int = IN_CHUNK_SIZE) -> Iterable[List[Any]]:
+    for start in range(0, len(values), size):
+        yield values[start:start + size]
+
+
+def _lookups(key_column, value_columns, keys: Iterable[Any]):
+    """Selects of the rows whose key_column is one of keys, one per chunk"""
+    wanted = list({k for k in keys if k is not None})
+    for chunk in chunked(wanted):
+        yield select(key_column, *value_columns).where(key_column.in_(chunk))
+
+
+def existing_values(db: Session, column, values: Iterable[Any]) -> Set[Any]:
+    """Return the subset of values present in column, one query per chunk"""
+    found = set()
+    for query in _lookups(column, (), values):
+        found.update(db.execute(query).scalars())
+    return found
+
+
+def existing_pairs(db: Session, key_column, value_column, keys: Iterable[Any]) -> Dict[Any, Any]:
+    """Map each key present in key_column to its value_column, one query per chunk"""
+    found = {}
+    for query in _lookups(key_column, (value_column,), keys):
+        found.update(db.execute(query).all())
+    return found
+
+
+async def existing_values_async(db: "AsyncSession", column, values: Iterable[Any]) -> Set[Any]:
+    """existing_values on an AsyncSession"""
+    found = set()
+    for query in _lookups(column, (), values):
+        found.update((await db.execute(query)).scalars())
+    return found
+
+
+async def existing_pairs_async(db: "AsyncSession", key_column, value_column, keys: Iterable[Any]) -> Dict[Any, Any]:
+    """existing_pairs on an AsyncSession"""
+    found = {}
+    for query in _lookups(key_column, (value_column,), keys):
+        found.update((await db.execute(query)).all())
+    return found
+
+
+class BulkReport:
+    """Collects per-item results for a bulk request"""
+
+    def __init__(self, mode: str):
+        self.mode = mode
+        self.results = []
+        self.counts = {"create": 0, "update": 0, "delete": 0}
+
+    def fail(self, op: str, index: int, error: str, id: Optional[int] = None) -> None:
+        self.results.append({"op": op, "index": index, "id": id, "success": False, "error": error})
+
+    def ok(self, op: str, index: int, id: Optional[int]) -> None:
+        self.results.append({"op": op, "index": index, "id": id, "success": True, "error": None})
+        self.counts[op] += 1
+
+    @property
+    def has_errors(self) -> bool:
+        return any(not r["success"] for r in self.results)
+
+    def check(self) -> None:
+        """In atomic mode, reject the whole request if any item failed validation"""
+        if self.mode == "atomic" and self.has_errors:
+            raise HTTPException(
+                status_code=400,
+                detail=self.to_result(committed=False, failures_only=True)
+            )
+
+    def to_result(self, committed: bool, failures_only: bool = False) -> dict:
+        order = {"create": 0, "update": 1, "delete": 2}
+        results = [r for r in self.results if not (failures_only and r["success"])]
+        results.sort(key=lambda r: (order[r["op"]], r["index"]))
+        return {
+            "committed": committed,
+            "created": self.counts["create"] if committed else 0,
+            "updated": self.counts["update"] if committed else 0,
+            "deleted": self.counts["delete"] if committed else 0,
+            "results": results,
+        }
@@ -0,0 +1,363 @@
+"""
+Read-through response cache
+Serialized responses are stored under a key built from the route and its
+normalized query parameters, and tagged with the resources they contain so
+mutations can invalidate exactly the entries they affect
+"""
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, Optional, Set, Tuple
+
+from fastapi import Request, Response
+from pydantic import TypeAdapter
+
+import config
+from conditional import CACHE_CONTROL, Validator, is_fresh, not_modified
+from instrumentation import timed_serialization
+
+# Bound on misses awaiting their store() call
+MAX_PENDING_MISSES = 10000
+# Bound on the in-process tag versions kept to reject stale stores
+MAX_TAG_VERSIONS = 100000
+# Implicit tag of every entry, invalidated by clear()
+ALL_TAG = "*"
+
+
+class CacheBackend:
+    """
+    Storage interface for cached responses
+    Every invalidation bumps a version; an entry is stored with the version
+    read when its lookup missed, and is never served once one of its tags
+    has been invalidated at a later version, so a response computed across
+    an invalidation (in any worker) cannot outlive it
+    """
+
+    def get(self, key: str) -> Tuple[Optional[Tuple[bytes, Dict[str, str]]], int]:
+        """Return ((body, validator headers) or None, current version)"""
+        raise NotImplementedError
+
+    def set(self, key: str, body: bytes, headers: Dict[str, str], tags: Iterable[str], ttl: int, version: int) -> None:
+        """Store an entry computed after a miss at version"""
+        raise NotImplementedError
+
+    def invalidate_tags(self, tags: Iterable[str]) -> int:
+        """Drop every entry carrying any of the tags; returns entries removed"""
+        raise NotImplementedError
+
+    def clear(self) -> None:
+        raise NotImplementedError
+
+    def size(self) -> int:
+        raise NotImplementedError
+
+
+class MemoryCache(CacheBackend):
+    """In-process LRU cache with per-entry TTL"""
+
+    def __init__(self, max_entries: int = 1024):
+        self.max_entries = max_entries
+        self.evictions = 0
+        self._entries: "OrderedDict[str, Tuple[bytes, Dict[str, str], float, Tuple[str, ...]]]" = OrderedDict()
+        self._tags: Dict[str, Set[str]] = {}
+        self._version = 0
+        # Version at which each tag was last invalidated; versions below the
+        # floor were forgotten, so stores from before it are refused
+        self._tag_versions: Dict[str, int] = {}
+        self._floor = 0
+        self._lock = threading.Lock()
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        for tag in entry[3]:
+            keys = self._tags.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tags[tag]
+
+    def _bump(self, tags: Iterable[str]) -> None:
+        self._version += 1
+        if len(self._tag_versions) > MAX_TAG_VERSIONS:
+            self._tag_versions.clear()
+            self._floor = self._version
+        for tag in tags:
+            self._tag_versions[tag] = self._version
+
+    def get(self, key: str) -> Tuple[Optional[Tuple[bytes, Dict[str, str]]], int]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None, self._version
+            if entry[2] < time.monotonic():
+                self._remove(key)
+                return None, self._version
+            self._entries.move_to_end(key)
+            return (entry[0], entry[1]), self._version
+
+    def set(self, key: str, body: bytes, headers: Dict[str, str], tags: Iterable[str], ttl: int, version: int) -> None:
+        tags = tuple(tags)
+        with self._lock:
+            # Entries are removed as soon as they are invalidated, so only a
+            # store racing an invalidation needs checking
+            if version < self._floor or any(self._tag_versions.get(tag, 0) > version for tag in tags + (ALL_TAG,)):
+                return
+            self._remove(key)
+            self._entries[key] = (body, headers, time.monotonic() + ttl, tags)
+            for tag in tags:
+                self._tags.setdefault(tag, set()).add(key)
+            while len(self._entries) > self.max_entries:
+                self._remove(next(iter(self._entries)))
+                self.evictions += 1
+
+    def invalidate_tags(self, tags: Iterable[str]) -> int:
+        removed = 0
+        tags = tuple(tags)
+        with self._lock:
+            self._bump(tags)
+            for tag in tags:
+                for key in list(self._tags.get(tag, ())):
+                    self._remove(key)
+                    removed += 1
+        return removed
+
+    def clear(self) -> None:
+        with self._lock:
+            self._bump([ALL_TAG])
+            self._entries.clear()
+            self._tags.clear()
+
+    def size(self) -> int:
+        return len(self._entries)
+
+
+class RedisCache(CacheBackend):
+    """
+    Shared cache for several workers, backed by Redis
+    The invalidation version and each tag's last invalidation live in Redis
+    too, so an invalidation in one worker reaches the stores of all of them.
+    Requires the redis package (pip install redis)
+    """
+
+    # KEYS: entry, version; ARGV: tag version prefix
+    # Returns {version} on a miss, {version, body, headers} on a hit
+    GET_SCRIPT = """
+local version = redis.call('GET', KEYS[2]) or '0'
+local entry = redis.call('HMGET', KEYS[1], 'body', 'headers', 'tags', 'version')
+if not entry[1] or not entry[4] then
+    return {version}
+end
+local stored = tonumber(entry[4])
+for tag in string.gmatch(entry[3], '[^\\n]+') do
+    local invalidated = redis.call('GET', ARGV[1] .. tag)
+    if invalidated and tonumber(invalidated) > stored then
+        return {version}
+    end
+end
+return {version, entry[1], entry[2]}
+"""
+    # KEYS: version; ARGV: tag version prefix, seconds to keep, tags...
+    INVALIDATE_SCRIPT = """
+local version = redis.call('INCR', KEYS[1])
+for i = 3, #ARGV do
+    redis.call('SET', ARGV[1] .. ARGV[i], version, 'EX', ARGV[2])
+end
+return version
+"""
+
+    def __init__(self, url: str, prefix: str = "prou:cache:", max_ttl: int = 60):
+        import redis
+
+        self.client = redis.Redis.from_url(url)
+        self.prefix = prefix
+        self.version_key = f"{prefix}version"
+        self.tag_version_prefix = f"{prefix}version:"
+        # A tag's version must outlive every entry that could be stored against it
+        self.version_ttl = 2 * max_ttl
+        self._get = self.client.register_script(self.GET_SCRIPT)
+        self._invalidate = self.client.register_script(self.INVALIDATE_SCRIPT)
+
+    def get(self, key: str) -> Tuple[Optional[Tuple[bytes, Dict[str, str]]], int]:
+        reply = self._get(keys=[self.prefix + key, self.version_key], args=[self.tag_version_prefix])
+        version = int(reply[0])
+        if len(reply) == 1:
+            return None, version
+        return (reply[1], json.loads(reply[2])), version
+
+    def set(self, key: str, body: bytes, headers: Dict[str, str], tags: Iterable[str], ttl: int, version: int) -> None:
+        tags = tuple(tags)
+        pipe = self.client.pipeline()
+        pipe.hset(self.prefix + key, mapping={
+            "body": body,
+            "headers": json.dumps(headers),
+            "tags": "\n".join(tags + (ALL_TAG,)),
+            "version": version,
+        })
+        pipe.expire(self.prefix + key, ttl)
+        for tag in tags:
+            pipe.sadd(f"{self.prefix}tag:{tag}", key)
+            pipe.expire(f"{self.prefix}tag:{tag}", ttl)
+        pipe.execute()
+
+    def invalidate_tags(self, tags: Iterable[str]) -> int:
+        tags = list(tags)
+        # Versions first: entries stored from here on by any worker are refused
+        self._invalidate(keys=[self.version_key], args=[self.tag_version_prefix, self.version_ttl, *tags])
+        removed = 0
+        for tag in tags:
+            tag_key = f"{self.prefix}tag:{tag}"
+            keys = self.client.smembers(tag_key)
+            if keys:
+                removed += self.client.delete(*(self.prefix + k.decode() for k in keys))
+            self.client.delete(tag_key)
+        return removed
+
+    def _entry_keys(self):
+        return (
+            k for k in self.client.scan_iter(match=self.prefix + "*")
+            if not k.decode().startswith(self.tag_version_prefix) and k.decode() != self.version_key
+        )
+
+    def clear(self) -> None:
+        self._invalidate(keys=[self.version_key], args=[self.tag_version_prefix, self.version_ttl, ALL_TAG])
+        keys = list(self._entry_keys())
+        if keys:
+            self.client.delete(*keys)
+
+    def size(self) -> int:
+        return sum(1 for k in self._entry_keys() if b":tag:" not in k)
+
+
+def build_backend() -> CacheBackend:
+    """Choose the backend from CACHE_URL (memory when unset)"""
+    if config.CACHE_URL and config.CACHE_URL.startswith(("redis://", "rediss://")):
+        return RedisCache(config.CACHE_URL, max_ttl=config.CACHE_TTL_SECONDS)
+    return MemoryCache(config.CACHE_MAX_ENTRIES)
+
+
+def cache_key(route: str, **params: Any) -> str:
+    """Build a key from a route name and its parsed query params, ignoring unset ones"""
+    parts = []
+    for name in sorted(params):
+        value = params[name]
+        if value is None:
+            continue
+        parts.append(f"{name}={getattr(value, 'value', value)}")
+    return f"{route}?{'&'.join(parts)}"
+
+
+class ResponseCache:
+    """Looks up, stores and invalidates serialized JSON responses"""
+
+    def __init__(self, backend: CacheBackend, enabled: bool = True, ttl: int = 60):
+        self.backend = backend
+        self.enabled = enabled
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        # Backend version at each key's miss; responses computed across an
+        # invalidation of their tags are not stored
+        self._pending: Dict[str, int] = {}
+        self._adapters: Dict[Any, TypeAdapter] = {}
+
+    def _adapter(self, response_type) -> TypeAdapter:
+        adapter = self._adapters.get(response_type)
+        if adapter is None:
+            adapter = self._adapters[response_type] = TypeAdapter(response_type)
+        return adapter
+
+    @staticmethod
+    def _response(body: bytes, headers: Dict[str, str], state: str) -> Response:
+        return Response(
+            content=body,
+            media_type="application/json",
+            headers={**headers, "Cache-Control": CACHE_CONTROL, "X-Cache": state}
+        )
+
+    def lookup(self, key: str, request: Optional[Request] = None) -> Optional[Response]:
+        """
+        Return the cached response for key, or None on a miss
+        With a request, a 304 is returned when the client's copy is current
+        """
+        if not self.enabled:
+            return None
+        entry, version = self.backend.get(key)
+        if entry is None:
+            self.misses += 1
+            if len(self._pending) > MAX_PENDING_MISSES:
+                self._pending.clear()
+            self._pending.setdefault(key, version)
+            return None
+        self.hits += 1
+        body, headers = entry
+        if request is not None and is_fresh(request, headers):
+            return not_modified(headers)
+        return self._response(body, headers, "HIT")
+
+    def store(
+        self,
+        key: str,
+        response_type,
+        value: Any,
+        tags: Iterable[str],
+        validator: Optional[Validator] = None
+    ) -> Response:
+        """
+        Serialize value as response_type, cache it under key and return the response
+        Without a validator the ETag is a hash of the body
+        """
+        adapter = self._adapter(response_type)
+        with timed_serialization():
+            body = adapter.dump_json(adapter.validate_python(value, from_attributes=True))
+        return self.store_body(key, body, tags, validator)
+
+    def store_body(
+        self,
+        key: str,
+        body: bytes,
+        tags: Iterable[str],
+        validator: Optional[Validator] = None
+    ) -> Response:
+        """Cache an already serialized JSON body under key and return the response"""
+        if validator is not None:
+            headers = validator.headers()
+        else:
+            headers = {"ETag": f'"{hashlib.sha1(body).hexdigest()}"'}
+        version = self._pending.pop(key, None)
+        if self.enabled and version is not None:
+            self.backend.set(key, body, headers, tags, self.ttl, version)
+        return self._response(body, headers, "MISS")
+
+    def invalidate(self, *tags: str) -> None:
+        """Drop entries tagged with any of tags"""
+        if self.enabled:
+            self.invalidations += self.backend.invalidate_tags(tags)
+
+    def clear(self) -> None:
+        if self.enabled:
+            self.backend.clear()
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "enabled": self.enabled,
+            "backend": type(self.backend).__name__,
+            "entries": self.backend.size() if self.enabled else 0,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+            "invalidations": self.invalidations,
+            "evictions": getattr(self.backend, "evictions", 0),
+        }
+
+
+response_cache = ResponseCache(
+    build_backend(),
+    enabled=config.CACHE_ENABLED,
+    ttl=config.CACHE_TTL_SECONDS
+)
@@ -0,0 +1,156 @@
+"""
+Incremental sync ("changes since") helpers
+Changed rows are read in (updated_at, id) order from an index; deletions are
+tombstones written in the same transaction as the delete, read in
+(deleted_at, id) order. The sync token records the position in both, so a
+refresh costs O(changes)
+"""
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, NamedTuple, Optional, Tuple
+
+from fastapi import HTTPException
+from sqlalchemy import delete, insert, literal, select, tuple_
+from sqlalchemy.orm import Session
+
+import config
+from models.tombstone import Tombstone
+from pagination import decode_cursor, encode_cursor, key_datetime, key_int, nullable
+from serialization import RowShape
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+
+def _deletions(resource: str, id_column, *criteria):
+    return insert(Tombstone).from_select(
+        ["resource", "deleted_at", "resource_id"],
+        select(literal(resource), literal(datetime.utcnow()), id_column).where(*criteria)
+    )
+
+
+def record_deletions(db: Session, resource: str, id_column, *criteria) -> None:
+    """Write a tombstone for each row matching criteria; call before deleting them"""
+    db.execute(_deletions(resource, id_column, *criteria))
+
+
+async def record_deletions_async(db: "AsyncSession", resource: str, id_column, *criteria) -> None:
+    """record_deletions on an AsyncSession"""
+    await db.execute(_deletions(resource, id_column, *criteria))
+
+
+def _settle(stamp: Optional[datetime], row_id: int, floor: datetime) -> Tuple[Optional[datetime], int]:
+    """The earlier of a (timestamp, id) position and (floor, 0)"""
+    if stamp is not None and stamp > floor:
+        return floor, 0
+    return stamp, row_id
+
+
+class _Position(NamedTuple):
+    """Where a sync token left off, when it was issued and the floor of its run"""
+    last_updated: Optional[datetime]
+    last_id: int
+    last_deleted: Optional[datetime]
+    last_tombstone: int
+    now: datetime
+    floor: datetime
+
+
+def _changes_queries(resource: str, shape: RowShape, entity, since: Optional[str], limit: int):
+    """The since token's position, and the selects of the rows and tombstones after it"""
+    kind = f"{resource}.changes"
+    # (updated_at and id of the last row, deleted_at and id of the last
+    # tombstone, issue time, floor of an unfinished has_more run)
+    key_types = (
+        nullable(key_datetime), key_int, nullable(key_datetime), key_int, key_datetime, nullable(key_datetime)
+    )
+    now = datetime.utcnow()
+    if since:
+        last_updated, last_id, last_deleted, last_tombstone, issued, floor = decode_cursor(since, kind, key_types)
+        if issued < now - timedelta(days=config.CHANGES_RETENTION_DAYS):
+            raise HTTPException(status_code=410, detail="Sync token expired, refetch the full list")
+    else:
+        last_updated, last_id, last_deleted, last_tombstone, floor = None, 0, None, 0, None
+    # Changes after the floor may still be joined by earlier-stamped ones
+    floor = floor or now - timedelta(seconds=config.CHANGES_GRACE_SECONDS)
+
+    items = select(*shape.columns).order_by(entity.updated_at, entity.id)
+    if last_updated is not None:
+        items = items.where(
+            tuple_(entity.updated_at, entity.id) > tuple_(last_updated, last_id)
+        )
+
+    deleted = select(Tombstone.deleted_at, Tombstone.id, Tombstone.resource_id).where(Tombstone.resource == resource)
+    if last_deleted is not None:
+        deleted = deleted.where(tuple_(Tombstone.deleted_at, Tombstone.id) > tuple_(last_deleted, last_tombstone))
+
+    position = _Position(last_updated, last_id, last_deleted, last_tombstone, now, floor)
+    return (
+        position,
+        items.limit(limit + 1),
+        deleted.order_by(Tombstone.deleted_at, Tombstone.id).limit(limit + 1),
+    )
+
+
+def _changes_body(resource: str, shape: RowShape, position: _Position, rows, deleted, limit: int) -> dict:
+    """Response body and next sync token from the rows read after position"""
+    last_updated, last_id, last_deleted, last_tombstone, now, floor = position
+    items = shape.dicts(rows)
+    has_more = len(items) > limit or len(deleted) > limit
+    items, deleted = items[:limit], deleted[:limit]
+    if items:
+        last_updated, last_id = items[-1]["updated_at"], items[-1]["id"]
+    if deleted:
+        last_deleted, last_tombstone = deleted[-1].deleted_at, deleted[-1].id
+
+    if has_more:
+        # The next page continues from here; the run's floor travels along
+        next_floor = floor.isoformat()
+    else:
+        # The next sync starts again from the floor of this run
+        last_updated, last_id = _settle(last_updated, last_id, floor)
+        last_deleted, last_tombstone = _settle(last_deleted, last_tombstone, floor)
+        next_floor = None
+
+    token = [
+        None if last_updated is None else last_updated.isoformat(), last_id,
+        None if last_deleted is None else last_deleted.isoformat(), last_tombstone,
+        now.isoformat(), next_floor,
+    ]
+    return {
+        "items": items,
+        "deleted": [row.resource_id for row in deleted],
+        "next_since": encode_cursor(f"{resource}.changes", token),
+        "has_more": has_more,
+    }
+
+
+def changes_page(db: Session, resource: str, shape: RowShape, entity, since: Optional[str], limit: int) -> dict:
+    """
+    Rows of entity changed after the since token and IDs deleted after it
+    An empty token starts from the beginning; a token older than the
+    tombstone retention gets 410 so the client refetches everything.
+    Changes newer than CHANGES_GRACE_SECONDS are sent again on the next
+    call, so rows stamped before a concurrent commit but committed after it
+    are not skipped
+    """
+    position, items, deleted = _changes_queries(resource, shape, entity, since, limit)
+    rows = db.execute(items).all()
+    return _changes_body(resource, shape, position, rows, db.execute(deleted).all(), limit)
+
+
+async def changes_page_async(
+    db: "AsyncSession", resource: str, shape: RowShape, entity, since: Optional[str], limit: int
+) -> dict:
+    """changes_page on an AsyncSession"""
+    position, items, deleted = _changes_queries(resource, shape, entity, since, limit)
+    rows = (await db.execute(items)).all()
+    return _changes_body(resource, shape, position, rows, (await db.execute(deleted)).all(), limit)
+
+
+def prune_tombstones(db: Session, days: Optional[int] = None) -> int:
+    """Delete tombstones older than days (CHANGES_RETENTION_DAYS by default); returns rows removed"""
+    days = config.CHANGES_RETENTION_DAYS if days is None else days
+    cutoff = datetime.utcnow() - timedelta(days=days)
+    removed = db.execute(delete(Tombstone).where(Tombstone.deleted_at < cutoff)).rowcount
+    db.commit()
+    return removed
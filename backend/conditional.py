@@ -0,0 +1,116 @@
+"""
+HTTP conditional requests
+Validators (ETag / Last-Modified) are derived from id and updated_at values,
+so a client's copy can be checked without loading or serializing the resource
+"""
+import hashlib
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Any, Awaitable, Callable, Dict, Iterable, NamedTuple, Optional
+
+from fastapi import HTTPException, Request, Response
+
+# Served with every validated response: browsers must revalidate with the ETag
+CACHE_CONTROL = "private, no-cache"
+
+
+class Validator(NamedTuple):
+    """Strong ETag and Last-Modified time of a resource representation"""
+    etag: str
+    last_modified: Optional[datetime] = None
+
+    def headers(self) -> Dict[str, str]:
+        headers = {"ETag": self.etag}
+        if self.last_modified is not None:
+            headers["Last-Modified"] = format_datetime(
+                self.last_modified.replace(tzinfo=timezone.utc), usegmt=True
+            )
+        return headers
+
+
+def make_validator(*parts: Any, last_modified: Optional[datetime] = None) -> Validator:
+    """
+    Build a strong validator from the values that determine a representation
+    Only pass last_modified when every change to the representation advances
+    it (deleting or reassigning a row does not advance any updated_at)
+    """
+    digest = hashlib.sha1("|".join(map(str, parts)).encode()).hexdigest()
+    return Validator(f'"{digest}"', last_modified)
+
+
+def page_validator(key: str, rows: Iterable[dict], *extra: Any) -> Validator:
+    """
+    Validator of a list page from its own rows: the cache key (filters and
+    page or cursor), extra values such as the total, and each row's id and
+    updated_at plus any embedded object. Costs nothing beyond fetching the page
+    """
+    parts = [key, *extra]
+    for row in rows:
+        parts += [row["id"], row["updated_at"]]
+        parts += [value for value in row.values() if isinstance(value, dict)]
+    return make_validator(*parts)
+
+
+def _etags(header: str):
+    return [tag.strip() for tag in header.split(",") if tag.strip()]
+
+
+def _opaque(tag: str) -> str:
+    """Strip the weak prefix for the weak comparison used by If-None-Match"""
+    return tag[2:] if tag.startswith("W/") else tag
+
+
+def is_fresh(request: Request, headers: Dict[str, str]) -> bool:
+    """
+    True when the client's cached copy matches (If-None-Match, or
+    If-Modified-Since when no If-None-Match is sent)
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        etag = headers.get("ETag")
+        tags = _etags(if_none_match)
+        return etag is not None and ("*" in tags or _opaque(etag) in map(_opaque, tags))
+
+    if_modified_since = request.headers.get("if-modified-since")
+    last_modified = headers.get("Last-Modified")
+    if if_modified_since is None or last_modified is None:
+        return False
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+    if since.tzinfo is None:
+        since = since.replace(tzinfo=timezone.utc)
+    # HTTP dates have one-second resolution
+    return parsedate_to_datetime(last_modified) <= since
+
+
+def not_modified(headers: Dict[str, str]) -> Response:
+    """304 response carrying the current validators"""
+    return Response(status_code=304, headers={**headers, "Cache-Control": CACHE_CONTROL})
+
+
+def _require_match(request: Request, validator: Optional[Validator]) -> None:
+    tags = _etags(request.headers["if-match"])
+    if validator is not None and ("*" in tags or validator.etag in tags):
+        return
+    raise HTTPException(
+        status_code=412,
+        detail="Precondition failed: the resource has been modified"
+    )
+
+
+def check_if_match(request: Request, current: Callable[[], Optional[Validator]]) -> None:
+    """
+    Enforce If-Match on a mutation (optimistic concurrency)
+    current() returns the resource's validator (None if it does not exist)
+    and is only called when the request sends If-Match
+    """
+    if "if-match" in request.headers:
+        _require_match(request, current())
+
+
+async def check_if_match_async(request: Request, current: Callable[[], Awaitable[Optional[Validator]]]) -> None:
+    """check_if_match with a coroutine function for current"""
+    if "if-match" in request.headers:
+        _require_match(request, await current())
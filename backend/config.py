@@ -0,0 +1,110 @@
+"""
+Application settings loaded from environment variables
+"""
+import os
+
+
+def _env_bool(name: str, default: bool) -> bool:
+    value = os.getenv(name)
+    if value is None:
+        return default
+    return value.strip().lower() in ("1", "true", "yes", "on")
+
+
+def _env_int(name: str, default: int) -> int:
+    value = os.getenv(name)
+    return int(value) if value else default
+
+
+def _normalize_database_url(url: str) -> str:
+    # Render/Heroku hand out postgres:// URLs, SQLAlchemy expects postgresql://
+    if url.startswith("postgres://"):
+        return "postgresql://" + url[len("postgres://"):]
+    return url
+
+
+# Database connection
+DATABASE_URL = _normalize_database_url(os.getenv("DATABASE_URL", "sqlite:///./prothink_app.db"))
+DB_ECHO = _env_bool("DB_ECHO", False)
+# Threads running sync request handlers (Starlette's default is 40); each
+# in-flight request holds one, so raise it together with DB_POOL_SIZE
+THREADPOOL_SIZE = _env_int("THREADPOOL_SIZE", 40)
+# Serve /api/employees and /api/tasks with async handlers on an AsyncSession
+# (aiosqlite/asyncpg) instead of sync handlers on the threadpool
+DB_ASYNC = _env_bool("DB_ASYNC", False)
+
+# Startup only checks the schema version; migrations run from "manage.py migrate".
+# Single-process deployments without a release step can migrate and seed on boot
+DB_AUTO_MIGRATE = _env_bool("DB_AUTO_MIGRATE", False)
+SEED_ON_STARTUP = _env_bool("SEED_ON_STARTUP", False)
+
+# Connection pool
+DB_POOL_SIZE = _env_int("DB_POOL_SIZE", 5)
+DB_MAX_OVERFLOW = _env_int("DB_MAX_OVERFLOW", 10)
+DB_POOL_TIMEOUT = _env_int("DB_POOL_TIMEOUT", 30)  # seconds to wait for a free connection
+DB_POOL_RECYCLE = _env_int("DB_POOL_RECYCLE", 1800)  # seconds before a connection is replaced
+DB_POOL_PRE_PING = _env_bool("DB_POOL_PRE_PING", True)
+DB_STATEMENT_TIMEOUT_MS = _env_int("DB_STATEMENT_TIMEOUT_MS", 30000)  # 0 disables
+
+# SQLite pragmas applied to every new connection
+SQLITE_JOURNAL_MODE = os.getenv("SQLITE_JOURNAL_MODE", "WAL")
+SQLITE_SYNCHRONOUS = os.getenv("SQLITE_SYNCHRONOUS", "NORMAL")
+SQLITE_BUSY_TIMEOUT_MS = _env_int("SQLITE_BUSY_TIMEOUT_MS", 5000)
+SQLITE_MMAP_SIZE = _env_int("SQLITE_MMAP_SIZE", 256 * 1024 * 1024)  # bytes
+SQLITE_CACHE_SIZE = _env_int("SQLITE_CACHE_SIZE", -64000)  # negative means KiB
+
+# Response cache
+CACHE_ENABLED = _env_bool("CACHE_ENABLED", True)
+CACHE_URL = os.getenv("CACHE_URL")  # e.g. redis://localhost:6379/0, in-process when unset
+CACHE_TTL_SECONDS = _env_int("CACHE_TTL_SECONDS", 60)
+CACHE_MAX_ENTRIES = _env_int("CACHE_MAX_ENTRIES", 1024)
+
+# Change feed (/api/events)
+EVENTS_URL = os.getenv("EVENTS_URL")  # e.g. redis://localhost:6379/0 to share events between workers
+EVENTS_HISTORY = _env_int("EVENTS_HISTORY", 1000)  # recent events kept for resuming
+EVENTS_QUEUE_SIZE = _env_int("EVENTS_QUEUE_SIZE", 256)  # per client; a full queue is replaced by a reset
+EVENTS_KEEPALIVE_SECONDS = _env_int("EVENTS_KEEPALIVE_SECONDS", 15)
+# Lifetime of the ?access_token= tokens EventSource clients connect with
+EVENTS_TOKEN_EXPIRE_SECONDS = _env_int("EVENTS_TOKEN_EXPIRE_SECONDS", 60)
+
+# Authentication
+# Signing keys as "kid:secret" pairs; the first signs new tokens, the rest
+# are still accepted so keys can be rotated without logging everyone out
+JWT_SECRET_KEYS = os.getenv("JWT_SECRET_KEYS", "default:prothink-secret-key-change-in-production")
+JWT_ALGORITHM = os.getenv("JWT_ALGORITHM", "HS256")
+ACCESS_TOKEN_EXPIRE_MINUTES = _env_int("ACCESS_TOKEN_EXPIRE_MINUTES", 1440)  # 24 hours
+AUTH_CACHE_MAX_ENTRIES = _env_int("AUTH_CACHE_MAX_ENTRIES", 10000)
+AUTH_CACHE_TTL_SECONDS = _env_int("AUTH_CACHE_TTL_SECONDS", 300)  # 0 disables the cache
+
+# Password hashing (scrypt); hashes using other parameters are upgraded on login
+PASSWORD_SCRYPT_N = _env_int("PASSWORD_SCRYPT_N", 2 ** 14)  # CPU/memory cost, power of two
+PASSWORD_SCRYPT_R = _env_int("PASSWORD_SCRYPT_R", 8)
+PASSWORD_SCRYPT_P = _env_int("PASSWORD_SCRYPT_P", 1)
+# Threads dedicated to hashing; half the cores by default so requests keep the rest
+PASSWORD_HASH_WORKERS = _env_int("PASSWORD_HASH_WORKERS", max(1, (os.cpu_count() or 2) // 2))
+PASSWORD_HASH_MAX_PENDING = _env_int("PASSWORD_HASH_MAX_PENDING", 64)  # queued logins before 503
+
+# Request metrics (/metrics, Server-Timing, slow-query log); nothing is
+# installed when disabled
+METRICS_ENABLED = _env_bool("METRICS_ENABLED", False)
+SLOW_QUERY_MS = _env_int("SLOW_QUERY_MS", 200)  # 0 disables the slow-query log
+
+# Sampling profiler (/api/debug, admins only); off unless enabled on purpose
+PROFILER_ENABLED = _env_bool("PROFILER_ENABLED", False)
+PROFILER_MAX_SECONDS = _env_int("PROFILER_MAX_SECONDS", 60)
+PROFILER_OVERHEAD_BUDGET = float(os.getenv("PROFILER_OVERHEAD_BUDGET", "0.05"))  # max share of one core
+
+# Incremental sync (/changes); tombstones older than this are pruned by
+# "manage.py prune-tombstones" and older sync tokens must do a full refetch
+CHANGES_RETENTION_DAYS = _env_int("CHANGES_RETENTION_DAYS", 30)
+# Timestamps are taken before commit, so a row can become visible after rows
+# stamped later; sync tokens stay this far behind and resend newer changes.
+# Must exceed the longest write transaction (and clock skew between workers)
+CHANGES_GRACE_SECONDS = _env_int("CHANGES_GRACE_SECONDS", 60)
+
+# Due-date scanner: a background task in each worker that refreshes overdue
+# counts and publishes task.overdue events; with several workers sharing
+# EVENTS_URL, enable it on one only
+DUE_SCANNER_ENABLED = _env_bool("DUE_SCANNER_ENABLED", True)
+DUE_SCAN_INTERVAL_SECONDS = _env_int("DUE_SCAN_INTERVAL_SECONDS", 60)
+DUE_SCAN_BATCH = _env_int("DUE_SCAN_BATCH", 500)  # rows of each kind handled per tick
@@ -1,20 +1,108 @@
 """
 Database configuration and session management
 """
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, Session
 from datetime import datetime, timedelta
 
-# SQLite database URL
-SQLALCHEMY_DATABASE_URL = "sqlite:///./prothink_app.db"
+import config
 
-# Create engine with check_same_thread=False for SQLite
-engine = create_engine(
-    SQLALCHEMY_DATABASE_URL, 
-    connect_args={"check_same_thread": False},
-    echo=True  # Set to False in production
-)
+# Database URL (SQLite by default, any SQLAlchemy URL via DATABASE_URL)
+SQLALCHEMY_DATABASE_URL = config.DATABASE_URL
+
+
+def _apply_sqlite_pragmas(dbapi_connection, connection_record):
+    """Tune every new SQLite connection for concurrent readers and writers"""
+    cursor = dbapi_connection.cursor()
+    try:
+        cursor.execute(f"PRAGMA journal_mode={config.SQLITE_JOURNAL_MODE}")
+        cursor.execute(f"PRAGMA synchronous={config.SQLITE_SYNCHRONOUS}")
+        cursor.execute(f"PRAGMA busy_timeout={config.SQLITE_BUSY_TIMEOUT_MS}")
+        cursor.execute(f"PRAGMA mmap_size={config.SQLITE_MMAP_SIZE}")
+        cursor.execute(f"PRAGMA cache_size={config.SQLITE_CACHE_SIZE}")
+    finally:
+        cursor.close()
+
+
+def _engine_options(url: str, is_async: bool = False) -> dict:
+    """Engine keyword arguments derived from configuration"""
+    options = {
+        "echo": config.DB_ECHO,
+        "pool_pre_ping": config.DB_POOL_PRE_PING,
+    }
+    connect_args = {}
+    is_sqlite = url.startswith("sqlite")
+
+    if is_sqlite:
+        # Connections are shared across the threadpool; locking is handled by busy_timeout
+        connect_args["check_same_thread"] = False
+        connect_args["timeout"] = config.SQLITE_BUSY_TIMEOUT_MS / 1000
+    elif url.startswith("postgresql") and config.DB_STATEMENT_TIMEOUT_MS:
+        if is_async:
+            connect_args["server_settings"] = {"statement_timeout": str(config.DB_STATEMENT_TIMEOUT_MS)}
+        else:
+            connect_args["options"] = f"-c statement_timeout={config.DB_STATEMENT_TIMEOUT_MS}"
+
+    if not (is_sqlite and ":memory:" in url):
+        options.update(
+            pool_size=config.DB_POOL_SIZE,
+            max_overflow=config.DB_MAX_OVERFLOW,
+            pool_timeout=config.DB_POOL_TIMEOUT,
+            pool_recycle=config.DB_POOL_RECYCLE,
+        )
+        if is_sqlite and is_async:
+            # aiosqlite defaults to NullPool, which reconnects on every checkout
+            from sqlalchemy.pool import AsyncAdaptedQueuePool
+            options["poolclass"] = AsyncAdaptedQueuePool
+
+    options["connect_args"] = connect_args
+    return options
+
+
+def create_db_engine(url: str = SQLALCHEMY_DATABASE_URL, **overrides) -> Engine:
+    """
+    Build an engine from configuration
+    SQLite connections get tuned pragmas, server databases get a sized
+    connection pool and a statement timeout
+    """
+    options = _engine_options(url)
+    options.update(overrides)
+    db_engine = create_engine(url, **options)
+
+    if url.startswith("sqlite"):
+        event.listen(db_engine, "connect", _apply_sqlite_pragmas)
+
+    return db_engine
+
+
+def to_async_url(url: str) -> str:
+    """Swap the driver of a database URL for its asyncio counterpart"""
+    scheme, _, rest = url.partition("://")
+    dialect = scheme.split("+")[0]
+    drivers = {"sqlite": "sqlite+aiosqlite", "postgresql": "postgresql+asyncpg"}
+    if dialect not in drivers:
+        raise ValueError(f"No async driver configured for {dialect} URLs")
+    return f"{drivers[dialect]}://{rest}"
+
+
+def create_async_db_engine(url: str = SQLALCHEMY_DATABASE_URL, **overrides):
+    """Build an AsyncEngine (aiosqlite/asyncpg) with the same settings as create_db_engine"""
+    from sqlalchemy.ext.asyncio import create_async_engine
+
+    async_url = to_async_url(url)
+    options = _engine_options(async_url, is_async=True)
+    options.update(overrides)
+    db_engine = create_async_engine(async_url, **options)
+
+    if url.startswith("sqlite"):
+        event.listen(db_engine.sync_engine, "connect", _apply_sqlite_pragmas)
+
+    return db_engine
+
+
+engine = create_db_engine()
 
 # Create session factory
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
@@ -35,6 +123,73 @@ def get_db() -> Session:
         db.close()
 
 
+# Async engine and session factory of the DB_ASYNC stack, created on first use
+async_engine = None
+AsyncSessionLocal = None
+
+
+def init_async_db(url: str = SQLALCHEMY_DATABASE_URL) -> None:
+    """Create the async engine and session factory"""
+    global async_engine, AsyncSessionLocal
+    from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+    async_engine = create_async_db_engine(url)
+    # Objects stay loaded after commit; an expired attribute would need IO
+    # when the response is serialized
+    AsyncSessionLocal = async_sessionmaker(
+        async_engine,
+        class_=AsyncSession,
+        autoflush=False,
+        expire_on_commit=False
+    )
+
+
+def get_async_engine():
+    """The DB_ASYNC engine, created on first use"""
+    if async_engine is None:
+        init_async_db()
+    return async_engine
+
+
+async def get_async_db():
+    """
+    Async dependency function to get database session
+    Yields an AsyncSession and closes it after use
+    """
+    if AsyncSessionLocal is None:
+        init_async_db()
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
+# Demo login accounts created in an empty users table
+DEMO_USERS = [
+    {"email": "admin@prothink.com", "password": "password123", "name": "Admin User", "role": "Administrator"},
+    {"email": "manager@prothink.com", "password": "manager123", "name": "Manager User", "role": "Manager"},
+]
+
+
+def seed_users(db):
+    """Create the demo login accounts if there are no users yet"""
+    from models.user import User
+    from passwords import hash_password
+    
+    if db.query(User).count() > 0:
+        return
+    
+    db.add_all(
+        User(
+            email=user["email"],
+            name=user["name"],
+            role=user["role"],
+            password_hash=hash_password(user["password"])
+        )
+        for user in DEMO_USERS
+    )
+    db.commit()
+    print(f"Created {len(DEMO_USERS)} demo users")
+
+
 def seed_database():
     """
     Seed the database with initial demo data
@@ -42,9 +197,12 @@ def seed_database():
     """
     from models.employee import Employee
     from models.task import Task
+    from workload import refresh_workloads
     
     db = SessionLocal()
     try:
+        seed_users(db)
+        
         # Check if data already exists
         if db.query(Employee).count() > 0:
             print("Database already seeded, skipping...")
@@ -172,6 +330,7 @@ def seed_database():
         ]
         
         db.add_all(tasks)
+        refresh_workloads(db, [emp.id for emp in employees])
         db.commit()
         
         print(f"Successfully seeded {len(employees)} employees and {len(tasks)} tasks")
@@ -0,0 +1,228 @@
+"""
+Change feed for tasks and employees
+Mutation handlers publish a compact event after committing. The broker
+numbers events, keeps a short history for resuming, and fans them out to
+each subscriber's bounded queue; a Redis backend shares them between workers
+"""
+import asyncio
+import json
+import threading
+from collections import deque
+from typing import Any, Callable, Deque, Dict, Iterable, Optional, Set
+
+import config
+
+Event = Dict[str, Any]
+
+
+class EventBackend:
+    """Transport that numbers published events and passes them to deliver() in order"""
+
+    deliver: Callable[[Event], None]
+
+    def start(self, deliver: Callable[[Event], None]) -> None:
+        self.deliver = deliver
+
+    def publish(self, event: Event) -> None:
+        raise NotImplementedError
+
+    def close(self) -> None:
+        pass
+
+
+class MemoryEvents(EventBackend):
+    """Events seen only by this process"""
+
+    def __init__(self):
+        self.seq = 0
+        self._lock = threading.Lock()
+
+    def publish(self, event: Event) -> None:
+        with self._lock:
+            self.seq += 1
+            self.deliver({"seq": self.seq, **event})
+
+
+class RedisEvents(EventBackend):
+    """
+    Events shared by several workers through Redis pub/sub
+    A script increments the sequence and publishes in one step, so every
+    worker sees the same ids in the same order. Requires the redis package
+    """
+
+    PUBLISH = """
+    local seq = redis.call('INCR', KEYS[1])
+    redis.call('PUBLISH', KEYS[2], seq .. ' ' .. ARGV[1])
+    return seq
+    """
+
+    def __init__(self, url: str, prefix: str = "prou:events:"):
+        import redis
+
+        self.client = redis.Redis.from_url(url)
+        self.keys = [prefix + "seq", prefix + "changes"]
+        self._publish = self.client.register_script(self.PUBLISH)
+        self._pubsub = None
+        self._thread = None
+
+    def start(self, deliver: Callable[[Event], None]) -> None:
+        super().start(deliver)
+        self._pubsub = self.client.pubsub(ignore_subscribe_messages=True)
+        self._pubsub.subscribe(**{self.keys[1]: self._on_message})
+        self._thread = self._pubsub.run_in_thread(sleep_time=1.0, daemon=True)
+
+    def _on_message(self, message: dict) -> None:
+        seq, payload = message["data"].split(b" ", 1)
+        self.deliver({"seq": int(seq), **json.loads(payload)})
+
+    def publish(self, event: Event) -> None:
+        self._publish(keys=self.keys, args=[json.dumps(event, separators=(",", ":"))])
+
+    def close(self) -> None:
+        if self._thread is not None:
+            self._thread.stop()
+            self._pubsub.close()
+
+
+def build_backend() -> EventBackend:
+    """Choose the backend from EVENTS_URL (in-process when unset)"""
+    if config.EVENTS_URL and config.EVENTS_URL.startswith(("redis://", "rediss://")):
+        return RedisEvents(config.EVENTS_URL)
+    return MemoryEvents()
+
+
+class Subscription:
+    """
+    One client's filtered view of the feed, queued on its event loop
+    When the queue is full its backlog is replaced by a single reset event,
+    telling the client to refetch instead of replaying every change
+    """
+
+    def __init__(self, loop, employee_ids: Iterable[int], departments: Iterable[str], max_queued: int):
+        self.employee_ids: Set[int] = set(employee_ids)
+        self.departments: Set[str] = set(departments)
+        self.queue: "asyncio.Queue[Event]" = asyncio.Queue(max_queued)
+        self.overflows = 0
+        self._loop = loop
+
+    def matches(self, event: Event) -> bool:
+        """Unfiltered subscribers get everything, others events touching their employees or departments"""
+        if not self.employee_ids and not self.departments:
+            return True
+        # None means the change may touch any employee (e.g. an import)
+        if event["employee_ids"] is None:
+            return True
+        return bool(
+            self.employee_ids.intersection(event["employee_ids"])
+            or self.departments.intersection(event["departments"])
+        )
+
+    def put(self, event: Event) -> None:
+        """Queue an event; must run on the subscriber's loop"""
+        try:
+            self.queue.put_nowait(event)
+        except asyncio.QueueFull:
+            self.overflows += 1
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            self.queue.put_nowait(reset_event(event["seq"]))
+
+    def offer(self, event: Event) -> None:
+        """Queue an event from any thread"""
+        self._loop.call_soon_threadsafe(self.put, event)
+
+
+def reset_event(seq: int) -> Event:
+    """Tells a subscriber that events up to seq were missed"""
+    return {"seq": seq, "type": "reset", "ids": [], "employee_ids": None, "departments": None}
+
+
+class EventBroker:
+    """Numbers, remembers and fans out change events"""
+
+    def __init__(self, backend: EventBackend, history: int = 1000, queue_size: int = 256):
+        self.backend = backend
+        self.queue_size = queue_size
+        self.history: Deque[Event] = deque(maxlen=history)
+        self.last_seq = 0
+        self.published = 0
+        self._subscribers: Set[Subscription] = set()
+        self._lock = threading.Lock()
+        backend.start(self._deliver)
+
+    def publish(
+        self,
+        event_type: str,
+        ids: Iterable[int],
+        employee_ids: Optional[Iterable[Optional[int]]] = (),
+        departments: Optional[Iterable[Optional[str]]] = ()
+    ) -> None:
+        """
+        Publish a change event; call after the change is committed
+        Pass employee_ids=None for changes that may touch any employee
+        """
+        self.published += 1
+        self.backend.publish({
+            "type": event_type,
+            "ids": sorted(set(ids)),
+            "employee_ids": None if employee_ids is None else sorted({i for i in employee_ids if i is not None}),
+            "departments": None if employee_ids is None else sorted({d for d in departments if d}),
+        })
+
+    def _deliver(self, event: Event) -> None:
+        with self._lock:
+            self.history.append(event)
+            self.last_seq = event["seq"]
+            subscribers = [s for s in self._subscribers if s.matches(event)]
+        for subscription in subscribers:
+            try:
+                subscription.offer(event)
+            except RuntimeError:
+                # The subscriber's loop has shut down
+                self.unsubscribe(subscription)
+
+    def subscribe(
+        self,
+        employee_ids: Iterable[int] = (),
+        departments: Iterable[str] = (),
+        last_seq: Optional[int] = None
+    ) -> Subscription:
+        """
+        Register a subscriber on the running event loop
+        With last_seq, the matching events after it are queued first, or a
+        reset event when they are no longer all in the history
+        """
+        subscription = Subscription(asyncio.get_running_loop(), employee_ids, departments, self.queue_size)
+        with self._lock:
+            if last_seq is not None and last_seq != self.last_seq:
+                oldest = self.history[0]["seq"] if self.history else self.last_seq + 1
+                if oldest <= last_seq + 1 and last_seq < self.last_seq:
+                    for event in self.history:
+                        if event["seq"] > last_seq and subscription.matches(event):
+                            subscription.put(event)
+                else:
+                    subscription.put(reset_event(self.last_seq))
+            self._subscribers.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        with self._lock:
+            self._subscribers.discard(subscription)
+
+    def stats(self) -> dict:
+        with self._lock:
+            subscribers = list(self._subscribers)
+        return {
+            "backend": type(self.backend).__name__,
+            "last_seq": self.last_seq,
+            "published": self.published,
+            "subscribers": len(subscribers),
+            "overflows": sum(s.overflows for s in subscribers),
+        }
+
+
+broker = EventBroker(
+    build_backend(),
+    history=config.EVENTS_HISTORY,
+    queue_size=config.EVENTS_QUEUE_SIZE
+)
@@ -0,0 +1,290 @@
+"""
+Streaming CSV/NDJSON import of employees and tasks
+Rows are parsed one line at a time, validated with the create schemas and
+inserted in fixed-size batches, one transaction per batch. Job progress is
+stored in import_jobs, so a poll can land on any worker
+"""
+import csv
+import json
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+from pydantic import ValidationError
+from sqlalchemy import delete, insert, select, update
+from sqlalchemy.exc import SQLAlchemyError
+
+from cache import response_cache
+from events import broker
+from models.employee import Employee, EmployeeStatus
+from models.import_job import ImportJob
+from models.task import Task
+from schemas.employee import EmployeeCreate
+from schemas.task import TaskCreate
+from workload import refresh_workloads
+
+# Rows validated and inserted per transaction
+IMPORT_BATCH_ROWS = 1000
+# Row errors kept per job (the total is always counted)
+MAX_REPORTED_ERRORS = 1000
+# Jobs kept for polling, newest first
+MAX_TRACKED_JOBS = 100
+# A pending or running job whose heartbeat is older than this was lost with
+# its worker (restart or crash); the heartbeat moves at least once per batch
+JOB_STALE_SECONDS = 300
+
+IMPORT_FORMATS = ("csv", "ndjson")
+IMPORT_RESOURCES = ("employees", "tasks")
+
+# Columns rewritten as a job progresses
+PROGRESS_FIELDS = (
+    "status", "rows_processed", "rows_imported", "rows_failed", "errors", "detail", "started_at", "finished_at"
+)
+
+# Jobs this process has accepted and not finished; their heartbeats move together
+_active = set()
+_active_lock = threading.Lock()
+# Imports write in large transactions; run them one at a time
+_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="import")
+
+
+def _default_bind(bind):
+    if bind is None:
+        from database import engine as bind
+    return bind
+
+
+def add_error(job: ImportJob, row: int, message: str) -> None:
+    job.rows_failed += 1
+    if len(job.errors) < MAX_REPORTED_ERRORS:
+        job.errors.append({"row": row, "error": message})
+
+
+def create_job(resource: str, fmt: str, bind=None) -> ImportJob:
+    """Record a pending job; the oldest beyond MAX_TRACKED_JOBS are dropped"""
+    bind = _default_bind(bind)
+    now = datetime.utcnow()
+    job = ImportJob(
+        id=uuid.uuid4().hex, resource=resource, format=fmt, status="pending",
+        rows_processed=0, rows_imported=0, rows_failed=0, errors=[], detail=None,
+        created_at=now, started_at=None, finished_at=None, heartbeat_at=now
+    )
+    with bind.begin() as conn:
+        conn.execute(insert(ImportJob).values(
+            {column.key: getattr(job, column.key) for column in ImportJob.__table__.columns}
+        ))
+        newest = select(ImportJob.id).order_by(ImportJob.created_at.desc()).limit(MAX_TRACKED_JOBS)
+        conn.execute(delete(ImportJob).where(ImportJob.id.not_in(newest.scalar_subquery())))
+    with _active_lock:
+        _active.add(job.id)
+    return job
+
+
+def save_job(job: ImportJob, bind=None) -> None:
+    """Write a job's progress, and the heartbeat of every job this process still holds"""
+    bind = _default_bind(bind)
+    now = datetime.utcnow()
+    values = {name: getattr(job, name) for name in PROGRESS_FIELDS}
+    values.update(errors=list(job.errors), heartbeat_at=now)
+    with _active_lock:
+        held = list(_active - {job.id})
+    with bind.begin() as conn:
+        conn.execute(update(ImportJob).where(ImportJob.id == job.id).values(values))
+        if held:
+            conn.execute(update(ImportJob).where(ImportJob.id.in_(held)).values(heartbeat_at=now))
+
+
+def get_job(job_id: str, bind=None) -> Optional[dict]:
+    """A job's current state, whichever worker runs it"""
+    bind = _default_bind(bind)
+    with bind.connect() as conn:
+        row = conn.execute(select(ImportJob.__table__).where(ImportJob.id == job_id)).first()
+    if row is None:
+        return None
+    job = dict(row._mapping)
+    stale = datetime.utcnow() - timedelta(seconds=JOB_STALE_SECONDS)
+    if job["status"] in ("pending", "running") and job["heartbeat_at"] < stale:
+        job.update(status="failed", detail="Import interrupted: the worker running it stopped")
+    return job
+
+
+def iter_records(lines: Iterable[str], fmt: str) -> Iterator[Tuple[int, dict]]:
+    """
+    Yield (row number, record) pairs from CSV or NDJSON lines
+    Empty CSV cells are dropped so schema defaults apply
+    """
+    if fmt == "csv":
+        reader = csv.DictReader(lines)
+        for row_number, row in enumerate(reader, start=1):
+            yield row_number, {k: v for k, v in row.items() if k and v not in ("", None)}
+        return
+
+    for row_number, line in enumerate(lines, start=1):
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError as e:
+            record = {"__error__": f"Invalid JSON: {e.msg}"}
+        if not isinstance(record, dict):
+            record = {"__error__": "Expected a JSON object"}
+        yield row_number, record
+
+
+def _validation_message(error: ValidationError) -> str:
+    return "; ".join(
+        f"{'.'.join(str(p) for p in e['loc'])}: {e['msg']}" for e in error.errors()
+    )
+
+
+def _task_rows(conn, batch: List[Tuple[int, dict]], job: ImportJob) -> List[dict]:
+    """Validate a batch of task records; returns insertable rows"""
+    valid = []
+    for row_number, record in batch:
+        if "__error__" in record:
+            add_error(job, row_number, record["__error__"])
+            continue
+        try:
+            valid.append((row_number, TaskCreate.model_validate(record)))
+        except ValidationError as e:
+            add_error(job, row_number, _validation_message(e))
+
+    employee_ids = list({task.employee_id for _, task in valid if task.employee_id})
+    known = set()
+    if employee_ids:
+        known = set(conn.execute(
+            select(Employee.id).where(Employee.id.in_(employee_ids))
+        ).scalars())
+
+    rows = []
+    for row_number, task in valid:
+        if task.employee_id and task.employee_id not in known:
+            add_error(job, row_number, f"Employee with ID {task.employee_id} not found")
+            continue
+        rows.append(task.model_dump())
+    return rows
+
+
+def _employee_rows(conn, batch: List[Tuple[int, dict]], job: ImportJob) -> List[dict]:
+    """Validate a batch of employee records; returns insertable rows"""
+    valid = []
+    for row_number, record in batch:
+        if "__error__" in record:
+            add_error(job, row_number, record["__error__"])
+            continue
+        try:
+            valid.append((row_number, EmployeeCreate.model_validate(record)))
+        except ValidationError as e:
+            add_error(job, row_number, _validation_message(e))
+
+    emails = list({employee.email for _, employee in valid})
+    taken = set()
+    if emails:
+        taken = set(conn.execute(
+            select(Employee.email).where(Employee.email.in_(emails))
+        ).scalars())
+
+    now = datetime.utcnow()
+    rows = []
+    for row_number, employee in valid:
+        if employee.email in taken:
+            add_error(job, row_number, f"Employee with email {employee.email} already exists")
+            continue
+        taken.add(employee.email)
+        rows.append({
+            "name": employee.name,
+            "email": employee.email,
+            "role": employee.role,
+            "department": employee.department,
+            "status": EmployeeStatus(employee.status),
+            "date_joined": employee.date_joined or now
+        })
+    return rows
+
+
+_RESOURCES = {
+    "tasks": (Task, _task_rows),
+    "employees": (Employee, _employee_rows),
+}
+
+
+def run_import(job: ImportJob, lines: Iterable[str], bind=None, on_batch=None) -> ImportJob:
+    """
+    Import records into job.resource in IMPORT_BATCH_ROWS-sized transactions
+    Progress is saved after each batch; on_batch(job) is called then too
+    """
+    bind = _default_bind(bind)
+
+    model, build_rows = _RESOURCES[job.resource]
+    job.status = "running"
+    job.started_at = datetime.utcnow()
+    save_job(job, bind)
+
+    def flush(batch):
+        with bind.begin() as conn:
+            rows = build_rows(conn, batch, job)
+            if rows:
+                conn.execute(insert(model), rows)
+                if model is Task:
+                    refresh_workloads(conn, [row.get("employee_id") for row in rows])
+        if rows:
+            # Imported rows can appear in any cached list or count
+            response_cache.clear()
+            broker.publish(f"{job.resource[:-1]}.imported", [], employee_ids=None)
+        job.rows_imported += len(rows)
+
+    def batch_done(batch):
+        _flush_batch(flush, batch, job)
+        save_job(job, bind)
+        if on_batch:
+            on_batch(job)
+
+    try:
+        batch = []
+        for row_number, record in iter_records(lines, job.format):
+            batch.append((row_number, record))
+            job.rows_processed += 1
+            if len(batch) >= IMPORT_BATCH_ROWS:
+                batch_done(batch)
+                batch = []
+        if batch:
+            batch_done(batch)
+        job.status = "completed"
+    except Exception as e:
+        job.status = "failed"
+        job.detail = str(e)
+    finally:
+        job.finished_at = datetime.utcnow()
+        with _active_lock:
+            _active.discard(job.id)
+        save_job(job, bind)
+    return job
+
+
+def _flush_batch(flush, batch, job: ImportJob) -> None:
+    """Insert one batch; a failed transaction marks all of its rows as failed"""
+    failed_before, errors_before = job.rows_failed, len(job.errors)
+    try:
+        flush(batch)
+    except SQLAlchemyError as e:
+        # Rows already reported by validation are not counted twice
+        job.rows_failed = failed_before
+        del job.errors[errors_before:]
+        message = f"Batch rolled back: {e.__class__.__name__}"
+        for row_number, _ in batch:
+            add_error(job, row_number, message)
+
+
+def submit_import(job: ImportJob, path: str, cleanup=None) -> None:
+    """Run an import from a file in the background import worker"""
+    def work():
+        try:
+            with open(path, encoding="utf-8-sig", newline="") as lines:
+                run_import(job, lines)
+        finally:
+            if cleanup:
+                cleanup()
+
+    _executor.submit(work)
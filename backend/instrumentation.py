@@ -0,0 +1,290 @@
+"""
+SQL and request instrumentation
+Per-request latency, SQL statement count/time and serialization time are
+collected by an ASGI middleware and SQLAlchemy cursor hooks, exported as
+Prometheus text at /metrics and as a Server-Timing header
+"""
+import bisect
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Callable, Dict, List, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+logger = logging.getLogger("prou.sql")
+
+
+class QueryCounter:
+    """Collects the SQL statements emitted while it is active"""
+
+    def __init__(self):
+        self.statements: List[str] = []
+
+    @property
+    def count(self) -> int:
+        return len(self.statements)
+
+    def __call__(self, conn, cursor, statement, parameters, context, executemany):
+        self.statements.append(statement)
+
+
+@contextmanager
+def count_queries(bind: Optional[Engine] = None):
+    """
+    Count SQL statements executed on an engine inside the block
+
+    Usage:
+        with count_queries() as counter:
+            client.get("/api/tasks")
+        assert counter.count <= 2
+    """
+    if bind is None:
+        from database import engine as bind
+
+    counter = QueryCounter()
+    event.listen(bind, "before_cursor_execute", counter)
+    try:
+        yield counter
+    finally:
+        event.remove(bind, "before_cursor_execute", counter)
+
+
+class RequestMetrics:
+    """Timings collected while serving one request"""
+    __slots__ = ("sql_count", "sql_seconds", "serialize_seconds", "scope")
+
+    def __init__(self, scope: Optional[dict] = None):
+        self.sql_count = 0
+        self.sql_seconds = 0.0
+        self.serialize_seconds = 0.0
+        self.scope = scope or {}
+
+    @property
+    def route(self) -> str:
+        """Path template of the matched route; unmatched paths share one label"""
+        route = self.scope.get("route")
+        return route.path if route is not None else "unmatched"
+
+    def server_timing(self, total_seconds: float) -> str:
+        return (
+            f'db;dur={self.sql_seconds * 1000:.2f};desc="{self.sql_count} queries", '
+            f"serialize;dur={self.serialize_seconds * 1000:.2f}, "
+            f"total;dur={total_seconds * 1000:.2f}"
+        )
+
+
+# Metrics of the request being served; copied into threadpool workers, which
+# mutate the same object
+current_request: ContextVar[Optional[RequestMetrics]] = ContextVar("current_request", default=None)
+
+
+@contextmanager
+def timed_serialization():
+    """Add the time spent in the block to the current request's serialization time"""
+    metrics = current_request.get()
+    if metrics is None:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        metrics.serialize_seconds += time.perf_counter() - start
+
+
+class Histogram:
+    """Cumulative histogram in the Prometheus layout"""
+
+    def __init__(self, buckets: Tuple[float, ...]):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+STATEMENT_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100)
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(**labels) -> str:
+    return "{" + ",".join(f'{k}="{_escape(v)}"' for k, v in labels.items()) + "}"
+
+
+class MetricsRegistry:
+    """Process-wide request and SQL metrics"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.requests: Dict[Tuple[str, str, int], int] = {}
+        self.latency: Dict[Tuple[str, str], Histogram] = {}
+        self.statements: Dict[Tuple[str, str], Histogram] = {}
+        self.sql_seconds: Dict[Tuple[str, str], float] = {}
+        self.serialize_seconds: Dict[Tuple[str, str], float] = {}
+        self.slow_queries = 0
+        # name -> callable returning {metric suffix: value}, e.g. cache counters
+        self.collectors: Dict[str, Callable[[], Dict[str, float]]] = {}
+
+    def record(self, method: str, route: str, status: int, seconds: float, metrics: RequestMetrics) -> None:
+        key = (method, route)
+        with self._lock:
+            self.requests[(method, route, status)] = self.requests.get((method, route, status), 0) + 1
+            self.latency.setdefault(key, Histogram(LATENCY_BUCKETS)).observe(seconds)
+            self.statements.setdefault(key, Histogram(STATEMENT_BUCKETS)).observe(metrics.sql_count)
+            self.sql_seconds[key] = self.sql_seconds.get(key, 0.0) + metrics.sql_seconds
+            self.serialize_seconds[key] = self.serialize_seconds.get(key, 0.0) + metrics.serialize_seconds
+
+    def record_slow_query(self) -> None:
+        with self._lock:
+            self.slow_queries += 1
+
+    def _histogram_lines(self, name: str, histograms: Dict[Tuple[str, str], Histogram]) -> List[str]:
+        lines = []
+        for (method, route), histogram in sorted(histograms.items()):
+            cumulative = 0
+            for bound, count in zip(histogram.buckets + (float("inf"),), histogram.counts):
+                cumulative += count
+                le = "+Inf" if bound == float("inf") else repr(bound)
+                lines.append(f"{name}_bucket{_labels(method=method, route=route, le=le)} {cumulative}")
+            lines.append(f"{name}_sum{_labels(method=method, route=route)} {histogram.sum}")
+            lines.append(f"{name}_count{_labels(method=method, route=route)} {cumulative}")
+        return lines
+
+    def render(self) -> str:
+        """Prometheus text exposition format"""
+        with self._lock:
+            lines = [
+                "# HELP http_requests_total Requests served",
+                "# TYPE http_requests_total counter",
+            ]
+            for (method, route, status), count in sorted(self.requests.items()):
+                lines.append(f"http_requests_total{_labels(method=method, route=route, status=status)} {count}")
+            lines += [
+                "# HELP http_request_duration_seconds Request latency until the response is sent",
+                "# TYPE http_request_duration_seconds histogram",
+            ]
+            lines += self._histogram_lines("http_request_duration_seconds", self.latency)
+            lines += [
+                "# HELP http_request_sql_statements SQL statements executed per request",
+                "# TYPE http_request_sql_statements histogram",
+            ]
+            lines += self._histogram_lines("http_request_sql_statements", self.statements)
+            for name, values, help_text in (
+                ("http_request_sql_seconds_total", self.sql_seconds, "Time spent executing SQL"),
+                ("http_request_serialize_seconds_total", self.serialize_seconds, "Time spent serializing responses"),
+            ):
+                lines += [f"# HELP {name} {help_text}", f"# TYPE {name} counter"]
+                for (method, route), seconds in sorted(values.items()):
+                    lines.append(f"{name}{_labels(method=method, route=route)} {seconds}")
+            lines += [
+                "# HELP sql_slow_queries_total Statements slower than SLOW_QUERY_MS",
+                "# TYPE sql_slow_queries_total counter",
+                f"sql_slow_queries_total {self.slow_queries}",
+            ]
+        for prefix, collect in self.collectors.items():
+            for suffix, value in collect().items():
+                lines += [f"# TYPE {prefix}_{suffix} gauge", f"{prefix}_{suffix} {value}"]
+        return "\n".join(lines) + "\n"
+
+
+registry = MetricsRegistry()
+# Set by install_sql_timing; 0 disables the slow-query log
+slow_query_seconds = 0.0
+
+
+# The start time lives on the statement's execution context, which is
+# discarded with it when the statement fails and after_cursor_execute never runs
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    context._query_start = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    elapsed = time.perf_counter() - context._query_start
+    metrics = current_request.get()
+    if metrics is not None:
+        metrics.sql_count += 1
+        metrics.sql_seconds += elapsed
+    if slow_query_seconds and elapsed >= slow_query_seconds:
+        registry.record_slow_query()
+        logger.warning(
+            "slow query (%.1f ms) on %s: %s",
+            elapsed * 1000,
+            metrics.route if metrics is not None else "-",
+            " ".join(statement.split())[:500]
+        )
+
+
+def install_sql_timing(slow_query_ms: int) -> None:
+    """Time every statement on every engine"""
+    global slow_query_seconds
+    slow_query_seconds = slow_query_ms / 1000
+    if not event.contains(Engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(Engine, "after_cursor_execute", _after_cursor_execute)
+
+
+def install_serialization_timing() -> None:
+    """
+    Time FastAPI's response_model serialization
+    FastAPI exposes no hook for it, so fastapi.routing.serialize_response is wrapped
+    """
+    import fastapi.routing
+
+    original = fastapi.routing.serialize_response
+    if getattr(original, "__wrapped__", None) is not None:
+        return
+
+    async def serialize_response(*args, **kwargs):
+        with timed_serialization():
+            return await original(*args, **kwargs)
+
+    serialize_response.__wrapped__ = original
+    fastapi.routing.serialize_response = serialize_response
+
+
+class MetricsMiddleware:
+    """
+    ASGI middleware recording latency, SQL and serialization time per route
+    and adding a Server-Timing header
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        metrics = RequestMetrics(scope)
+        token = current_request.set(metrics)
+        start = time.perf_counter()
+        status = 500
+
+        async def send_with_timing(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                headers = list(message.get("headers", []))
+                headers.append((
+                    b"server-timing",
+                    metrics.server_timing(time.perf_counter() - start).encode()
+                ))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            current_request.reset(token)
+            registry.record(scope["method"], metrics.route, status, time.perf_counter() - start, metrics)
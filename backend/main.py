@@ -2,26 +2,49 @@
 ProU Technology - Employee & Task Management API
 FastAPI backend application entry point
 """
-from fastapi import FastAPI
+import asyncio
+from anyio import to_thread
+from fastapi import Depends, FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from contextlib import asynccontextmanager
+from fastapi.responses import PlainTextResponse
+from contextlib import asynccontextmanager, suppress
+from importlib import import_module
 
-from database import engine, Base, seed_database
-from routers import employees, tasks, auth
+import config
+import database
+import instrumentation
+from cache import response_cache
+from database import engine, seed_database
+from migrations import check_schema
+from profiler import ProfileRequestMiddleware
+from security import get_current_user, get_events_user, require_admin, token_cache
+from routers.lazy import include_lazy_router, load_lazy_routers
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    """Initialize database and seed data on startup"""
-    # Create all tables
-    Base.metadata.create_all(bind=engine)
+    """Check the schema version and start the due-date scanner (migrations run from manage.py)"""
+    check_schema(engine)
+    # Sync request handlers run on this threadpool
+    to_thread.current_default_thread_limiter().total_tokens = config.THREADPOOL_SIZE
     
-    # Seed initial data
-    seed_database()
+    if config.SEED_ON_STARTUP:
+        seed_database()
+    
+    scan = None
+    if config.DUE_SCANNER_ENABLED:
+        from scanner import DueScanner
+        scan = asyncio.create_task(DueScanner(config.DUE_SCAN_BATCH).run(config.DUE_SCAN_INTERVAL_SECONDS))
     
     yield
     
-    # Cleanup (if needed)
+    # Cleanup
+    if scan is not None:
+        scan.cancel()
+        with suppress(asyncio.CancelledError):
+            await scan
+    if database.async_engine is not None:
+        await database.async_engine.dispose()
 
 
 app = FastAPI(
@@ -44,12 +67,62 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    # Let browser clients read validators for If-Match
+    expose_headers=["ETag", "Last-Modified"],
 )
 
-# Include routers
-app.include_router(auth.router, prefix="/api/auth", tags=["Authentication"])
-app.include_router(employees.router, prefix="/api/employees", tags=["Employees"])
-app.include_router(tasks.router, prefix="/api/tasks", tags=["Tasks"])
+# Request metrics, Server-Timing and slow-query log (no hooks when disabled)
+if config.METRICS_ENABLED:
+    instrumentation.install_sql_timing(config.SLOW_QUERY_MS)
+    instrumentation.install_serialization_timing()
+    instrumentation.registry.collectors.update({
+        "response_cache": lambda: {
+            k: v for k, v in response_cache.stats().items()
+            if isinstance(v, (int, float)) and not isinstance(v, bool)
+        },
+        "auth_token_cache": lambda: {
+            "hits": token_cache.hits, "misses": token_cache.misses, "entries": token_cache.size()
+        },
+    })
+    app.add_middleware(instrumentation.MetricsMiddleware)
+
+# Per-request sampling profiles for administrators (X-Profile: 1)
+if config.PROFILER_ENABLED:
+    app.add_middleware(ProfileRequestMiddleware, overhead_budget=config.PROFILER_OVERHEAD_BUDGET)
+
+
+def router(name: str):
+    """Loader for routers.<name>.router"""
+    return lambda: import_module(f"routers.{name}").router
+
+
+def data_router(name: str):
+    """Loader for a database router, its async def version when DB_ASYNC is set"""
+    return router(f"{name}_async" if config.DB_ASYNC else name)
+
+
+# Include routers; everything outside /api/auth requires a bearer token
+# (/api/events also takes an events token in the query string).
+# Each router (with its schemas and models) is imported on its first request
+authenticated = [Depends(get_current_user)]
+include_lazy_router(app, "/api/auth", router("auth"), tags=["Authentication"])
+include_lazy_router(app, "/api/employees", data_router("employees"), tags=["Employees"], dependencies=authenticated)
+include_lazy_router(app, "/api/tasks", data_router("tasks"), tags=["Tasks"], dependencies=authenticated)
+include_lazy_router(app, "/api/stats", router("stats"), tags=["Statistics"], dependencies=authenticated)
+include_lazy_router(app, "/api/imports", router("imports"), tags=["Imports"], dependencies=authenticated)
+include_lazy_router(app, "/api/events", router("events"), tags=["Events"], dependencies=[Depends(get_events_user)])
+if config.PROFILER_ENABLED:
+    include_lazy_router(app, "/api/debug", router("debug"), tags=["Debug"], dependencies=[Depends(require_admin)])
+
+
+def openapi():
+    """OpenAPI schema, generated on first request with every router loaded"""
+    if app.openapi_schema is None:
+        load_lazy_routers(app)
+    return FastAPI.openapi(app)
+
+
+app.openapi = openapi
 
 
 @app.get("/")
@@ -68,6 +141,22 @@ def health_check():
     return {"status": "healthy"}
 
 
+if config.METRICS_ENABLED:
+    @app.get("/metrics", include_in_schema=False)
+    def metrics():
+        """Prometheus metrics (only served when METRICS_ENABLED is set)"""
+        return PlainTextResponse(
+            instrumentation.registry.render(),
+            media_type="text/plain; version=0.0.4"
+        )
+
+
+@app.get("/api/cache/stats", dependencies=authenticated)
+def cache_stats():
+    """Response cache hit ratio, size and invalidation counters"""
+    return response_cache.stats()
+
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run("main:app", host="0.0.0.0", port=8000, reload=True)
@@ -0,0 +1,154 @@
+"""
+Management commands
+
+Usage:
+    python manage.py migrate
+    python manage.py seed
+    python manage.py rebuild-search
+    python manage.py prune-tombstones --days 30
+    python manage.py rebuild-workloads --check
+    python manage.py import tasks tasks.csv
+    python manage.py create-user jane@prothink.com "Jane Doe" Manager
+"""
+import argparse
+
+import models  # noqa: F401 - registers tables on Base.metadata
+from database import engine, seed_database
+from migrations import LATEST_VERSION, check_schema, current_version, migrate
+
+
+def cmd_migrate(args):
+    """Apply pending schema migrations"""
+    before = current_version(engine)
+    after = migrate(engine, target=args.target)
+    if after == before:
+        print(f"Schema is up to date (version {after})")
+
+
+def cmd_seed(args):
+    """Apply pending migrations and load demo data into an empty database"""
+    migrate(engine)
+    seed_database()
+
+
+def cmd_rebuild_search(args):
+    """Rebuild full-text search indexes from the employees and tasks tables"""
+    from search import rebuild_search_index
+    rebuild_search_index(engine)
+
+
+def cmd_prune_tombstones(args):
+    """Delete incremental-sync tombstones older than the retention period"""
+    from changes import prune_tombstones
+    from database import SessionLocal
+
+    check_schema(engine)
+    with SessionLocal() as db:
+        removed = prune_tombstones(db, args.days)
+    print(f"Removed {removed} tombstones")
+
+
+def cmd_rebuild_workloads(args):
+    """Check the employee workload table against the tasks table and rebuild it"""
+    from database import SessionLocal
+    from workload import find_drift, rebuild_workloads
+
+    check_schema(engine)
+    with SessionLocal() as db:
+        drift = find_drift(db)
+        print(f"{len(drift)} employees whose workload row differs from their tasks" + (f": {drift}" if drift else ""))
+        if args.check:
+            raise SystemExit(1 if drift else 0)
+        rows = rebuild_workloads(db)
+        db.commit()
+    print(f"Rebuilt {rows} workload rows")
+
+
+def cmd_import(args):
+    """Import employees or tasks from a CSV or NDJSON file"""
+    import os
+    import time
+    from importer import create_job, run_import
+
+    fmt = args.format or os.path.splitext(args.path)[1].lstrip(".").lower()
+    if fmt not in ("csv", "ndjson"):
+        raise SystemExit("Cannot detect file format, pass --format csv or --format ndjson")
+
+    check_schema(engine)
+    job = create_job(args.resource, fmt)
+    started = time.perf_counter()
+
+    def progress(job):
+        elapsed = time.perf_counter() - started
+        print(
+            f"{job.rows_processed} rows processed, {job.rows_imported} imported, "
+            f"{job.rows_failed} failed ({job.rows_processed / elapsed:.0f} rows/s)"
+        )
+
+    with open(args.path, encoding="utf-8-sig", newline="") as lines:
+        run_import(job, lines, on_batch=progress)
+
+    for error in job.errors:
+        print(f"row {error['row']}: {error['error']}")
+    if job.status == "failed":
+        raise SystemExit(f"Import failed: {job.detail}")
+
+
+def cmd_create_user(args):
+    """Create a login account (prompts for the password)"""
+    import getpass
+    from database import SessionLocal
+    from models.user import User
+    from passwords import hash_password
+
+    password = args.password or getpass.getpass("Password: ")
+    if len(password) < 8:
+        raise SystemExit("Password must be at least 8 characters")
+
+    check_schema(engine)
+    with SessionLocal() as db:
+        if db.query(User).filter(User.email == args.email).first():
+            raise SystemExit(f"User {args.email} already exists")
+        db.add(User(email=args.email, name=args.name, role=args.role, password_hash=hash_password(password)))
+        db.commit()
+    print(f"Created user {args.email}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="ProU backend management commands")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    migrate_parser = subparsers.add_parser("migrate", help=cmd_migrate.__doc__)
+    migrate_parser.add_argument("--target", type=int, default=LATEST_VERSION, help="version to migrate to")
+    migrate_parser.set_defaults(func=cmd_migrate)
+
+    subparsers.add_parser("seed", help=cmd_seed.__doc__).set_defaults(func=cmd_seed)
+    subparsers.add_parser("rebuild-search", help=cmd_rebuild_search.__doc__).set_defaults(func=cmd_rebuild_search)
+
+    prune_parser = subparsers.add_parser("prune-tombstones", help=cmd_prune_tombstones.__doc__)
+    prune_parser.add_argument("--days", type=int, help="defaults to CHANGES_RETENTION_DAYS")
+    prune_parser.set_defaults(func=cmd_prune_tombstones)
+
+    workload_parser = subparsers.add_parser("rebuild-workloads", help=cmd_rebuild_workloads.__doc__)
+    workload_parser.add_argument("--check", action="store_true", help="only report drift; exit 1 if any")
+    workload_parser.set_defaults(func=cmd_rebuild_workloads)
+
+    import_parser = subparsers.add_parser("import", help=cmd_import.__doc__)
+    import_parser.add_argument("resource", choices=["employees", "tasks"])
+    import_parser.add_argument("path", help="CSV (with header row) or NDJSON file")
+    import_parser.add_argument("--format", choices=["csv", "ndjson"], help="defaults to the file extension")
+    import_parser.set_defaults(func=cmd_import)
+
+    user_parser = subparsers.add_parser("create-user", help=cmd_create_user.__doc__)
+    user_parser.add_argument("email")
+    user_parser.add_argument("name")
+    user_parser.add_argument("role")
+    user_parser.add_argument("--password", help="prompted for when omitted")
+    user_parser.set_defaults(func=cmd_create_user)
+
+    args = parser.parse_args()
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
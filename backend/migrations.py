@@ -0,0 +1,145 @@
+"""
+Versioned schema migrations
+Applied versions are recorded in the schema_migrations table. Migrations run
+from "python manage.py migrate"; application startup only checks that the
+database is at the latest version.
+
+Migrations must be idempotent: version 1 creates tables from the current
+models, so a fresh database already has what later versions add, and
+databases created before versioning start at version 0.
+"""
+from datetime import datetime
+from typing import Callable, List, NamedTuple
+
+from sqlalchemy import Column, DateTime, Integer, MetaData, String, Table, func, inspect, select
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.exc import DBAPIError
+
+import config
+from database import Base
+
+migration_metadata = MetaData()
+schema_migrations = Table(
+    "schema_migrations",
+    migration_metadata,
+    Column("version", Integer, primary_key=True),
+    Column("description", String, nullable=False),
+    Column("applied_at", DateTime, nullable=False),
+)
+
+
+class Migration(NamedTuple):
+    version: int
+    description: str
+    apply: Callable[[Connection], None]
+
+
+class SchemaOutOfDate(RuntimeError):
+    """Raised at startup when migrations are pending"""
+
+
+def create_tables(conn: Connection) -> None:
+    """Create missing tables (and their indexes) from the models"""
+    import models  # noqa: F401 - registers tables on Base.metadata
+    Base.metadata.create_all(bind=conn)
+
+
+# Indexes covered by, or replaced with, a composite index
+SUPERSEDED_INDEXES = {
+    "tasks": ["ix_tasks_status", "ix_tasks_priority", "ix_tasks_employee_id"],
+    "employees": ["ix_employees_department"],
+    "tombstones": ["ix_tombstones_resource_id"],
+}
+
+
+def ensure_indexes(conn: Connection) -> None:
+    """Create model indexes missing from existing tables and drop superseded ones"""
+    import models  # noqa: F401 - registers tables on Base.metadata
+
+    inspector = inspect(conn)
+    for table in Base.metadata.sorted_tables:
+        if not inspector.has_table(table.name):
+            continue
+        existing = {index["name"] for index in inspector.get_indexes(table.name)}
+        for index in table.indexes:
+            if index.name not in existing:
+                index.create(conn)
+        for name in SUPERSEDED_INDEXES.get(table.name, []):
+            if name in existing:
+                conn.exec_driver_sql(f"DROP INDEX {name}")
+
+
+def install_search(conn: Connection) -> None:
+    from search import install_search_index
+    install_search_index(conn)
+
+
+def add_change_tracking(conn: Connection) -> None:
+    """Tombstones table and (updated_at, id) indexes for incremental sync"""
+    create_tables(conn)
+    ensure_indexes(conn)
+
+
+def add_workloads(conn: Connection) -> None:
+    """Employee workload summary table, built from the existing tasks"""
+    from workload import rebuild_workloads
+    create_tables(conn)
+    rebuild_workloads(conn)
+
+
+MIGRATIONS: List[Migration] = [
+    Migration(1, "employees, tasks and users tables", create_tables),
+    Migration(2, "composite indexes for list filters", ensure_indexes),
+    Migration(3, "full-text search tables and sync triggers", install_search),
+    Migration(4, "tombstones table and updated_at indexes for incremental sync", add_change_tracking),
+    Migration(5, "employee workload summary table", add_workloads),
+    Migration(6, "partial due_date index on open tasks", ensure_indexes),
+    Migration(7, "tombstone (deleted_at, id) index for incremental sync", ensure_indexes),
+    Migration(8, "import_jobs table", create_tables),
+]
+LATEST_VERSION = MIGRATIONS[-1].version
+
+
+def current_version(bind) -> int:
+    """Latest applied version; 0 for an empty or unversioned database"""
+    try:
+        with bind.connect() as conn:
+            return conn.execute(select(func.max(schema_migrations.c.version))).scalar() or 0
+    except DBAPIError:
+        # schema_migrations does not exist yet
+        return 0
+
+
+def migrate(bind: Engine, target: int = LATEST_VERSION, log: Callable[[str], None] = print) -> int:
+    """Apply pending migrations up to target, each in its own transaction; returns the new version"""
+    migration_metadata.create_all(bind=bind)
+    version = current_version(bind)
+    for migration in MIGRATIONS:
+        if version < migration.version <= target:
+            with bind.begin() as conn:
+                migration.apply(conn)
+                conn.execute(schema_migrations.insert().values(
+                    version=migration.version,
+                    description=migration.description,
+                    applied_at=datetime.utcnow()
+                ))
+            version = migration.version
+            log(f"Applied migration {migration.version}: {migration.description}")
+    return version
+
+
+def check_schema(bind: Engine) -> int:
+    """
+    Startup check: one query against schema_migrations
+    Applies pending migrations when DB_AUTO_MIGRATE is set, otherwise raises
+    SchemaOutOfDate
+    """
+    version = current_version(bind)
+    if version >= LATEST_VERSION:
+        return version
+    if config.DB_AUTO_MIGRATE:
+        return migrate(bind)
+    raise SchemaOutOfDate(
+        f"Database schema is at version {version}, this code needs {LATEST_VERSION}; "
+        f"run 'python manage.py migrate'"
+    )
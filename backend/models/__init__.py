@@ -2,6 +2,10 @@
 SQLAlchemy models package
 """
 from models.employee import Employee
+from models.import_job import ImportJob
 from models.task import Task
+from models.tombstone import Tombstone
+from models.user import User
+from models.workload import EmployeeWorkload
 
-__all__ = ["Employee", "Task"]
+__all__ = ["Employee", "EmployeeWorkload", "ImportJob", "Task", "Tombstone", "User"]
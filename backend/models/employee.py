@@ -1,7 +1,7 @@
 """
 Employee SQLAlchemy model
 """
-from sqlalchemy import Column, Integer, String, DateTime, Enum
+from sqlalchemy import Column, Integer, String, DateTime, Enum, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 import enum
@@ -20,12 +20,19 @@ class Employee(Base):
     Employee model representing an employee in the organization
     """
     __tablename__ = "employees"
+    __table_args__ = (
+        Index("ix_employees_department_status", "department", "status"),
+        Index("ix_employees_status_role", "status", "role"),
+        Index("ix_employees_role_department", "role", "department"),
+        # Incremental sync reads changes in (updated_at, id) order
+        Index("ix_employees_updated_at_id", "updated_at", "id"),
+    )
     
     id = Column(Integer, primary_key=True, index=True, autoincrement=True)
     name = Column(String, nullable=False, index=True)
     email = Column(String, unique=True, nullable=False, index=True)
     role = Column(String, nullable=False)
-    department = Column(String, nullable=False, index=True)
+    department = Column(String, nullable=False)
     status = Column(Enum(EmployeeStatus), default=EmployeeStatus.ACTIVE, nullable=False)
     date_joined = Column(DateTime, default=datetime.utcnow, nullable=False)
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
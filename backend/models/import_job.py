@@ -0,0 +1,33 @@
+"""
+Import job SQLAlchemy model
+"""
+from sqlalchemy import Column, Integer, String, DateTime, JSON
+from datetime import datetime
+
+from database import Base
+
+
+class ImportJob(Base):
+    """
+    Progress and row errors of one CSV/NDJSON import, stored so any worker
+    can answer a poll and the record outlives a restart
+    """
+    __tablename__ = "import_jobs"
+
+    id = Column(String, primary_key=True)
+    resource = Column(String, nullable=False)  # "employees" or "tasks"
+    format = Column(String, nullable=False)  # "csv" or "ndjson"
+    status = Column(String, nullable=False, default="pending")  # pending, running, completed, failed
+    rows_processed = Column(Integer, nullable=False, default=0)
+    rows_imported = Column(Integer, nullable=False, default=0)
+    rows_failed = Column(Integer, nullable=False, default=0)
+    errors = Column(JSON, nullable=False, default=list)  # first MAX_REPORTED_ERRORS row errors
+    detail = Column(String, nullable=True)
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False, index=True)
+    started_at = Column(DateTime, nullable=True)
+    finished_at = Column(DateTime, nullable=True)
+    # Bumped while the job waits or runs, so jobs of a stopped worker can be told apart
+    heartbeat_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+
+    def __repr__(self):
+        return f"<ImportJob(id='{self.id}', resource='{self.resource}', status='{self.status}')>"
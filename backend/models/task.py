@@ -1,7 +1,7 @@
 """
 Task SQLAlchemy model
 """
-from sqlalchemy import Column, Integer, String, Text, Date, DateTime, Enum, ForeignKey
+from sqlalchemy import Column, Integer, String, Text, Date, DateTime, Enum, ForeignKey, Index, text
 from sqlalchemy.orm import relationship
 from datetime import datetime
 import enum
@@ -28,14 +28,30 @@ class Task(Base):
     Task model representing a task that can be assigned to an employee
     """
     __tablename__ = "tasks"
+    # Composite indexes for the list filters; the leading column also serves
+    # lookups on it alone (e.g. employee_id for the foreign key)
+    __table_args__ = (
+        Index("ix_tasks_status_employee_id", "status", "employee_id"),
+        Index("ix_tasks_status_due_date", "status", "due_date"),
+        Index("ix_tasks_employee_id_due_date", "employee_id", "due_date"),
+        Index("ix_tasks_priority_status", "priority", "status"),
+        # Incremental sync reads changes in (updated_at, id) order
+        Index("ix_tasks_updated_at_id", "updated_at", "id"),
+        # Overdue / due-soon lookups only ever want open tasks
+        Index(
+            "ix_tasks_open_due_date", "due_date",
+            sqlite_where=text("status != 'DONE'"),
+            postgresql_where=text("status != 'DONE'")
+        ),
+    )
     
     id = Column(Integer, primary_key=True, index=True, autoincrement=True)
     title = Column(String, nullable=False, index=True)
     description = Column(Text, nullable=True)
-    status = Column(Enum(TaskStatus), default=TaskStatus.TODO, nullable=False, index=True)
-    priority = Column(Enum(TaskPriority), default=TaskPriority.MEDIUM, nullable=False, index=True)
+    status = Column(Enum(TaskStatus), default=TaskStatus.TODO, nullable=False)
+    priority = Column(Enum(TaskPriority), default=TaskPriority.MEDIUM, nullable=False)
     due_date = Column(Date, nullable=True, index=True)
-    employee_id = Column(Integer, ForeignKey("employees.id"), nullable=True, index=True)
+    employee_id = Column(Integer, ForeignKey("employees.id"), nullable=True)
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
     
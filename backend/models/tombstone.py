@@ -0,0 +1,27 @@
+"""
+Tombstone SQLAlchemy model
+"""
+from sqlalchemy import Column, Integer, String, DateTime, Index
+from datetime import datetime
+
+from database import Base
+
+
+class Tombstone(Base):
+    """
+    Record of a deleted task or employee, written in the same transaction as
+    the delete so incremental sync can report it
+    """
+    __tablename__ = "tombstones"
+    __table_args__ = (
+        # Incremental sync reads deletions in (deleted_at, id) order
+        Index("ix_tombstones_resource_deleted_at_id", "resource", "deleted_at", "id"),
+    )
+    
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    resource = Column(String, nullable=False)  # "tasks" or "employees"
+    resource_id = Column(Integer, nullable=False)
+    deleted_at = Column(DateTime, default=datetime.utcnow, nullable=False, index=True)
+    
+    def __repr__(self):
+        return f"<Tombstone(resource='{self.resource}', resource_id={self.resource_id})>"
@@ -0,0 +1,29 @@
+"""
+Employee workload SQLAlchemy model
+"""
+from sqlalchemy import Column, Integer, Date, ForeignKey
+
+from database import Base
+
+
+class EmployeeWorkload(Base):
+    """
+    Open-task summary of one employee, kept in step with the tasks table by
+    the task write paths (see workload.refresh_workloads)
+    Employees without open tasks have no row
+    """
+    __tablename__ = "employee_workloads"
+    
+    employee_id = Column(Integer, ForeignKey("employees.id"), primary_key=True)
+    open_tasks = Column(Integer, nullable=False, default=0)
+    todo = Column(Integer, nullable=False, default=0)
+    in_progress = Column(Integer, nullable=False, default=0)
+    low = Column(Integer, nullable=False, default=0)
+    medium = Column(Integer, nullable=False, default=0)
+    high = Column(Integer, nullable=False, default=0)
+    overdue = Column(Integer, nullable=False, default=0)  # as of refreshed_on
+    next_due_date = Column(Date, nullable=True)  # earliest due date of an open task
+    refreshed_on = Column(Date, nullable=False)
+    
+    def __repr__(self):
+        return f"<EmployeeWorkload(employee_id={self.employee_id}, open_tasks={self.open_tasks})>"
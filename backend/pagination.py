@@ -0,0 +1,98 @@
+"""
+Keyset (cursor) pagination helpers
+"""
+import base64
+import json
+from datetime import date, datetime
+from typing import Any, Callable, List, Optional, Sequence
+
+from fastapi import HTTPException
+from sqlalchemy import and_, or_
+
+
+def encode_cursor(order_by: str, values: List[Any]) -> str:
+    """Encode the sort key of the last row on a page as an opaque cursor"""
+    payload = json.dumps({"o": order_by, "k": values}, separators=(",", ":"), default=str)
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def key_int(value: Any) -> int:
+    """Cursor key part that must be an integer (e.g. a row id)"""
+    if type(value) is not int:
+        raise ValueError("expected an integer")
+    return value
+
+
+def key_date(value: Any) -> date:
+    """Cursor key part holding an ISO date"""
+    if not isinstance(value, str):
+        raise ValueError("expected an ISO date")
+    return date.fromisoformat(value)
+
+
+def key_datetime(value: Any) -> datetime:
+    """Cursor key part holding an ISO timestamp"""
+    if not isinstance(value, str):
+        raise ValueError("expected an ISO timestamp")
+    return datetime.fromisoformat(value)
+
+
+def nullable(parse: Callable[[Any], Any]) -> Callable[[Any], Any]:
+    """Allow null for a cursor key part"""
+    return lambda value: None if value is None else parse(value)
+
+
+def decode_cursor(
+    cursor: str,
+    order_by: str,
+    key_types: Sequence[Callable[[Any], Any]]
+) -> Optional[List[Any]]:
+    """
+    Decode a cursor produced by encode_cursor
+    key_types parses each key part (key_int, key_date, ...); a key of the
+    wrong length or type is rejected like an undecodable cursor
+    Returns None for an empty cursor (first page)
+    """
+    if not cursor:
+        return None
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        if payload["o"] != order_by:
+            raise ValueError("cursor was issued for a different sort order")
+        values = list(payload["k"])
+        if len(values) != len(key_types):
+            raise ValueError("cursor key has the wrong length")
+        return [parse(value) for parse, value in zip(key_types, values)]
+    except (ValueError, KeyError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+def after_key(id_column, last_id: int, sort_column=None, last_value: Any = None):
+    """
+    Filter for rows strictly after (last_value, last_id) when ordering by
+    (sort_column NULLS FIRST, id_column)
+    """
+    if sort_column is None:
+        return id_column > last_id
+    if last_value is None:
+        return or_(
+            and_(sort_column.is_(None), id_column > last_id),
+            sort_column.isnot(None)
+        )
+    return or_(
+        sort_column > last_value,
+        and_(sort_column == last_value, id_column > last_id)
+    )
+
+
+def page_body(items: list, next_cursor: Optional[str] = None, total: Optional[int] = None, has_more: bool = False) -> dict:
+    """
+    Page envelope for a list response
+    total and has_more are only included when the client asked for the total
+    """
+    body = {"items": items, "next_cursor": next_cursor}
+    if total is not None:
+        body["total"] = total
+        body["has_more"] = has_more
+    return body
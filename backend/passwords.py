@@ -0,0 +1,123 @@
+"""
+Password hashing with scrypt
+Hashes are computed in a small dedicated thread pool (hashlib.scrypt
+releases the GIL), so a burst of logins cannot occupy the request workers
+"""
+import asyncio
+import base64
+import contextvars
+import hashlib
+import hmac
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, NamedTuple, Optional, TypeVar
+
+from fastapi import HTTPException
+
+import config
+
+T = TypeVar("T")
+
+SALT_BYTES = 16
+KEY_BYTES = 32
+
+
+class ScryptParams(NamedTuple):
+    n: int
+    r: int
+    p: int
+
+    @property
+    def maxmem(self) -> int:
+        # scrypt needs 128 * r * (n + p + 2) bytes; leave some headroom
+        return 128 * self.r * (self.n + self.p + 2) + 2 ** 20
+
+
+def current_params() -> ScryptParams:
+    return ScryptParams(config.PASSWORD_SCRYPT_N, config.PASSWORD_SCRYPT_R, config.PASSWORD_SCRYPT_P)
+
+
+def _b64(data: bytes) -> str:
+    return base64.b64encode(data).decode().rstrip("=")
+
+
+def _unb64(data: str) -> bytes:
+    return base64.b64decode(data + "=" * (-len(data) % 4))
+
+
+def hash_password(password: str, params: Optional[ScryptParams] = None) -> str:
+    """Return 'scrypt$n$r$p$salt$key' for password (CPU-bound, ~50 ms by default)"""
+    params = params or current_params()
+    salt = os.urandom(SALT_BYTES)
+    key = hashlib.scrypt(
+        password.encode(), salt=salt, n=params.n, r=params.r, p=params.p,
+        maxmem=params.maxmem, dklen=KEY_BYTES
+    )
+    return f"scrypt${params.n}${params.r}${params.p}${_b64(salt)}${_b64(key)}"
+
+
+def _parse(encoded: str):
+    scheme, n, r, p, salt, key = encoded.split("$")
+    if scheme != "scrypt":
+        raise ValueError(f"Unsupported password hash scheme: {scheme}")
+    return ScryptParams(int(n), int(r), int(p)), _unb64(salt), _unb64(key)
+
+
+def verify_password(password: str, encoded: str) -> bool:
+    """Check password against a stored hash in constant time"""
+    try:
+        params, salt, expected = _parse(encoded)
+    except ValueError:
+        return False
+    key = hashlib.scrypt(
+        password.encode(), salt=salt, n=params.n, r=params.r, p=params.p,
+        maxmem=params.maxmem, dklen=len(expected)
+    )
+    return hmac.compare_digest(key, expected)
+
+
+def needs_rehash(encoded: str) -> bool:
+    """True when a hash was made with other parameters than the configured ones"""
+    try:
+        params, _, _ = _parse(encoded)
+    except ValueError:
+        return True
+    return params != current_params()
+
+
+# Verified against when the user does not exist, so unknown emails take as long
+_dummy_hash = None
+
+
+def dummy_verify(password: str) -> None:
+    global _dummy_hash
+    if _dummy_hash is None:
+        _dummy_hash = hash_password("not-a-real-password")
+    verify_password(password, _dummy_hash)
+
+
+_executor = ThreadPoolExecutor(
+    max_workers=config.PASSWORD_HASH_WORKERS,
+    thread_name_prefix="kdf"
+)
+_pending = threading.BoundedSemaphore(config.PASSWORD_HASH_MAX_PENDING)
+
+
+async def run_in_kdf_pool(fn: Callable[..., T], *args) -> T:
+    """
+    Run fn in the hashing pool
+    Raises 503 when PASSWORD_HASH_MAX_PENDING calls are already queued or running
+    """
+    if not _pending.acquire(blocking=False):
+        raise HTTPException(
+            status_code=503,
+            detail="Too many login attempts in progress, retry shortly",
+            headers={"Retry-After": "1"}
+        )
+    try:
+        # Carry request context (e.g. metrics) into the worker thread
+        context = contextvars.copy_context()
+        return await asyncio.get_running_loop().run_in_executor(_executor, context.run, fn, *args)
+    finally:
+        _pending.release()
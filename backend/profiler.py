@@ -0,0 +1,207 @@
+"""
+Statistical sampling profiler for the running process
+A background thread snapshots every thread's stack with sys._current_frames()
+and counts identical stacks; the result is in collapsed-stack format
+("frame;frame;frame count"), readable by flamegraph.pl and speedscope
+"""
+import sys
+import threading
+import time
+import uuid
+from collections import Counter, OrderedDict
+from typing import Dict, Optional
+
+from fastapi import HTTPException
+from fastapi.security import HTTPAuthorizationCredentials
+from fastapi.security.utils import get_authorization_scheme_param
+
+from security import get_current_user, is_admin
+
+# Leaf frames of threads that are waiting rather than running
+IDLE_FRAMES = {
+    ("threading", "wait"),
+    ("threading", "_wait_for_tstate_lock"),
+    ("selectors", "select"),
+    ("queue", "get"),
+    ("concurrent.futures.thread", "_worker"),
+    ("asyncio.base_events", "_run_once"),
+}
+MAX_STACK_DEPTH = 128
+MIN_INTERVAL = 0.001
+# Per-request profiles kept for retrieval
+MAX_STORED_PROFILES = 20
+
+
+class ProfilerBusy(Exception):
+    """Raised when a profile is requested while another one is running"""
+
+
+class SamplingProfiler:
+    """
+    Samples all threads every interval seconds
+    The interval is stretched whenever sampling would take more than
+    overhead_budget of one core, so the cost stays bounded on deep stacks
+    or many threads
+    """
+
+    def __init__(self, interval: float = 0.005, overhead_budget: float = 0.05, include_idle: bool = False):
+        self.interval = max(interval, MIN_INTERVAL)
+        self.overhead_budget = overhead_budget
+        self.include_idle = include_idle
+        self.stacks: Counter = Counter()
+        self.samples = 0
+        self.sampling_seconds = 0.0
+        self.started_at = 0.0
+        self.stopped_at = 0.0
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def _frame_name(self, frame) -> str:
+        return f"{frame.f_globals.get('__name__', '?')}:{frame.f_code.co_name}"
+
+    def _sample(self) -> None:
+        names = {t.ident: t.name for t in threading.enumerate()}
+        own = threading.get_ident()
+        for thread_id, frame in sys._current_frames().items():
+            if thread_id == own:
+                continue
+            if not self.include_idle:
+                leaf = (frame.f_globals.get("__name__"), frame.f_code.co_name)
+                if leaf in IDLE_FRAMES:
+                    continue
+            stack = []
+            while frame is not None and len(stack) < MAX_STACK_DEPTH:
+                stack.append(self._frame_name(frame))
+                frame = frame.f_back
+            stack.append(names.get(thread_id, f"thread-{thread_id}"))
+            self.stacks[";".join(reversed(stack))] += 1
+        self.samples += 1
+
+    def _run(self) -> None:
+        interval = self.interval
+        while not self._stop.wait(interval):
+            start = time.perf_counter()
+            self._sample()
+            cost = time.perf_counter() - start
+            self.sampling_seconds += cost
+            interval = max(self.interval, cost / self.overhead_budget)
+
+    def start(self) -> "SamplingProfiler":
+        self.started_at = time.perf_counter()
+        self._thread = threading.Thread(target=self._run, name="sampling-profiler", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> "SamplingProfiler":
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        self.stopped_at = time.perf_counter()
+        return self
+
+    @property
+    def overhead(self) -> float:
+        """Share of wall time spent sampling (with the GIL held)"""
+        elapsed = (self.stopped_at or time.perf_counter()) - self.started_at
+        return self.sampling_seconds / elapsed if elapsed > 0 else 0.0
+
+    def collapsed(self) -> str:
+        """Collapsed stacks, heaviest first, with a comment header"""
+        elapsed = (self.stopped_at or time.perf_counter()) - self.started_at
+        lines = [
+            f"# samples={self.samples} duration={elapsed:.3f}s "
+            f"interval={self.interval * 1000:.1f}ms overhead={self.overhead:.2%}"
+        ]
+        lines += [f"{stack} {count}" for stack, count in self.stacks.most_common()]
+        return "\n".join(lines) + "\n"
+
+
+# Only one profiler runs at a time, whether on demand or per request
+_active = threading.Lock()
+_profiles: "OrderedDict[str, str]" = OrderedDict()
+_profiles_lock = threading.Lock()
+
+
+def begin(interval: float, overhead_budget: float) -> SamplingProfiler:
+    """Start the process-wide profiler; raises ProfilerBusy if one is running"""
+    if not _active.acquire(blocking=False):
+        raise ProfilerBusy()
+    try:
+        return SamplingProfiler(interval, overhead_budget).start()
+    except Exception:
+        _active.release()
+        raise
+
+
+def end(profiler: SamplingProfiler) -> str:
+    """Stop a profiler started with begin() and return its collapsed stacks"""
+    try:
+        profiler.stop()
+    finally:
+        _active.release()
+    return profiler.collapsed()
+
+
+def store_profile(profile_id: str, text: str) -> None:
+    with _profiles_lock:
+        _profiles[profile_id] = text
+        while len(_profiles) > MAX_STORED_PROFILES:
+            _profiles.popitem(last=False)
+
+
+def get_profile(profile_id: str) -> Optional[str]:
+    with _profiles_lock:
+        return _profiles.get(profile_id)
+
+
+class ProfileRequestMiddleware:
+    """
+    Profiles a single request when an administrator sends X-Profile: 1
+    Samples every thread while the request runs; the profile ID is returned
+    in the X-Profile-Id header and fetched from /api/debug/profiles/{id}
+    """
+
+    def __init__(self, app, interval: float = 0.001, overhead_budget: float = 0.05):
+        self.app = app
+        self.interval = interval
+        self.overhead_budget = overhead_budget
+
+    def _authorized(self, headers: Dict[bytes, bytes]) -> bool:
+        """Same check as the debug router: an administrator's session token"""
+        scheme, token = get_authorization_scheme_param(headers.get(b"authorization", b"").decode())
+        if scheme.lower() != "bearer" or not token:
+            return False
+        try:
+            return is_admin(get_current_user(HTTPAuthorizationCredentials(scheme=scheme, credentials=token)))
+        except HTTPException:
+            return False
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        headers = dict(scope["headers"])
+        if headers.get(b"x-profile") != b"1" or not self._authorized(headers):
+            await self.app(scope, receive, send)
+            return
+
+        try:
+            profiler = begin(self.interval, self.overhead_budget)
+        except ProfilerBusy:
+            await self.app(scope, receive, send)
+            return
+
+        profile_id = uuid.uuid4().hex
+
+        async def send_with_profile_id(message):
+            if message["type"] == "http.response.start":
+                message = {
+                    **message,
+                    "headers": list(message.get("headers", [])) + [(b"x-profile-id", profile_id.encode())]
+                }
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_profile_id)
+        finally:
+            store_profile(profile_id, end(profiler))
@@ -1,98 +1,92 @@
 """
 Authentication router
-Simple JWT-based authentication for demo purposes
+JWT-based authentication against the users table
 """
 from fastapi import APIRouter, HTTPException, Depends
-from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from datetime import datetime, timedelta
-import jwt
+from sqlalchemy import select, update
+from typing import Optional
+from datetime import datetime
 
-from schemas.auth import LoginRequest, Token
+import config
+from database import SessionLocal
+from models.user import User
+from passwords import dummy_verify, hash_password, needs_rehash, run_in_kdf_pool, verify_password
+from schemas.auth import EventsToken, LoginRequest, Token
+from security import create_access_token, create_events_token, get_current_user, revoke_token
 
 router = APIRouter()
-security = HTTPBearer()
-
-# Demo credentials (in production, use proper password hashing)
-DEMO_USERS = {
-    "admin@prothink.com": {
-        "password": "password123",
-        "name": "Admin User",
-        "role": "Administrator"
-    },
-    "manager@prothink.com": {
-        "password": "manager123",
-        "name": "Manager User",
-        "role": "Manager"
-    }
-}
-
-# JWT settings (in production, use environment variables)
-SECRET_KEY = "prothink-secret-key-change-in-production"
-ALGORITHM = "HS256"
-ACCESS_TOKEN_EXPIRE_MINUTES = 1440  # 24 hours
-
-
-def create_access_token(data: dict) -> str:
-    """Create JWT access token"""
-    to_encode = data.copy()
-    expire = datetime.utcnow() + timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
-    to_encode.update({"exp": expire})
-    encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
-    return encoded_jwt
 
 
-def verify_token(credentials: HTTPAuthorizationCredentials = Depends(security)) -> dict:
-    """Verify JWT token and return payload"""
-    try:
-        token = credentials.credentials
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        return payload
-    except jwt.ExpiredSignatureError:
-        raise HTTPException(status_code=401, detail="Token has expired")
-    except jwt.JWTError:
-        raise HTTPException(status_code=401, detail="Invalid token")
+def check_credentials(email: str, password: str) -> Optional[dict]:
+    """
+    Look up an active user and verify their password (runs in the hashing pool)
+    Upgrades the stored hash when the hashing parameters have changed
+    """
+    with SessionLocal() as db:
+        user = db.execute(
+            select(User.id, User.email, User.name, User.role, User.password_hash)
+            .where(User.email == email, User.is_active.is_(True))
+        ).first()
+    
+    if user is None:
+        dummy_verify(password)
+        return None
+    if not verify_password(password, user.password_hash):
+        return None
+    
+    values = {"last_login_at": datetime.utcnow()}
+    if needs_rehash(user.password_hash):
+        values["password_hash"] = hash_password(password)
+    with SessionLocal() as db:
+        db.execute(update(User).where(User.id == user.id).values(**values))
+        db.commit()
+    
+    return {"email": user.email, "name": user.name, "role": user.role}
 
 
 @router.post("/login", response_model=Token)
-def login(credentials: LoginRequest):
+async def login(credentials: LoginRequest):
     """
     Login endpoint
+    Password hashing runs in a dedicated pool, not on the request workers
     Demo credentials:
     - admin@prothink.com / password123
     - manager@prothink.com / manager123
     """
-    user = DEMO_USERS.get(credentials.email)
+    user = await run_in_kdf_pool(check_credentials, credentials.email, credentials.password)
     
-    if not user or user["password"] != credentials.password:
+    if not user:
         raise HTTPException(
             status_code=401,
             detail="Incorrect email or password"
         )
     
-    # Create token payload
-    token_data = {
-        "email": credentials.email,
-        "name": user["name"],
-        "role": user["role"]
-    }
-    
     # Generate token
-    access_token = create_access_token(token_data)
+    access_token = create_access_token(user)
     
-    return Token(
-        access_token=access_token,
-        user={
-            "email": credentials.email,
-            "name": user["name"],
-            "role": user["role"]
-        }
-    )
+    return Token(access_token=access_token, user=user)
 
 
 @router.get("/verify")
-def verify(payload: dict = Depends(verify_token)):
+def verify(payload: dict = Depends(get_current_user)):
     """Verify token endpoint"""
     return {
         "valid": True,
         "user": payload
     }
+
+
+@router.post("/events-token", response_model=EventsToken)
+def events_token(payload: dict = Depends(get_current_user)):
+    """
+    Issue a short-lived token for /api/events?access_token=...
+    Browsers' EventSource can't send an Authorization header
+    """
+    return EventsToken(access_token=create_events_token(payload), expires_in=config.EVENTS_TOKEN_EXPIRE_SECONDS)
+
+
+@router.post("/logout", status_code=204)
+def logout(payload: dict = Depends(get_current_user)):
+    """Revoke the current token"""
+    revoke_token(payload)
+    return None
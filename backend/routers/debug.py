@@ -0,0 +1,54 @@
+"""
+Debug router - on-demand sampling profiles of the running worker (admins only)
+"""
+import asyncio
+from datetime import datetime
+
+import config
+from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import PlainTextResponse
+
+from profiler import ProfilerBusy, begin, end, get_profile
+
+router = APIRouter()
+
+PROFILE_RESPONSES = {200: {"content": {"text/plain": {}}, "description": "Collapsed stacks"}}
+
+
+def _collapsed_response(text: str, name: str) -> PlainTextResponse:
+    return PlainTextResponse(
+        text,
+        headers={"Content-Disposition": f'attachment; filename="{name}.collapsed"'}
+    )
+
+
+@router.get("/profile", response_class=PlainTextResponse, responses=PROFILE_RESPONSES)
+async def profile_process(
+    seconds: float = Query(10, gt=0, le=config.PROFILER_MAX_SECONDS, description="How long to sample"),
+    interval_ms: float = Query(5, ge=1, le=1000, description="Sampling interval")
+):
+    """
+    Sample every thread of this worker for a number of seconds
+    Returns collapsed stacks for flamegraph.pl or speedscope; sampling is
+    slowed down automatically to stay within PROFILER_OVERHEAD_BUDGET
+    """
+    try:
+        profiler = begin(interval_ms / 1000, config.PROFILER_OVERHEAD_BUDGET)
+    except ProfilerBusy:
+        raise HTTPException(status_code=409, detail="A profile is already running")
+    try:
+        await asyncio.sleep(seconds)
+    finally:
+        text = end(profiler)
+    return _collapsed_response(text, f"profile-{datetime.utcnow():%Y%m%d-%H%M%S}")
+
+
+@router.get("/profiles/{profile_id}", response_class=PlainTextResponse, responses=PROFILE_RESPONSES)
+def get_request_profile(profile_id: str):
+    """
+    Get the profile of a request sent with the X-Profile: 1 header
+    """
+    text = get_profile(profile_id)
+    if text is None:
+        raise HTTPException(status_code=404, detail="Profile not found")
+    return _collapsed_response(text, f"request-{profile_id}")
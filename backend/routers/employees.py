@@ -1,39 +1,95 @@
 """
 Employee router - CRUD endpoints for employees
 """
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi.responses import StreamingResponse
+from sqlalchemy import delete, func, insert, select, update
 from sqlalchemy.orm import Session
-from typing import List, Optional
-from datetime import datetime
+from typing import List, Literal, Optional, Union
+from datetime import date, datetime
 
-from database import get_db
+from bulk import BulkReport, chunked, existing_pairs
+from cache import cache_key, response_cache
+from changes import changes_page, record_deletions
+from conditional import Validator, check_if_match, is_fresh, make_validator, not_modified, page_validator
+from database import engine, get_db
+from events import broker
+from export import EXPORT_RESPONSES, export_response
+from pagination import encode_cursor, decode_cursor, after_key, key_int, page_body
+from search import apply_search
+from serialization import RowShape, dumps, json_response
+from workload import drop_workloads, overdue_expression
+from instrumentation import timed_serialization
 from models.employee import Employee, EmployeeStatus
+from models.task import Task
+from models.workload import EmployeeWorkload
 from schemas.employee import (
     EmployeeCreate,
     EmployeeUpdate,
     EmployeeResponse,
-    EmployeeWithTasks
+    EmployeeWithTasks,
+    EmployeeBulkRequest
 )
+from schemas.bulk import BulkResult
+from schemas.pagination import Changes, CountedPage, Page
+from schemas.workload import WorkloadResponse
 
 router = APIRouter()
 
+# List rows are selected as columns and encoded without per-row models
+EMPLOYEE_ROWS = RowShape(EmployeeResponse, Employee)
 
-@router.get("", response_model=List[EmployeeResponse])
-def list_employees(
-    status: Optional[EmployeeStatus] = Query(None, description="Filter by status"),
-    department: Optional[str] = Query(None, description="Filter by department"),
-    role: Optional[str] = Query(None, description="Filter by role"),
-    search: Optional[str] = Query(None, description="Search by name or email"),
-    page: int = Query(1, ge=1, description="Page number"),
-    page_size: int = Query(50, ge=1, le=100, description="Items per page"),
-    db: Session = Depends(get_db)
+
+def invalidate_employees(employee_ids=()):
+    """
+    Drop cached responses containing the given employees
+    Task responses embed an employee summary, so their task entries go too
+    """
+    tags = ["employees", "stats"]
+    if employee_ids:
+        tags.append("tasks")
+    for employee_id in employee_ids:
+        tags += [
+            f"employee:{employee_id}",
+            f"tasks:employee:{employee_id}",
+            f"employee-ref:{employee_id}"
+        ]
+    response_cache.invalidate(*tags)
+
+
+def employee_validator_query(employee_id: int):
+    """
+    Values an employee's detail representation depends on: the employee's
+    updated_at and the count and latest updated_at of their tasks
+    """
+    return (
+        select(Employee.updated_at, func.count(Task.id), func.max(Task.updated_at))
+        .outerjoin(Task, Task.employee_id == Employee.id)
+        .where(Employee.id == employee_id)
+        .group_by(Employee.id)
+    )
+
+
+def employee_validator(db: Session, employee_id: int) -> Optional[Validator]:
+    """Validator of an employee's detail representation; None if the employee does not exist"""
+    row = db.execute(employee_validator_query(employee_id)).first()
+    if row is None:
+        return None
+    return make_validator("employee", employee_id, *row)
+
+
+def apply_employee_filters(
+    query,
+    status: Optional[EmployeeStatus] = None,
+    department: Optional[str] = None,
+    role: Optional[str] = None,
+    search: Optional[str] = None,
+    bind=None
 ):
     """
-    Get list of employees with optional filters and pagination
+    Apply the list filters to an ORM query or Core select
+    Returns (query, search rank column or None)
     """
-    query = db.query(Employee)
-    
-    # Apply filters
     if status:
         query = query.filter(Employee.status == status)
     
@@ -43,34 +99,267 @@ def list_employees(
     if role:
         query = query.filter(Employee.role == role)
     
+    rank = None
     if search:
-        search_pattern = f"%{search}%"
-        query = query.filter(
-            (Employee.name.ilike(search_pattern)) | 
-            (Employee.email.ilike(search_pattern))
+        query, rank = apply_search(
+            query, Employee, search,
+            [Employee.name, Employee.email, Employee.role, Employee.department],
+            bind=bind
         )
     
-    # Apply pagination
-    offset = (page - 1) * page_size
-    employees = query.offset(offset).limit(page_size).all()
+    return query, rank
+
+
+def employee_list_query(
+    bind,
+    status: Optional[EmployeeStatus],
+    department: Optional[str],
+    role: Optional[str],
+    search: Optional[str],
+    page: int,
+    page_size: int,
+    cursor: Optional[str]
+):
+    """
+    Select of one list page: page/page_size offsets with the best search
+    matches first, or the keyset page after cursor plus one extra row
+    """
+    query, rank = apply_employee_filters(
+        select(*EMPLOYEE_ROWS.columns), status, department, role, search, bind=bind
+    )
+    
+    if cursor is None:
+        # Apply offset pagination, best search matches first
+        if rank is not None:
+            query = query.order_by(rank)
+        return query.order_by(Employee.id).offset((page - 1) * page_size).limit(page_size)
+    
+    # Apply keyset pagination; the extra row decides next_cursor
+    query = query.order_by(Employee.id)
+    last_key = decode_cursor(cursor, "id", (key_int,))
+    if last_key is not None:
+        query = query.filter(after_key(Employee.id, last_key[0]))
+    return query.limit(page_size + 1)
+
+
+def employee_count_query(
+    bind,
+    status: Optional[EmployeeStatus],
+    department: Optional[str],
+    role: Optional[str],
+    search: Optional[str]
+):
+    """Select of the number of employees matching the list filters"""
+    query, _ = apply_employee_filters(
+        select(func.count(Employee.id)), status, department, role, search, bind=bind
+    )
+    return query
+
+
+def employee_list_response(
+    request: Request,
+    key: str,
+    employees: List[dict],
+    total: Optional[int],
+    page: int,
+    page_size: int,
+    cursor: Optional[str]
+) -> Response:
+    """
+    Encode and cache a list page read with employee_list_query, or answer 304
+    when If-None-Match matches the ETag of its rows
+    """
+    # A keyset page's extra row is part of the validator
+    validator = page_validator(key, employees, total)
+    if is_fresh(request, validator.headers()):
+        return not_modified(validator.headers())
+    
+    if cursor is None:
+        offset = (page - 1) * page_size
+        if total is not None:
+            payload = page_body(employees, None, total, offset + len(employees) < total)
+        else:
+            payload = employees
+    else:
+        next_cursor = None
+        if len(employees) > page_size:
+            employees = employees[:page_size]
+            next_cursor = encode_cursor("id", [employees[-1]["id"]])
+        payload = page_body(employees, next_cursor, total, next_cursor is not None)
     
-    return employees
+    with timed_serialization():
+        body = dumps(payload)
+    return response_cache.store_body(key, body, ["employees"], validator)
+
+
+@router.get("", response_model=Union[List[EmployeeResponse], Page[EmployeeResponse], CountedPage[EmployeeResponse]])
+def list_employees(
+    request: Request,
+    status: Optional[EmployeeStatus] = Query(None, description="Filter by status"),
+    department: Optional[str] = Query(None, description="Filter by department"),
+    role: Optional[str] = Query(None, description="Filter by role"),
+    search: Optional[str] = Query(None, description="Search by name, email, role or department (prefix match)"),
+    page: int = Query(1, ge=1, description="Page number"),
+    page_size: int = Query(50, ge=1, le=100, description="Items per page"),
+    cursor: Optional[str] = Query(None, description="Keyset cursor from next_cursor (empty for the first page); returns a page envelope"),
+    include_total: bool = Query(False, description="Return a page envelope with total and has_more"),
+    db: Session = Depends(get_db)
+):
+    """
+    Get list of employees with optional filters and pagination
+    Uses page/page_size offsets, or constant-cost keyset pages when cursor is given
+    include_total adds one count over the filtered set; other pages cost only their rows
+    Answers 304 when If-None-Match matches the ETag of the page's rows
+    """
+    key = cache_key(
+        "employees.list", status=status, department=department, role=role,
+        search=search, page=page, page_size=page_size, cursor=cursor, include_total=include_total or None
+    )
+    cached = response_cache.lookup(key, request)
+    if cached:
+        return cached
+    
+    bind = db.get_bind()
+    query = employee_list_query(bind, status, department, role, search, page, page_size, cursor)
+    total = None
+    if include_total:
+        total = db.execute(employee_count_query(bind, status, department, role, search)).scalar()
+    employees = EMPLOYEE_ROWS.dicts(db.execute(query))
+    return employee_list_response(request, key, employees, total, page, page_size, cursor)
+
+
+def employee_export_query(
+    status: Optional[EmployeeStatus],
+    department: Optional[str],
+    role: Optional[str],
+    search: Optional[str]
+):
+    """Select of the exported columns of employees matching the list filters"""
+    stmt = select(
+        Employee.id,
+        Employee.name,
+        Employee.email,
+        Employee.role,
+        Employee.department,
+        Employee.status,
+        Employee.date_joined,
+        Employee.created_at,
+        Employee.updated_at
+    )
+    stmt, _ = apply_employee_filters(stmt, status, department, role, search, bind=engine)
+    return stmt.order_by(Employee.id)
+
+
+@router.get("/export", response_class=StreamingResponse, responses=EXPORT_RESPONSES)
+def export_employees(
+    fmt: Literal["ndjson", "csv"] = Query("ndjson", alias="format", description="Output format"),
+    status: Optional[EmployeeStatus] = Query(None, description="Filter by status"),
+    department: Optional[str] = Query(None, description="Filter by department"),
+    role: Optional[str] = Query(None, description="Filter by role"),
+    search: Optional[str] = Query(None, description="Search by name, email, role or department (prefix match)")
+):
+    """
+    Stream all employees matching the list filters as NDJSON or CSV
+    """
+    return export_response(employee_export_query(status, department, role, search), fmt, "employees")
+
+
+@router.get("/changes", response_model=Changes[EmployeeResponse])
+def employee_changes(
+    since: Optional[str] = Query(None, description="next_since from the previous call (empty for a full sync)"),
+    limit: int = Query(500, ge=1, le=1000, description="Maximum rows and deletions returned"),
+    db: Session = Depends(get_db)
+):
+    """
+    Employees created, updated or deleted since a sync token
+    Costs O(changes); tasks removed with a deleted employee are reported by
+    /api/tasks/changes
+    """
+    return json_response(changes_page(db, "employees", EMPLOYEE_ROWS, Employee, since, limit))
+
+
+def workload_query(status: Optional[EmployeeStatus], department: Optional[str]):
+    """Select of the workload row of every employee matching the filters"""
+    counts = ["open_tasks", "todo", "in_progress", "low", "medium", "high"]
+    query = select(
+        Employee.id.label("employee_id"), Employee.name, Employee.role, Employee.department, Employee.status,
+        *(func.coalesce(getattr(EmployeeWorkload, name), 0).label(name) for name in counts),
+        func.coalesce(overdue_expression(date.today()), 0).label("overdue"),
+        EmployeeWorkload.next_due_date
+    ).outerjoin(EmployeeWorkload, EmployeeWorkload.employee_id == Employee.id)
+    query, _ = apply_employee_filters(query, status, department)
+    return query.order_by(Employee.id)
+
+
+def workload_response(rows) -> Response:
+    fields = list(WorkloadResponse.model_fields)
+    return json_response([{name: row._mapping[name] for name in fields} for row in rows])
+
+
+@router.get("/workload", response_model=List[WorkloadResponse])
+def list_workloads(
+    status: Optional[EmployeeStatus] = Query(None, description="Filter by status"),
+    department: Optional[str] = Query(None, description="Filter by department"),
+    db: Session = Depends(get_db)
+):
+    """
+    Open-task counts by status and priority, overdue count and next due date
+    of every employee, read from the maintained workload table in one query
+    Overdue counts of rows whose tasks have come due since they were computed
+    are counted in the same query; the due-date scanner rewrites those rows
+    """
+    return workload_response(db.execute(workload_query(status, department)))
+
+
+def employee_detail_query(employee_id: int):
+    """Select of an employee with their tasks loaded"""
+    return select(Employee).options(*EmployeeWithTasks.load_options).where(Employee.id == employee_id)
 
 
 @router.get("/{employee_id}", response_model=EmployeeWithTasks)
 def get_employee(
     employee_id: int,
+    request: Request,
     db: Session = Depends(get_db)
 ):
     """
     Get single employee by ID with their assigned tasks
+    Supports If-None-Match (304 Not Modified)
     """
-    employee = db.query(Employee).filter(Employee.id == employee_id).first()
+    key = cache_key("employees.get", employee_id=employee_id)
+    cached = response_cache.lookup(key, request)
+    if cached:
+        return cached
+    
+    validator = employee_validator(db, employee_id)
+    if validator is None:
+        raise HTTPException(status_code=404, detail="Employee not found")
+    if is_fresh(request, validator.headers()):
+        return not_modified(validator.headers())
+    
+    employee = db.execute(employee_detail_query(employee_id)).scalars().first()
     
     if not employee:
         raise HTTPException(status_code=404, detail="Employee not found")
     
-    return employee
+    return response_cache.store(
+        key, EmployeeWithTasks, employee, [f"employee:{employee.id}"], validator
+    )
+
+
+def email_taken(email: str) -> HTTPException:
+    return HTTPException(status_code=400, detail=f"Employee with email {email} already exists")
+
+
+def new_employee(employee_data: EmployeeCreate) -> Employee:
+    return Employee(
+        name=employee_data.name,
+        email=employee_data.email,
+        role=employee_data.role,
+        department=employee_data.department,
+        status=EmployeeStatus(employee_data.status),
+        date_joined=employee_data.date_joined or datetime.utcnow()
+    )
 
 
 @router.post("", response_model=EmployeeResponse, status_code=201)
@@ -84,42 +373,208 @@ def create_employee(
     # Check if email already exists
     existing = db.query(Employee).filter(Employee.email == employee_data.email).first()
     if existing:
-        raise HTTPException(
-            status_code=400,
-            detail=f"Employee with email {employee_data.email} already exists"
-        )
-    
-    # Create new employee
-    employee = Employee(
-        name=employee_data.name,
-        email=employee_data.email,
-        role=employee_data.role,
-        department=employee_data.department,
-        status=EmployeeStatus(employee_data.status),
-        date_joined=employee_data.date_joined or datetime.utcnow()
-    )
+        raise email_taken(employee_data.email)
     
+    employee = new_employee(employee_data)
     db.add(employee)
     db.commit()
     db.refresh(employee)
+    invalidate_employees()
+    broker.publish("employee.created", [employee.id], [employee.id], [employee.department])
     
     return employee
 
 
+def email_owners_queries(emails):
+    """Selects of the (email, employee ID) of the given emails that are taken, one per chunk"""
+    for chunk in chunked(list(set(emails))):
+        yield select(Employee.email, Employee.id).where(Employee.email.in_(chunk))
+
+
+class EmployeeBulkPlan:
+    """
+    Validated rows of a bulk employee request, by operation
+    email_owners maps the taken emails among bulk_emails() to their
+    employee, known_employees the existing employees among
+    bulk_employee_ids() to their department
+    """
+
+    def __init__(self, bulk_data: EmployeeBulkRequest, email_owners: dict, known_employees: dict):
+        self.report = report = BulkReport(bulk_data.mode)
+        self.known_employees = known_employees
+        # Emails taken by earlier items in this request
+        claimed = set()
+        
+        now = datetime.utcnow()
+        self.create_rows, self.create_indexes = [], []
+        for index, item in enumerate(bulk_data.create):
+            if item.email in email_owners or item.email in claimed:
+                report.fail("create", index, f"Employee with email {item.email} already exists")
+                continue
+            claimed.add(item.email)
+            self.create_rows.append({
+                "name": item.name,
+                "email": item.email,
+                "role": item.role,
+                "department": item.department,
+                "status": EmployeeStatus(item.status),
+                "date_joined": item.date_joined or now
+            })
+            self.create_indexes.append(index)
+        
+        self.update_rows, self.update_indexes = [], []
+        for index, item in enumerate(bulk_data.update):
+            data = item.model_dump(exclude_unset=True)
+            email = data.get("email")
+            if item.id not in known_employees:
+                report.fail("update", index, "Employee not found", item.id)
+                continue
+            if email and (email_owners.get(email, item.id) != item.id or email in claimed):
+                report.fail("update", index, f"Employee with email {email} already exists", item.id)
+                continue
+            if email:
+                claimed.add(email)
+            if "status" in data:
+                data["status"] = EmployeeStatus(data["status"])
+            data["updated_at"] = now
+            self.update_rows.append(data)
+            self.update_indexes.append(index)
+        
+        self.delete_ids, self.delete_indexes, seen_ids = [], [], set()
+        for index, employee_id in enumerate(bulk_data.delete):
+            if employee_id not in known_employees:
+                report.fail("delete", index, "Employee not found", employee_id)
+                continue
+            if employee_id in seen_ids:
+                report.fail("delete", index, "Duplicate employee ID", employee_id)
+                continue
+            seen_ids.add(employee_id)
+            self.delete_ids.append(employee_id)
+            self.delete_indexes.append(index)
+        
+        report.check()
+    
+    @staticmethod
+    def bulk_emails(bulk_data: EmployeeBulkRequest) -> list:
+        return [item.email for item in bulk_data.create] + [item.email for item in bulk_data.update if item.email]
+    
+    @staticmethod
+    def bulk_employee_ids(bulk_data: EmployeeBulkRequest) -> list:
+        return [item.id for item in bulk_data.update] + bulk_data.delete
+    
+    def applied(self, new_ids) -> None:
+        """Report every planned item as done, given the IDs of the created rows"""
+        for index, employee_id in zip(self.create_indexes, new_ids):
+            self.report.ok("create", index, employee_id)
+        for index, row in zip(self.update_indexes, self.update_rows):
+            self.report.ok("update", index, row["id"])
+        for index, employee_id in zip(self.delete_indexes, self.delete_ids):
+            self.report.ok("delete", index, employee_id)
+    
+    def announce(self, deleted_tasks) -> None:
+        """Invalidate cached responses and publish events once committed"""
+        known_employees = self.known_employees
+        # New employees appear in no cached task or detail response yet
+        invalidate_employees([row["id"] for row in self.update_rows] + self.delete_ids)
+        changed_ids = [r["id"] for r in self.report.results if r["success"]]
+        if changed_ids:
+            departments = [row["department"] for row in self.create_rows]
+            departments += [row.get("department") for row in self.update_rows]
+            departments += [known_employees[row["id"]] for row in self.update_rows]
+            departments += [known_employees[employee_id] for employee_id in self.delete_ids]
+            broker.publish("employee.bulk", changed_ids, changed_ids, departments)
+        if deleted_tasks:
+            owners = sorted({employee_id for _, employee_id in deleted_tasks})
+            broker.publish(
+                "task.deleted",
+                [task_id for task_id, _ in deleted_tasks],
+                owners,
+                [known_employees[employee_id] for employee_id in owners]
+            )
+
+
+@router.post("/bulk", response_model=BulkResult)
+def bulk_employees(
+    bulk_data: EmployeeBulkRequest,
+    db: Session = Depends(get_db)
+):
+    """
+    Create, update and delete many employees in one transaction
+    Email uniqueness and employee IDs are validated with set-based queries;
+    in atomic mode any invalid item rejects the request, in partial mode
+    valid items are applied and invalid ones reported
+    """
+    email_owners = {}
+    for query in email_owners_queries(EmployeeBulkPlan.bulk_emails(bulk_data)):
+        email_owners.update(db.execute(query).all())
+    # Current department of each referenced employee, for validation and the change feed
+    known_employees = existing_pairs(
+        db, Employee.id, Employee.department, EmployeeBulkPlan.bulk_employee_ids(bulk_data)
+    )
+    plan = EmployeeBulkPlan(bulk_data, email_owners, known_employees)
+    
+    # Apply all writes in a single transaction
+    new_ids = []
+    if plan.create_rows:
+        new_ids = db.execute(
+            insert(Employee).returning(Employee.id, sort_by_parameter_order=True),
+            plan.create_rows
+        ).scalars().all()
+    
+    if plan.update_rows:
+        db.execute(update(Employee), plan.update_rows)
+    
+    deleted_tasks = []
+    for chunk in chunked(plan.delete_ids):
+        # Same cascade as Employee.tasks (delete-orphan) without loading rows;
+        # the cascaded tasks are collected first for the change feed
+        deleted_tasks += db.execute(
+            select(Task.id, Task.employee_id).where(Task.employee_id.in_(chunk))
+        ).all()
+        drop_workloads(db, chunk)
+        record_deletions(db, "tasks", Task.id, Task.employee_id.in_(chunk))
+        record_deletions(db, "employees", Employee.id, Employee.id.in_(chunk))
+        db.execute(delete(Task).where(Task.employee_id.in_(chunk)))
+        db.execute(delete(Employee).where(Employee.id.in_(chunk)))
+    
+    db.commit()
+    plan.applied(new_ids)
+    plan.announce(deleted_tasks)
+    
+    return plan.report.to_result(committed=True)
+
+
+def apply_employee_update(employee: Employee, update_data: dict) -> None:
+    """Set the fields of an update request on an employee and stamp updated_at"""
+    # Convert status string to enum if present
+    if "status" in update_data:
+        update_data["status"] = EmployeeStatus(update_data["status"])
+    
+    for key, value in update_data.items():
+        setattr(employee, key, value)
+    
+    employee.updated_at = datetime.utcnow()
+
+
 @router.put("/{employee_id}", response_model=EmployeeResponse)
 def update_employee(
     employee_id: int,
     employee_data: EmployeeUpdate,
+    request: Request,
+    response: Response,
     db: Session = Depends(get_db)
 ):
     """
     Full update of an employee (PATCH for partial update)
+    Honors If-Match with the employee's ETag (412 if it changed)
     """
     employee = db.query(Employee).filter(Employee.id == employee_id).first()
     
     if not employee:
         raise HTTPException(status_code=404, detail="Employee not found")
     
+    check_if_match(request, lambda: employee_validator(db, employee_id))
+    
     # Update fields
     update_data = employee_data.model_dump(exclude_unset=True)
     
@@ -127,22 +582,16 @@ def update_employee(
     if "email" in update_data and update_data["email"] != employee.email:
         existing = db.query(Employee).filter(Employee.email == update_data["email"]).first()
         if existing:
-            raise HTTPException(
-                status_code=400,
-                detail=f"Employee with email {update_data['email']} already exists"
-            )
+            raise email_taken(update_data["email"])
     
-    # Convert status string to enum if present
-    if "status" in update_data:
-        update_data["status"] = EmployeeStatus(update_data["status"])
-    
-    for key, value in update_data.items():
-        setattr(employee, key, value)
-    
-    employee.updated_at = datetime.utcnow()
+    previous_department = employee.department
+    apply_employee_update(employee, update_data)
     
     db.commit()
     db.refresh(employee)
+    invalidate_employees([employee.id])
+    broker.publish("employee.updated", [employee.id], [employee.id], [previous_department, employee.department])
+    response.headers.update(employee_validator(db, employee.id).headers())
     
     return employee
 
@@ -151,28 +600,44 @@ def update_employee(
 def partial_update_employee(
     employee_id: int,
     employee_data: EmployeeUpdate,
+    request: Request,
+    response: Response,
     db: Session = Depends(get_db)
 ):
     """
     Partial update of an employee
     """
-    return update_employee(employee_id, employee_data, db)
+    return update_employee(employee_id, employee_data, request, response, db)
 
 
 @router.delete("/{employee_id}", status_code=204)
 def delete_employee(
     employee_id: int,
+    request: Request,
     db: Session = Depends(get_db)
 ):
     """
     Delete an employee (cascades to their tasks)
+    Honors If-Match with the employee's ETag (412 if it changed)
     """
     employee = db.query(Employee).filter(Employee.id == employee_id).first()
     
     if not employee:
         raise HTTPException(status_code=404, detail="Employee not found")
     
+    check_if_match(request, lambda: employee_validator(db, employee_id))
+    
+    department = employee.department
+    task_ids = db.execute(select(Task.id).where(Task.employee_id == employee_id)).scalars().all()
+    # Tombstones for the employee and the tasks removed by the cascade
+    record_deletions(db, "tasks", Task.id, Task.employee_id == employee_id)
+    record_deletions(db, "employees", Employee.id, Employee.id == employee_id)
+    drop_workloads(db, [employee_id])
     db.delete(employee)
     db.commit()
+    invalidate_employees([employee_id])
+    broker.publish("employee.deleted", [employee_id], [employee_id], [department])
+    if task_ids:
+        broker.publish("task.deleted", task_ids, [employee_id], [department])
     
     return None
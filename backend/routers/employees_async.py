@@ -0,0 +1,334 @@
+"""
+Employee router on an AsyncSession (DB_ASYNC)
+Same routes and behaviour as routers.employees, as async def handlers that
+await their queries on the event loop; statements and response bodies come
+from the builders in routers.employees
+"""
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi.responses import StreamingResponse
+from sqlalchemy import delete, insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Literal, Optional, Union
+
+from bulk import chunked, existing_pairs_async
+from cache import cache_key, response_cache
+from changes import changes_page_async, record_deletions_async
+from conditional import Validator, check_if_match_async, is_fresh, make_validator, not_modified
+from database import get_async_db
+from events import broker
+from export import EXPORT_RESPONSES, export_response
+from serialization import json_response
+from workload import drop_workloads_async
+from models.employee import Employee, EmployeeStatus
+from models.task import Task
+from routers.employees import (
+    EMPLOYEE_ROWS,
+    EmployeeBulkPlan,
+    apply_employee_update,
+    email_owners_queries,
+    email_taken,
+    employee_count_query,
+    employee_detail_query,
+    employee_export_query,
+    employee_list_query,
+    employee_list_response,
+    employee_validator_query,
+    invalidate_employees,
+    new_employee,
+    workload_query,
+    workload_response
+)
+from schemas.employee import (
+    EmployeeCreate,
+    EmployeeUpdate,
+    EmployeeResponse,
+    EmployeeWithTasks,
+    EmployeeBulkRequest
+)
+from schemas.bulk import BulkResult
+from schemas.pagination import Changes, CountedPage, Page
+from schemas.workload import WorkloadResponse
+
+router = APIRouter()
+
+
+async def employee_validator(db: AsyncSession, employee_id: int) -> Optional[Validator]:
+    """Validator of an employee's detail representation; None if the employee does not exist"""
+    row = (await db.execute(employee_validator_query(employee_id))).first()
+    if row is None:
+        return None
+    return make_validator("employee", employee_id, *row)
+
+
+async def find_employee(db: AsyncSession, employee_id: int) -> Employee:
+    employee = await db.get(Employee, employee_id)
+    if not employee:
+        raise HTTPException(status_code=404, detail="Employee not found")
+    return employee
+
+
+async def email_in_use(db: AsyncSession, email: str) -> bool:
+    return (await db.execute(select(Employee.id).where(Employee.email == email))).first() is not None
+
+
+@router.get("", response_model=Union[List[EmployeeResponse], Page[EmployeeResponse], CountedPage[EmployeeResponse]])
+async def list_employees(
+    request: Request,
+    status: Optional[EmployeeStatus] = Query(None, description="Filter by status"),
+    department: Optional[str] = Query(None, description="Filter by department"),
+    role: Optional[str] = Query(None, description="Filter by role"),
+    search: Optional[str] = Query(None, description="Search by name, email, role or department (prefix match)"),
+    page: int = Query(1, ge=1, description="Page number"),
+    page_size: int = Query(50, ge=1, le=100, description="Items per page"),
+    cursor: Optional[str] = Query(None, description="Keyset cursor from next_cursor (empty for the first page); returns a page envelope"),
+    include_total: bool = Query(False, description="Return a page envelope with total and has_more"),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    Get list of employees with optional filters and pagination
+    Uses page/page_size offsets, or constant-cost keyset pages when cursor is given
+    include_total adds one count over the filtered set; other pages cost only their rows
+    Answers 304 when If-None-Match matches the ETag of the page's rows
+    """
+    key = cache_key(
+        "employees.list", status=status, department=department, role=role,
+        search=search, page=page, page_size=page_size, cursor=cursor, include_total=include_total or None
+    )
+    cached = response_cache.lookup(key, request)
+    if cached:
+        return cached
+    
+    bind = db.get_bind()
+    query = employee_list_query(bind, status, department, role, search, page, page_size, cursor)
+    total = None
+    if include_total:
+        total = (await db.execute(employee_count_query(bind, status, department, role, search))).scalar()
+    employees = EMPLOYEE_ROWS.dicts(await db.execute(query))
+    return employee_list_response(request, key, employees, total, page, page_size, cursor)
+
+
+@router.get("/export", response_class=StreamingResponse, responses=EXPORT_RESPONSES)
+async def export_employees(
+    fmt: Literal["ndjson", "csv"] = Query("ndjson", alias="format", description="Output format"),
+    status: Optional[EmployeeStatus] = Query(None, description="Filter by status"),
+    department: Optional[str] = Query(None, description="Filter by department"),
+    role: Optional[str] = Query(None, description="Filter by role"),
+    search: Optional[str] = Query(None, description="Search by name, email, role or department (prefix match)")
+):
+    """
+    Stream all employees matching the list filters as NDJSON or CSV
+    """
+    query = employee_export_query(status, department, role, search)
+    return export_response(query, fmt, "employees", is_async=True)
+
+
+@router.get("/changes", response_model=Changes[EmployeeResponse])
+async def employee_changes(
+    since: Optional[str] = Query(None, description="next_since from the previous call (empty for a full sync)"),
+    limit: int = Query(500, ge=1, le=1000, description="Maximum rows and deletions returned"),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    Employees created, updated or deleted since a sync token
+    Costs O(changes); tasks removed with a deleted employee are reported by
+    /api/tasks/changes
+    """
+    return json_response(await changes_page_async(db, "employees", EMPLOYEE_ROWS, Employee, since, limit))
+
+
+@router.get("/workload", response_model=List[WorkloadResponse])
+async def list_workloads(
+    status: Optional[EmployeeStatus] = Query(None, description="Filter by status"),
+    department: Optional[str] = Query(None, description="Filter by department"),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    Open-task counts by status and priority, overdue count and next due date
+    of every employee, read from the maintained workload table in one query
+    Overdue counts of rows whose tasks have come due since they were computed
+    are counted in the same query; the due-date scanner rewrites those rows
+    """
+    return workload_response(await db.execute(workload_query(status, department)))
+
+
+@router.get("/{employee_id}", response_model=EmployeeWithTasks)
+async def get_employee(
+    employee_id: int,
+    request: Request,
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    Get single employee by ID with their assigned tasks
+    Supports If-None-Match (304 Not Modified)
+    """
+    key = cache_key("employees.get", employee_id=employee_id)
+    cached = response_cache.lookup(key, request)
+    if cached:
+        return cached
+    
+    validator = await employee_validator(db, employee_id)
+    if validator is None:
+        raise HTTPException(status_code=404, detail="Employee not found")
+    if is_fresh(request, validator.headers()):
+        return not_modified(validator.headers())
+    
+    employee = (await db.execute(employee_detail_query(employee_id))).scalars().first()
+    
+    if not employee:
+        raise HTTPException(status_code=404, detail="Employee not found")
+    
+    return response_cache.store(
+        key, EmployeeWithTasks, employee, [f"employee:{employee.id}"], validator
+    )
+
+
+@router.post("", response_model=EmployeeResponse, status_code=201)
+async def create_employee(
+    employee_data: EmployeeCreate,
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    Create a new employee
+    """
+    if await email_in_use(db, employee_data.email):
+        raise email_taken(employee_data.email)
+    
+    employee = new_employee(employee_data)
+    db.add(employee)
+    await db.commit()
+    await db.refresh(employee)
+    invalidate_employees()
+    broker.publish("employee.created", [employee.id], [employee.id], [employee.department])
+    
+    return employee
+
+
+@router.post("/bulk", response_model=BulkResult)
+async def bulk_employees(
+    bulk_data: EmployeeBulkRequest,
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    Create, update and delete many employees in one transaction
+    Email uniqueness and employee IDs are validated with set-based queries;
+    in atomic mode any invalid item rejects the request, in partial mode
+    valid items are applied and invalid ones reported
+    """
+    email_owners = {}
+    for query in email_owners_queries(EmployeeBulkPlan.bulk_emails(bulk_data)):
+        email_owners.update((await db.execute(query)).all())
+    # Current department of each referenced employee, for validation and the change feed
+    known_employees = await existing_pairs_async(
+        db, Employee.id, Employee.department, EmployeeBulkPlan.bulk_employee_ids(bulk_data)
+    )
+    plan = EmployeeBulkPlan(bulk_data, email_owners, known_employees)
+    
+    # Apply all writes in a single transaction
+    new_ids = []
+    if plan.create_rows:
+        new_ids = (await db.execute(
+            insert(Employee).returning(Employee.id, sort_by_parameter_order=True),
+            plan.create_rows
+        )).scalars().all()
+    
+    if plan.update_rows:
+        await db.execute(update(Employee), plan.update_rows)
+    
+    deleted_tasks = []
+    for chunk in chunked(plan.delete_ids):
+        # Same cascade as Employee.tasks (delete-orphan) without loading rows;
+        # the cascaded tasks are collected first for the change feed
+        deleted_tasks += (await db.execute(
+            select(Task.id, Task.employee_id).where(Task.employee_id.in_(chunk))
+        )).all()
+        await drop_workloads_async(db, chunk)
+        await record_deletions_async(db, "tasks", Task.id, Task.employee_id.in_(chunk))
+        await record_deletions_async(db, "employees", Employee.id, Employee.id.in_(chunk))
+        await db.execute(delete(Task).where(Task.employee_id.in_(chunk)))
+        await db.execute(delete(Employee).where(Employee.id.in_(chunk)))
+    
+    await db.commit()
+    plan.applied(new_ids)
+    plan.announce(deleted_tasks)
+    
+    return plan.report.to_result(committed=True)
+
+
+@router.put("/{employee_id}", response_model=EmployeeResponse)
+async def update_employee(
+    employee_id: int,
+    employee_data: EmployeeUpdate,
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    Full update of an employee (PATCH for partial update)
+    Honors If-Match with the employee's ETag (412 if it changed)
+    """
+    employee = await find_employee(db, employee_id)
+    await check_if_match_async(request, lambda: employee_validator(db, employee_id))
+    
+    update_data = employee_data.model_dump(exclude_unset=True)
+    
+    # Check email uniqueness if email is being updated
+    if "email" in update_data and update_data["email"] != employee.email:
+        if await email_in_use(db, update_data["email"]):
+            raise email_taken(update_data["email"])
+    
+    previous_department = employee.department
+    apply_employee_update(employee, update_data)
+    
+    await db.commit()
+    await db.refresh(employee)
+    invalidate_employees([employee.id])
+    broker.publish("employee.updated", [employee.id], [employee.id], [previous_department, employee.department])
+    response.headers.update((await employee_validator(db, employee.id)).headers())
+    
+    return employee
+
+
+@router.patch("/{employee_id}", response_model=EmployeeResponse)
+async def partial_update_employee(
+    employee_id: int,
+    employee_data: EmployeeUpdate,
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    Partial update of an employee
+    """
+    return await update_employee(employee_id, employee_data, request, response, db)
+
+
+@router.delete("/{employee_id}", status_code=204)
+async def delete_employee(
+    employee_id: int,
+    request: Request,
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    Delete an employee (cascades to their tasks)
+    Honors If-Match with the employee's ETag (412 if it changed)
+    """
+    employee = await find_employee(db, employee_id)
+    await check_if_match_async(request, lambda: employee_validator(db, employee_id))
+    
+    department = employee.department
+    task_ids = (await db.execute(select(Task.id).where(Task.employee_id == employee_id))).scalars().all()
+    # Tombstones for the employee and the tasks removed by the cascade
+    await record_deletions_async(db, "tasks", Task.id, Task.employee_id == employee_id)
+    await record_deletions_async(db, "employees", Employee.id, Employee.id == employee_id)
+    await drop_workloads_async(db, [employee_id])
+    # Bulk deletes in place of session.delete, which would lazy-load the
+    # tasks relationship for its delete-orphan cascade
+    await db.execute(delete(Task).where(Task.employee_id == employee_id))
+    await db.execute(delete(Employee).where(Employee.id == employee_id))
+    await db.commit()
+    invalidate_employees([employee_id])
+    broker.publish("employee.deleted", [employee_id], [employee_id], [department])
+    if task_ids:
+        broker.publish("task.deleted", task_ids, [employee_id], [department])
+    
+    return None
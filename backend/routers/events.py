@@ -0,0 +1,65 @@
+"""
+Events router - Server-Sent Events stream of task and employee changes
+"""
+import asyncio
+from fastapi import APIRouter, Header, Query
+from fastapi.responses import StreamingResponse
+from typing import List, Optional
+
+import config
+from events import broker
+from serialization import dumps
+
+router = APIRouter()
+
+# Milliseconds a disconnected client waits before reconnecting
+RETRY_MS = 3000
+
+
+def format_event(event: dict) -> bytes:
+    return b"id: %d\nevent: %s\ndata: %s\n\n" % (event["seq"], event["type"].encode(), dumps(event))
+
+
+async def event_stream(employee_ids: List[int], departments: List[str], last_seq: Optional[int]):
+    # Subscribed once the response starts, so the finally clause always unsubscribes
+    subscription = broker.subscribe(employee_ids, departments, last_seq)
+    try:
+        yield b"retry: %d\n\n" % RETRY_MS
+        while True:
+            try:
+                event = await asyncio.wait_for(subscription.queue.get(), config.EVENTS_KEEPALIVE_SECONDS)
+            except asyncio.TimeoutError:
+                # Comment line keeps proxies from closing an idle connection
+                yield b": keepalive\n\n"
+                continue
+            yield format_event(event)
+    finally:
+        broker.unsubscribe(subscription)
+
+
+@router.get(
+    "",
+    response_class=StreamingResponse,
+    responses={200: {"content": {"text/event-stream": {}}, "description": "Stream of change events"}}
+)
+async def stream_events(
+    employee_id: List[int] = Query([], description="Only changes touching these employees (repeatable)"),
+    department: List[str] = Query([], description="Only changes touching these departments (repeatable)"),
+    last_event_id: Optional[int] = Query(None, description="Resume after this event id"),
+    last_event_id_header: Optional[str] = Header(None, alias="Last-Event-ID", include_in_schema=False)
+):
+    """
+    Stream task and employee changes as Server-Sent Events
+    Each event carries its type (e.g. task.assigned), the changed IDs and
+    the employees and departments involved. Reconnecting with Last-Event-ID
+    (or last_event_id) replays missed events; a "reset" event means some
+    were dropped and the client should refetch its data
+    """
+    if last_event_id_header and last_event_id_header.isdigit():
+        last_event_id = int(last_event_id_header)
+    
+    return StreamingResponse(
+        event_stream(employee_id, department, last_event_id),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
@@ -0,0 +1,60 @@
+"""
+Import router - streaming CSV/NDJSON uploads processed as background jobs
+"""
+import os
+import shutil
+import tempfile
+from fastapi import APIRouter, File, HTTPException, Query, UploadFile
+from typing import Literal, Optional
+
+from importer import IMPORT_FORMATS, create_job, get_job, submit_import
+from schemas.imports import ImportJobResponse
+
+router = APIRouter()
+
+# Bytes copied per read when spooling an upload to disk
+COPY_CHUNK_BYTES = 1024 * 1024
+
+
+@router.post("/{resource}", response_model=ImportJobResponse, status_code=202)
+def start_import(
+    resource: Literal["employees", "tasks"],
+    file: UploadFile = File(..., description="CSV with a header row, or NDJSON"),
+    fmt: Optional[Literal["csv", "ndjson"]] = Query(
+        None, alias="format", description="Input format (defaults to the file extension)"
+    )
+):
+    """
+    Start importing employees or tasks from an uploaded file
+    Returns a job to poll with GET /api/imports/{job_id}
+    """
+    if fmt is None:
+        extension = os.path.splitext(file.filename or "")[1].lstrip(".").lower()
+        if extension not in IMPORT_FORMATS:
+            raise HTTPException(
+                status_code=400,
+                detail="Cannot detect file format, pass format=csv or format=ndjson"
+            )
+        fmt = extension
+    
+    # Copy the upload to a file the background job owns
+    with tempfile.NamedTemporaryFile(delete=False, suffix=f".{fmt}") as spool:
+        shutil.copyfileobj(file.file, spool, COPY_CHUNK_BYTES)
+    
+    job = create_job(resource, fmt)
+    submit_import(job, spool.name, cleanup=lambda: os.unlink(spool.name))
+    
+    return job
+
+
+@router.get("/{job_id}", response_model=ImportJobResponse)
+def get_import(job_id: str):
+    """
+    Get progress and row errors of an import job
+    """
+    job = get_job(job_id)
+    
+    if not job:
+        raise HTTPException(status_code=404, detail="Import job not found")
+    
+    return job
@@ -0,0 +1,79 @@
+"""
+Lazily included routers
+A router module is imported, and its routes built, on the first request
+under its prefix, so a cold worker can answer before every router, schema
+and model has been loaded
+"""
+from typing import Callable, List, Optional
+
+from fastapi import APIRouter, FastAPI
+from starlette.routing import BaseRoute, Match, NoMatchFound
+
+
+class LazyRouter(BaseRoute):
+    """
+    Placeholder route for a router that has not been imported yet
+    On first use it builds the real routes and takes their place in the
+    application's route list
+    """
+
+    def __init__(self, app: FastAPI, prefix: str, load: Callable[[], APIRouter], **include_options):
+        self.app = app
+        self.prefix = prefix
+        self._load = load
+        self.include_options = include_options
+        self.routes: Optional[List[BaseRoute]] = None
+
+    def load(self) -> List[BaseRoute]:
+        if self.routes is None:
+            # Include through the application so its dependency overrides and
+            # defaults apply, then move the new routes to the placeholder's
+            # position; later requests and the OpenAPI schema use them directly
+            routes = self.app.router.routes
+            start = len(routes)
+            self.app.include_router(self._load(), prefix=self.prefix, **self.include_options)
+            self.routes = routes[start:]
+            del routes[start:]
+            if self in routes:
+                index = routes.index(self)
+                routes[index:index + 1] = self.routes
+        return self.routes
+
+    def matches(self, scope):
+        # Substring test so a root_path in front of the prefix still matches;
+        # a false positive only loads the router early
+        if self.prefix not in scope.get("path", ""):
+            return Match.NONE, {}
+        partial = None
+        for route in self.load():
+            match, child_scope = route.matches(scope)
+            if match == Match.FULL:
+                return match, {**child_scope, "lazy_route": route}
+            if match == Match.PARTIAL and partial is None:
+                partial = match, {**child_scope, "lazy_route": route}
+        return partial or (Match.NONE, {})
+
+    async def handle(self, scope, receive, send):
+        await scope.pop("lazy_route").handle(scope, receive, send)
+
+    def url_path_for(self, name: str, /, **path_params):
+        for route in self.load():
+            try:
+                return route.url_path_for(name, **path_params)
+            except NoMatchFound:
+                pass
+        raise NoMatchFound(name, path_params)
+
+
+def include_lazy_router(app: FastAPI, prefix: str, load: Callable[[], APIRouter], **include_options) -> LazyRouter:
+    """Include the router returned by load() under prefix on its first request"""
+    route = LazyRouter(app, prefix, load, **include_options)
+    app.router.routes.append(route)
+    return route
+
+
+def load_lazy_routers(app: FastAPI) -> None:
+    """Build every router that is still a placeholder (e.g. before generating OpenAPI)"""
+    for route in list(app.router.routes):
+        if isinstance(route, LazyRouter):
+            route.load()
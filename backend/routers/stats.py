@@ -0,0 +1,106 @@
+"""
+Statistics router - aggregated dashboard data computed in the database
+"""
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+from typing import Optional
+from datetime import date, datetime, time, timedelta
+
+from cache import cache_key, response_cache
+from database import get_db
+from models.employee import Employee, EmployeeStatus
+from models.task import Task, TaskStatus, TaskPriority
+from schemas.stats import DashboardStats
+
+router = APIRouter()
+
+
+def _date_bounds(column, date_from: Optional[date], date_to: Optional[date]) -> list:
+    """Build inclusive day-range conditions for a datetime column"""
+    conditions = []
+    if date_from:
+        conditions.append(column >= datetime.combine(date_from, time.min))
+    if date_to:
+        conditions.append(column < datetime.combine(date_to + timedelta(days=1), time.min))
+    return conditions
+
+
+@router.get("", response_model=DashboardStats)
+def get_dashboard_stats(
+    department: Optional[str] = Query(None, description="Limit stats to one department"),
+    date_from: Optional[date] = Query(None, description="Only count records created on or after this date"),
+    date_to: Optional[date] = Query(None, description="Only count records created on or before this date"),
+    db: Session = Depends(get_db)
+):
+    """
+    Get employee, task and per-department counts for the dashboard.
+    Runs two grouped queries, so the cost depends on the number of groups
+    rather than the number of rows.
+    """
+    key = cache_key("stats", department=department, date_from=date_from, date_to=date_to)
+    cached = response_cache.lookup(key)
+    if cached:
+        return cached
+
+    # Employees grouped by (department, status)
+    employee_query = db.query(
+        Employee.department,
+        Employee.status,
+        func.count(Employee.id)
+    )
+    if department:
+        employee_query = employee_query.filter(Employee.department == department)
+    employee_query = employee_query.filter(
+        *_date_bounds(Employee.date_joined, date_from, date_to)
+    )
+    employee_rows = employee_query.group_by(Employee.department, Employee.status).all()
+
+    # Tasks grouped by (department of assignee, status, priority)
+    task_query = db.query(
+        Employee.department,
+        Task.status,
+        Task.priority,
+        func.count(Task.id)
+    ).outerjoin(Employee, Task.employee_id == Employee.id)
+    if department:
+        task_query = task_query.filter(Employee.department == department)
+    task_query = task_query.filter(*_date_bounds(Task.created_at, date_from, date_to))
+    task_rows = task_query.group_by(Employee.department, Task.status, Task.priority).all()
+
+    # Fold the grouped rows into the response payload
+    employees_by_status = {s.value: 0 for s in EmployeeStatus}
+    tasks_by_status = {s.value: 0 for s in TaskStatus}
+    tasks_by_priority = {p.value: 0 for p in TaskPriority}
+    departments = {}
+    unassigned = 0
+
+    for dept, status, count in employee_rows:
+        employees_by_status[status.value] += count
+        departments.setdefault(dept, {"employees": 0, "tasks": 0})["employees"] += count
+
+    for dept, status, priority, count in task_rows:
+        tasks_by_status[status.value] += count
+        tasks_by_priority[priority.value] += count
+        if dept is None:
+            unassigned += count
+        else:
+            departments.setdefault(dept, {"employees": 0, "tasks": 0})["tasks"] += count
+
+    stats = {
+        "employees": {
+            "total": sum(employees_by_status.values()),
+            "by_status": employees_by_status
+        },
+        "tasks": {
+            "total": sum(tasks_by_status.values()),
+            "unassigned": unassigned,
+            "by_status": tasks_by_status,
+            "by_priority": tasks_by_priority
+        },
+        "departments": [
+            {"department": name, **counts}
+            for name, counts in sorted(departments.items())
+        ]
+    }
+    return response_cache.store(key, DashboardStats, stats, ["stats"])
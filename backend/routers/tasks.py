@@ -1,42 +1,102 @@
 """
 Task router - CRUD endpoints for tasks
 """
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi.responses import StreamingResponse
+from sqlalchemy import bindparam, delete, func, insert, select, tuple_, update
 from sqlalchemy.orm import Session
-from typing import List, Optional
-from datetime import datetime, date
+from typing import List, Literal, Optional, Union
+from datetime import datetime, date, timedelta
 
-from database import get_db
+from assignment import balance, employee_loads, weight_expression
+from bulk import BulkReport, chunked, existing_pairs, existing_values
+from cache import cache_key, response_cache
+from changes import changes_page, record_deletions
+from conditional import Validator, check_if_match, is_fresh, make_validator, not_modified, page_validator
+from database import engine, get_db
+from events import broker
+from export import EXPORT_RESPONSES, export_response
+from pagination import encode_cursor, decode_cursor, after_key, key_date, key_int, nullable, page_body
+from search import apply_search
+from serialization import RowShape, dumps, json_response
+from workload import refresh_workloads
+from instrumentation import timed_serialization
 from models.task import Task, TaskStatus, TaskPriority
 from models.employee import Employee
 from schemas.task import (
+    EmployeeSummary,
     TaskCreate,
     TaskUpdate,
     TaskResponse,
     TaskWithEmployee,
-    TaskAssign
+    TaskAssign,
+    TaskBulkRequest,
+    TaskAutoAssign,
+    AutoAssignResult,
+    MAX_AUTO_ASSIGN_TASKS
 )
+from schemas.bulk import BulkResult
+from schemas.pagination import Changes, CountedPage, Page
 
 router = APIRouter()
 
+# List rows are selected as columns and encoded without per-row models
+TASK_ROWS = RowShape(TaskWithEmployee, Task, {"employee": (EmployeeSummary, Employee)})
+TASK_CHANGE_ROWS = RowShape(TaskResponse, Task)
 
-@router.get("", response_model=List[TaskWithEmployee])
-def list_tasks(
-    status: Optional[TaskStatus] = Query(None, description="Filter by status"),
-    priority: Optional[TaskPriority] = Query(None, description="Filter by priority"),
-    employee_id: Optional[int] = Query(None, description="Filter by assigned employee"),
-    due_before: Optional[date] = Query(None, description="Filter tasks due before date"),
-    due_after: Optional[date] = Query(None, description="Filter tasks due after date"),
-    page: int = Query(1, ge=1, description="Page number"),
-    page_size: int = Query(50, ge=1, le=100, description="Items per page"),
-    db: Session = Depends(get_db)
+
+def invalidate_tasks(task_ids=(), employee_ids=()):
+    """Drop cached responses containing the given tasks or their assignees' task lists"""
+    tags = ["tasks", "stats"]
+    tags += [f"task:{task_id}" for task_id in task_ids]
+    for employee_id in set(employee_ids):
+        if employee_id is not None:
+            tags += [f"tasks:employee:{employee_id}", f"employee:{employee_id}"]
+    response_cache.invalidate(*tags)
+
+
+def publish_tasks(db: Session, event_type: str, task_ids, employee_ids=()):
+    """Announce committed task changes on the change feed, with the assignees' departments"""
+    departments = existing_pairs(db, Employee.id, Employee.department, employee_ids).values()
+    broker.publish(event_type, task_ids, employee_ids, departments)
+
+
+def task_validator_query(task_id: int):
+    """Values a task's detail representation depends on: the task's and its assignee's updated_at"""
+    return (
+        select(Task.updated_at, Employee.id, Employee.updated_at)
+        .outerjoin(Employee, Task.employee_id == Employee.id)
+        .where(Task.id == task_id)
+    )
+
+
+def task_validator_from_row(task_id: int, row) -> Optional[Validator]:
+    """Validator from the task_validator_query row; None if the task does not exist"""
+    if row is None:
+        return None
+    last_modified = max(t for t in (row[0], row[2]) if t is not None)
+    return make_validator("task", task_id, *row, last_modified=last_modified)
+
+
+def task_validator(db: Session, task_id: int) -> Optional[Validator]:
+    """Validator of a task's detail representation; None if the task does not exist"""
+    return task_validator_from_row(task_id, db.execute(task_validator_query(task_id)).first())
+
+
+def apply_task_filters(
+    query,
+    status: Optional[TaskStatus] = None,
+    priority: Optional[TaskPriority] = None,
+    employee_id: Optional[int] = None,
+    due_before: Optional[date] = None,
+    due_after: Optional[date] = None,
+    search: Optional[str] = None,
+    bind=None
 ):
     """
-    Get list of tasks with optional filters and pagination
+    Apply the list filters to an ORM query or Core select
+    Returns (query, search rank column or None)
     """
-    query = db.query(Task)
-    
-    # Apply filters
     if status:
         query = query.filter(Task.status == status)
     
@@ -52,27 +112,389 @@ def list_tasks(
     if due_after:
         query = query.filter(Task.due_date >= due_after)
     
-    # Apply pagination
-    offset = (page - 1) * page_size
-    tasks = query.offset(offset).limit(page_size).all()
+    rank = None
+    if search:
+        query, rank = apply_search(query, Task, search, [Task.title, Task.description], bind=bind)
     
-    return tasks
+    return query, rank
+
+
+def task_list_query(
+    bind,
+    status: Optional[TaskStatus],
+    priority: Optional[TaskPriority],
+    employee_id: Optional[int],
+    due_before: Optional[date],
+    due_after: Optional[date],
+    search: Optional[str],
+    page: int,
+    page_size: int,
+    cursor: Optional[str],
+    order_by: str
+):
+    """
+    Select of one list page: page/page_size offsets with the best search
+    matches first, or the keyset page after cursor plus one extra row
+    """
+    query = (
+        select(*TASK_ROWS.columns)
+        .select_from(Task)
+        .outerjoin(Employee, Task.employee_id == Employee.id)
+    )
+    query, rank = apply_task_filters(
+        query, status, priority, employee_id, due_before, due_after, search, bind=bind
+    )
+    
+    # Best search matches first in offset mode; keyset pages need the stable key alone
+    if cursor is None and rank is not None:
+        query = query.order_by(rank)
+    
+    # Stable sort key shared by both pagination modes
+    sort_column = Task.due_date if order_by == "due_date" else None
+    if sort_column is not None:
+        query = query.order_by(sort_column.asc().nulls_first(), Task.id)
+    elif due_before or due_after:
+        # "id + 0" keeps SQLite from walking the whole table in id order
+        # instead of using the due_date index
+        query = query.order_by(Task.id + 0)
+    else:
+        query = query.order_by(Task.id)
+    
+    if cursor is None:
+        # Apply offset pagination
+        return query.offset((page - 1) * page_size).limit(page_size)
+    
+    # Apply keyset pagination; the extra row decides next_cursor
+    key_types = (nullable(key_date), key_int) if sort_column is not None else (key_int,)
+    last_key = decode_cursor(cursor, order_by, key_types)
+    if last_key is not None:
+        if sort_column is not None:
+            query = query.filter(after_key(Task.id, last_key[1], sort_column, last_key[0]))
+        else:
+            query = query.filter(after_key(Task.id, last_key[0]))
+    return query.limit(page_size + 1)
+
+
+def task_count_query(
+    bind,
+    status: Optional[TaskStatus],
+    priority: Optional[TaskPriority],
+    employee_id: Optional[int],
+    due_before: Optional[date],
+    due_after: Optional[date],
+    search: Optional[str]
+):
+    """Select of the number of tasks matching the list filters"""
+    query, _ = apply_task_filters(
+        select(func.count(Task.id)).select_from(Task),
+        status, priority, employee_id, due_before, due_after, search, bind=bind
+    )
+    return query
+
+
+def task_list_response(
+    request: Request,
+    key: str,
+    tags: List[str],
+    tasks: List[dict],
+    total: Optional[int],
+    page: int,
+    page_size: int,
+    cursor: Optional[str],
+    order_by: str
+) -> Response:
+    """
+    Encode and cache a list page read with task_list_query, or answer 304
+    when If-None-Match matches the ETag of its rows
+    """
+    # A keyset page's extra row is part of the validator
+    validator = page_validator(key, tasks, total)
+    if is_fresh(request, validator.headers()):
+        return not_modified(validator.headers())
+    
+    if cursor is None:
+        offset = (page - 1) * page_size
+        if total is not None:
+            payload = page_body(tasks, None, total, offset + len(tasks) < total)
+        else:
+            payload = tasks
+    else:
+        next_cursor = None
+        if len(tasks) > page_size:
+            tasks = tasks[:page_size]
+            last = tasks[-1]
+            values = [last["due_date"], last["id"]] if order_by == "due_date" else [last["id"]]
+            next_cursor = encode_cursor(order_by, values)
+        payload = page_body(tasks, next_cursor, total, next_cursor is not None)
+    
+    with timed_serialization():
+        body = dumps(payload)
+    return response_cache.store_body(key, body, tags, validator)
+
+
+def task_list_tags(employee_id: Optional[int]) -> List[str]:
+    """Lists filtered by assignee only change with that employee's tasks"""
+    return ["tasks"] if employee_id is None else [f"tasks:employee:{employee_id}"]
+
+
+@router.get("", response_model=Union[List[TaskWithEmployee], Page[TaskWithEmployee], CountedPage[TaskWithEmployee]])
+def list_tasks(
+    request: Request,
+    status: Optional[TaskStatus] = Query(None, description="Filter by status"),
+    priority: Optional[TaskPriority] = Query(None, description="Filter by priority"),
+    employee_id: Optional[int] = Query(None, description="Filter by assigned employee"),
+    due_before: Optional[date] = Query(None, description="Filter tasks due before date"),
+    due_after: Optional[date] = Query(None, description="Filter tasks due after date"),
+    search: Optional[str] = Query(None, description="Search by title or description (prefix match)"),
+    page: int = Query(1, ge=1, description="Page number"),
+    page_size: int = Query(50, ge=1, le=100, description="Items per page"),
+    cursor: Optional[str] = Query(None, description="Keyset cursor from next_cursor (empty for the first page); returns a page envelope"),
+    order_by: Literal["id", "due_date"] = Query("id", description="Sort key"),
+    include_total: bool = Query(False, description="Return a page envelope with total and has_more"),
+    db: Session = Depends(get_db)
+):
+    """
+    Get list of tasks with optional filters and pagination
+    Uses page/page_size offsets, or constant-cost keyset pages when cursor is given
+    include_total adds one count over the filtered set; other pages cost only their rows
+    Answers 304 when If-None-Match matches the ETag of the page's rows
+    """
+    key = cache_key(
+        "tasks.list", status=status, priority=priority, employee_id=employee_id,
+        due_before=due_before, due_after=due_after, search=search, page=page,
+        page_size=page_size, cursor=cursor, order_by=order_by, include_total=include_total or None
+    )
+    cached = response_cache.lookup(key, request)
+    if cached:
+        return cached
+    
+    bind = db.get_bind()
+    filters = (status, priority, employee_id, due_before, due_after, search)
+    query = task_list_query(bind, *filters, page, page_size, cursor, order_by)
+    total = None
+    if include_total:
+        total = db.execute(task_count_query(bind, *filters)).scalar()
+    tasks = TASK_ROWS.dicts(db.execute(query))
+    return task_list_response(
+        request, key, task_list_tags(employee_id), tasks, total, page, page_size, cursor, order_by
+    )
+
+
+def task_export_query(
+    status: Optional[TaskStatus],
+    priority: Optional[TaskPriority],
+    employee_id: Optional[int],
+    due_before: Optional[date],
+    due_after: Optional[date],
+    search: Optional[str]
+):
+    """Select of the exported columns of tasks matching the list filters"""
+    stmt = select(
+        Task.id,
+        Task.title,
+        Task.description,
+        Task.status,
+        Task.priority,
+        Task.due_date,
+        Task.employee_id,
+        Task.created_at,
+        Task.updated_at
+    )
+    stmt, _ = apply_task_filters(
+        stmt, status, priority, employee_id, due_before, due_after, search, bind=engine
+    )
+    return stmt.order_by(Task.id)
+
+
+@router.get("/export", response_class=StreamingResponse, responses=EXPORT_RESPONSES)
+def export_tasks(
+    fmt: Literal["ndjson", "csv"] = Query("ndjson", alias="format", description="Output format"),
+    status: Optional[TaskStatus] = Query(None, description="Filter by status"),
+    priority: Optional[TaskPriority] = Query(None, description="Filter by priority"),
+    employee_id: Optional[int] = Query(None, description="Filter by assigned employee"),
+    due_before: Optional[date] = Query(None, description="Filter tasks due before date"),
+    due_after: Optional[date] = Query(None, description="Filter tasks due after date"),
+    search: Optional[str] = Query(None, description="Search by title or description (prefix match)")
+):
+    """
+    Stream all tasks matching the list filters as NDJSON or CSV
+    """
+    return export_response(
+        task_export_query(status, priority, employee_id, due_before, due_after, search), fmt, "tasks"
+    )
+
+
+@router.get("/changes", response_model=Changes[TaskResponse])
+def task_changes(
+    since: Optional[str] = Query(None, description="next_since from the previous call (empty for a full sync)"),
+    limit: int = Query(500, ge=1, le=1000, description="Maximum rows and deletions returned"),
+    db: Session = Depends(get_db)
+):
+    """
+    Tasks created, updated or deleted since a sync token
+    Costs O(changes); rows carry employee_id only, assignee details come
+    from /api/employees/changes
+    """
+    return json_response(changes_page(db, "tasks", TASK_CHANGE_ROWS, Task, since, limit))
+
+
+def due_tasks_query(
+    due_from: Optional[date],
+    due_to: date,
+    employee_id: Optional[int],
+    cursor: Optional[str],
+    page_size: int
+):
+    """
+    Select of a keyset page (plus one extra row) of open tasks due between
+    due_from and due_to (inclusive), earliest first, read from the partial
+    index on open tasks' due dates
+    """
+    query = (
+        select(*TASK_ROWS.columns)
+        .select_from(Task)
+        .outerjoin(Employee, Task.employee_id == Employee.id)
+        .filter(Task.status != TaskStatus.DONE, Task.due_date <= due_to)
+        .order_by(Task.due_date, Task.id)
+    )
+    if due_from is not None:
+        query = query.filter(Task.due_date >= due_from)
+    if employee_id is not None:
+        query = query.filter(Task.employee_id == employee_id)
+    
+    # Own cursor kind: list cursors ordered by due_date may carry null dates
+    last_key = decode_cursor(cursor, "tasks.due", (key_date, key_int))
+    if last_key is not None:
+        query = query.filter(tuple_(Task.due_date, Task.id) > tuple_(*last_key))
+    return query.limit(page_size + 1)
+
+
+def due_tasks_response(request: Request, key: str, tags: List[str], tasks: List[dict], page_size: int) -> Response:
+    """
+    Encode and cache a page read with due_tasks_query, or answer 304 when
+    If-None-Match matches the ETag of its rows
+    """
+    # The extra row decides next_cursor, so it is part of the validator
+    validator = page_validator(key, tasks)
+    if is_fresh(request, validator.headers()):
+        return not_modified(validator.headers())
+    next_cursor = None
+    if len(tasks) > page_size:
+        tasks = tasks[:page_size]
+        next_cursor = encode_cursor("tasks.due", [tasks[-1]["due_date"], tasks[-1]["id"]])
+    
+    with timed_serialization():
+        body = dumps(page_body(tasks, next_cursor))
+    return response_cache.store_body(key, body, tags, validator)
+
+
+def due_tasks_page(
+    db: Session,
+    request: Request,
+    route: str,
+    due_from: Optional[date],
+    due_to: date,
+    employee_id: Optional[int],
+    cursor: Optional[str],
+    page_size: int
+) -> Response:
+    """Keyset page of open tasks due between due_from and due_to (see due_tasks_query)"""
+    key = cache_key(route, due_from=due_from, due_to=due_to, employee_id=employee_id, cursor=cursor, page_size=page_size)
+    cached = response_cache.lookup(key, request)
+    if cached:
+        return cached
+    
+    query = due_tasks_query(due_from, due_to, employee_id, cursor, page_size)
+    tasks = TASK_ROWS.dicts(db.execute(query))
+    return due_tasks_response(request, key, task_list_tags(employee_id), tasks, page_size)
+
+
+@router.get("/overdue", response_model=Page[TaskWithEmployee])
+def list_overdue_tasks(
+    request: Request,
+    employee_id: Optional[int] = Query(None, description="Filter by assigned employee"),
+    page_size: int = Query(50, ge=1, le=100, description="Items per page"),
+    cursor: Optional[str] = Query(None, description="Keyset cursor from next_cursor (empty for the first page)"),
+    db: Session = Depends(get_db)
+):
+    """
+    Open tasks whose due date has passed, most overdue first
+    """
+    yesterday = date.today() - timedelta(days=1)
+    return due_tasks_page(db, request, "tasks.overdue", None, yesterday, employee_id, cursor, page_size)
+
+
+@router.get("/due-soon", response_model=Page[TaskWithEmployee])
+def list_due_soon_tasks(
+    request: Request,
+    days: int = Query(7, ge=0, le=365, description="Look-ahead window in days from today"),
+    employee_id: Optional[int] = Query(None, description="Filter by assigned employee"),
+    page_size: int = Query(50, ge=1, le=100, description="Items per page"),
+    cursor: Optional[str] = Query(None, description="Keyset cursor from next_cursor (empty for the first page)"),
+    db: Session = Depends(get_db)
+):
+    """
+    Open tasks due between today and today + days, soonest first
+    """
+    today = date.today()
+    return due_tasks_page(db, request, "tasks.due_soon", today, today + timedelta(days=days), employee_id, cursor, page_size)
+
+
+def task_detail_query(task_id: int):
+    """Select of a task with its assignee loaded"""
+    return select(Task).options(*TaskWithEmployee.load_options).where(Task.id == task_id)
+
+
+def task_detail_response(key: str, task: Task, validator: Validator) -> Response:
+    tags = [f"task:{task.id}"]
+    if task.employee_id is not None:
+        # Embedded employee summary changes with the employee
+        tags.append(f"employee-ref:{task.employee_id}")
+    return response_cache.store(key, TaskWithEmployee, task, tags, validator)
 
 
 @router.get("/{task_id}", response_model=TaskWithEmployee)
 def get_task(
     task_id: int,
+    request: Request,
     db: Session = Depends(get_db)
 ):
     """
     Get single task by ID with employee information if assigned
+    Supports If-None-Match / If-Modified-Since (304 Not Modified)
     """
-    task = db.query(Task).filter(Task.id == task_id).first()
+    key = cache_key("tasks.get", task_id=task_id)
+    cached = response_cache.lookup(key, request)
+    if cached:
+        return cached
+    
+    validator = task_validator(db, task_id)
+    if validator is None:
+        raise HTTPException(status_code=404, detail="Task not found")
+    if is_fresh(request, validator.headers()):
+        return not_modified(validator.headers())
+    
+    task = db.execute(task_detail_query(task_id)).scalars().first()
     
     if not task:
         raise HTTPException(status_code=404, detail="Task not found")
     
-    return task
+    return task_detail_response(key, task, validator)
+
+
+def employee_missing(employee_id: int) -> HTTPException:
+    return HTTPException(status_code=400, detail=f"Employee with ID {employee_id} not found")
+
+
+def new_task(task_data: TaskCreate) -> Task:
+    return Task(
+        title=task_data.title,
+        description=task_data.description,
+        status=task_data.status,
+        priority=task_data.priority,
+        due_date=task_data.due_date,
+        employee_id=task_data.employee_id
+    )
 
 
 @router.post("", response_model=TaskResponse, status_code=201)
@@ -87,61 +509,276 @@ def create_task(
     if task_data.employee_id:
         employee = db.query(Employee).filter(Employee.id == task_data.employee_id).first()
         if not employee:
-            raise HTTPException(
-                status_code=400,
-                detail=f"Employee with ID {task_data.employee_id} not found"
-            )
-    
-    # Create new task
-    task = Task(
-        title=task_data.title,
-        description=task_data.description,
-        status=task_data.status,
-        priority=task_data.priority,
-        due_date=task_data.due_date,
-        employee_id=task_data.employee_id
-    )
+            raise employee_missing(task_data.employee_id)
     
+    task = new_task(task_data)
     db.add(task)
+    refresh_workloads(db, [task.employee_id])
     db.commit()
     db.refresh(task)
+    invalidate_tasks([task.id], [task.employee_id])
+    publish_tasks(db, "task.created", [task.id], [task.employee_id])
     
     return task
 
 
+class TaskBulkPlan:
+    """
+    Validated rows of a bulk task request, by operation
+    known_employees holds the existing employees among bulk_employee_ids(),
+    known_tasks maps the existing tasks among bulk_task_ids() to their assignee
+    """
+
+    def __init__(self, bulk_data: TaskBulkRequest, known_employees: set, known_tasks: dict):
+        self.report = report = BulkReport(bulk_data.mode)
+        self.known_tasks = known_tasks
+        
+        self.create_rows, self.create_indexes = [], []
+        for index, item in enumerate(bulk_data.create):
+            if item.employee_id and item.employee_id not in known_employees:
+                report.fail("create", index, f"Employee with ID {item.employee_id} not found")
+                continue
+            self.create_rows.append(item.model_dump())
+            self.create_indexes.append(index)
+        
+        now = datetime.utcnow()
+        self.update_rows, self.update_indexes = [], []
+        for index, item in enumerate(bulk_data.update):
+            data = item.model_dump(exclude_unset=True)
+            if item.id not in known_tasks:
+                report.fail("update", index, "Task not found", item.id)
+            elif data.get("employee_id") and data["employee_id"] not in known_employees:
+                report.fail("update", index, f"Employee with ID {data['employee_id']} not found", item.id)
+            else:
+                data["updated_at"] = now
+                self.update_rows.append(data)
+                self.update_indexes.append(index)
+        
+        self.delete_ids, self.delete_indexes, seen_ids = [], [], set()
+        for index, task_id in enumerate(bulk_data.delete):
+            if task_id not in known_tasks:
+                report.fail("delete", index, "Task not found", task_id)
+                continue
+            if task_id in seen_ids:
+                report.fail("delete", index, "Duplicate task ID", task_id)
+                continue
+            seen_ids.add(task_id)
+            self.delete_ids.append(task_id)
+            self.delete_indexes.append(index)
+        
+        report.check()
+    
+    @staticmethod
+    def bulk_employee_ids(bulk_data: TaskBulkRequest) -> list:
+        return [item.employee_id for item in bulk_data.create + bulk_data.update]
+    
+    @staticmethod
+    def bulk_task_ids(bulk_data: TaskBulkRequest) -> list:
+        return [item.id for item in bulk_data.update] + bulk_data.delete
+    
+    @property
+    def affected_employees(self) -> list:
+        """Assignees before and after the change, for workloads and cache invalidation"""
+        known_tasks = self.known_tasks
+        return (
+            [row["employee_id"] for row in self.create_rows]
+            + [row.get("employee_id") for row in self.update_rows]
+            + [known_tasks[row["id"]] for row in self.update_rows]
+            + [known_tasks[task_id] for task_id in self.delete_ids]
+        )
+    
+    def applied(self, new_ids) -> None:
+        """Report every planned item as done, given the IDs of the created rows"""
+        for index, task_id in zip(self.create_indexes, new_ids):
+            self.report.ok("create", index, task_id)
+        for index, row in zip(self.update_indexes, self.update_rows):
+            self.report.ok("update", index, row["id"])
+        for index, task_id in zip(self.delete_indexes, self.delete_ids):
+            self.report.ok("delete", index, task_id)
+    
+    @property
+    def changed_ids(self) -> list:
+        return [r["id"] for r in self.report.results if r["success"]]
+
+
+@router.post("/bulk", response_model=BulkResult)
+def bulk_tasks(
+    bulk_data: TaskBulkRequest,
+    db: Session = Depends(get_db)
+):
+    """
+    Create, update and delete many tasks in one transaction
+    Foreign keys and task IDs are validated with set-based queries; in atomic
+    mode any invalid item rejects the request, in partial mode valid items
+    are applied and invalid ones reported
+    """
+    # Validate referenced employees and tasks in one pass each
+    known_employees = existing_values(db, Employee.id, TaskBulkPlan.bulk_employee_ids(bulk_data))
+    # Current assignee of each referenced task, for validation and cache invalidation
+    known_tasks = existing_pairs(db, Task.id, Task.employee_id, TaskBulkPlan.bulk_task_ids(bulk_data))
+    plan = TaskBulkPlan(bulk_data, known_employees, known_tasks)
+    
+    # Apply all writes in a single transaction
+    new_ids = []
+    if plan.create_rows:
+        new_ids = db.execute(
+            insert(Task).returning(Task.id, sort_by_parameter_order=True),
+            plan.create_rows
+        ).scalars().all()
+    
+    if plan.update_rows:
+        db.execute(update(Task), plan.update_rows)
+    
+    for chunk in chunked(plan.delete_ids):
+        record_deletions(db, "tasks", Task.id, Task.id.in_(chunk))
+        db.execute(delete(Task).where(Task.id.in_(chunk)))
+    
+    refresh_workloads(db, plan.affected_employees)
+    
+    db.commit()
+    plan.applied(new_ids)
+    
+    invalidate_tasks(plan.changed_ids, plan.affected_employees)
+    if plan.changed_ids:
+        publish_tasks(db, "task.bulk", plan.changed_ids, plan.affected_employees)
+    
+    return plan.report.to_result(committed=True)
+
+
+def auto_assign_queries(assign_data: TaskAutoAssign, today: date):
+    """Selects of the (id, weight) of the unassigned open tasks to assign, one per chunk of task_ids"""
+    candidates = select(Task.id, weight_expression(today)).where(
+        Task.employee_id.is_(None), Task.status != TaskStatus.DONE
+    )
+    if assign_data.task_ids is None:
+        yield candidates.order_by(Task.id).limit(MAX_AUTO_ASSIGN_TASKS)
+        return
+    for chunk in chunked(list(dict.fromkeys(assign_data.task_ids))):
+        yield candidates.where(Task.id.in_(chunk))
+
+
+def unavailable_tasks(assign_data: TaskAutoAssign, tasks) -> List[int]:
+    """Requested task IDs that auto_assign_queries did not find"""
+    if assign_data.task_ids is None:
+        return []
+    found = {row[0] for row in tasks}
+    return [task_id for task_id in dict.fromkeys(assign_data.task_ids) if task_id not in found]
+
+
+def no_active_employees() -> HTTPException:
+    return HTTPException(status_code=400, detail="No active employees to assign tasks to")
+
+
+def assignment_update(assignments):
+    """
+    Statement and parameters writing (task id, employee id) assignments to
+    tasks that are still unassigned
+    A Core executemany skips the per-row bookkeeping of ORM bulk updates,
+    about half the cost at tens of thousands of rows
+    """
+    tasks_table = Task.__table__
+    return (
+        update(tasks_table)
+        .where(tasks_table.c.id == bindparam("task_id"), tasks_table.c.employee_id.is_(None))
+        .values(employee_id=bindparam("assignee"), updated_at=datetime.utcnow()),
+        [{"task_id": task_id, "assignee": employee_id} for task_id, employee_id in assignments]
+    )
+
+
+def auto_assign_response(committed: bool, assignments, skipped: List[int]) -> Response:
+    return json_response({
+        "committed": committed,
+        "assigned": len(assignments) if committed else 0,
+        "skipped": skipped,
+        "assignments": [{"task_id": t, "employee_id": e} for t, e in assignments],
+    })
+
+
+@router.post("/auto-assign", response_model=AutoAssignResult)
+def auto_assign_tasks(
+    assign_data: TaskAutoAssign,
+    db: Session = Depends(get_db)
+):
+    """
+    Assign unassigned open tasks to active employees, balancing their load
+    Tasks weigh their priority, more when due within a week; each goes to
+    the least-loaded employee, counting the open tasks they already have.
+    All assignments are written in one transaction
+    """
+    today = date.today()
+    tasks = []
+    for query in auto_assign_queries(assign_data, today):
+        tasks += db.execute(query).all()
+    skipped = unavailable_tasks(assign_data, tasks)
+    
+    loads = employee_loads(db, today, assign_data.department)
+    if tasks and not loads:
+        raise no_active_employees()
+    assignments = balance(tasks, loads)
+    
+    committed = False
+    if assignments and not assign_data.dry_run:
+        result = db.execute(*assignment_update(assignments))
+        # Tasks assigned by someone else since they were read keep that
+        # assignee; rowcount is -1 where the driver does not report it
+        if result.rowcount != len(assignments):
+            current = existing_pairs(db, Task.id, Task.employee_id, [task_id for task_id, _ in assignments])
+            lost = {task_id for task_id, employee_id in assignments if current.get(task_id) != employee_id}
+            skipped += sorted(lost)
+            assignments = [pair for pair in assignments if pair[0] not in lost]
+        employee_ids = {employee_id for _, employee_id in assignments}
+        refresh_workloads(db, employee_ids, today)
+        db.commit()
+        committed = True
+        
+        task_ids = [task_id for task_id, _ in assignments]
+        invalidate_tasks(task_ids, employee_ids)
+        publish_tasks(db, "task.assigned", task_ids, employee_ids)
+    
+    return auto_assign_response(committed, assignments, skipped)
+
+
 @router.put("/{task_id}", response_model=TaskResponse)
 def update_task(
     task_id: int,
     task_data: TaskUpdate,
+    request: Request,
+    response: Response,
     db: Session = Depends(get_db)
 ):
     """
     Full update of a task
+    Honors If-Match with the task's ETag (412 if it changed)
     """
     task = db.query(Task).filter(Task.id == task_id).first()
     
     if not task:
         raise HTTPException(status_code=404, detail="Task not found")
     
+    check_if_match(request, lambda: task_validator(db, task_id))
+    
     # Update fields
     update_data = task_data.model_dump(exclude_unset=True)
     
+    previous_employee_id = task.employee_id
+    
     # Validate employee_id if being updated
     if "employee_id" in update_data and update_data["employee_id"]:
         employee = db.query(Employee).filter(Employee.id == update_data["employee_id"]).first()
         if not employee:
-            raise HTTPException(
-                status_code=400,
-                detail=f"Employee with ID {update_data['employee_id']} not found"
-            )
+            raise employee_missing(update_data["employee_id"])
     
     for key, value in update_data.items():
         setattr(task, key, value)
     
     task.updated_at = datetime.utcnow()
     
+    refresh_workloads(db, [previous_employee_id, task.employee_id])
     db.commit()
     db.refresh(task)
+    invalidate_tasks([task.id], [previous_employee_id, task.employee_id])
+    publish_tasks(db, "task.updated", [task.id], [previous_employee_id, task.employee_id])
+    response.headers.update(task_validator(db, task.id).headers())
     
     return task
 
@@ -150,29 +787,39 @@ def update_task(
 def partial_update_task(
     task_id: int,
     task_data: TaskUpdate,
+    request: Request,
+    response: Response,
     db: Session = Depends(get_db)
 ):
     """
     Partial update of a task
     """
-    return update_task(task_id, task_data, db)
+    return update_task(task_id, task_data, request, response, db)
 
 
 @router.delete("/{task_id}", status_code=204)
 def delete_task(
     task_id: int,
+    request: Request,
     db: Session = Depends(get_db)
 ):
     """
     Delete a task
+    Honors If-Match with the task's ETag (412 if it changed)
     """
     task = db.query(Task).filter(Task.id == task_id).first()
     
     if not task:
         raise HTTPException(status_code=404, detail="Task not found")
     
+    check_if_match(request, lambda: task_validator(db, task_id))
+    
+    record_deletions(db, "tasks", Task.id, Task.id == task_id)
     db.delete(task)
+    refresh_workloads(db, [task.employee_id])
     db.commit()
+    invalidate_tasks([task_id], [task.employee_id])
+    publish_tasks(db, "task.deleted", [task_id], [task.employee_id])
     
     return None
 
@@ -181,28 +828,35 @@ def delete_task(
 def assign_task(
     task_id: int,
     assign_data: TaskAssign,
+    request: Request,
+    response: Response,
     db: Session = Depends(get_db)
 ):
     """
     Assign a task to an employee
+    Honors If-Match with the task's ETag (412 if it changed)
     """
     task = db.query(Task).filter(Task.id == task_id).first()
     
     if not task:
         raise HTTPException(status_code=404, detail="Task not found")
     
+    check_if_match(request, lambda: task_validator(db, task_id))
+    
     employee = db.query(Employee).filter(Employee.id == assign_data.employee_id).first()
     if not employee:
-        raise HTTPException(
-            status_code=400,
-            detail=f"Employee with ID {assign_data.employee_id} not found"
-        )
+        raise employee_missing(assign_data.employee_id)
     
+    previous_employee_id = task.employee_id
     task.employee_id = assign_data.employee_id
     task.updated_at = datetime.utcnow()
     
+    refresh_workloads(db, [previous_employee_id, task.employee_id])
     db.commit()
     db.refresh(task)
+    invalidate_tasks([task.id], [previous_employee_id, task.employee_id])
+    publish_tasks(db, "task.assigned", [task.id], [previous_employee_id, task.employee_id])
+    response.headers.update(task_validator(db, task.id).headers())
     
     return task
 
@@ -210,20 +864,30 @@ def assign_task(
 @router.post("/{task_id}/unassign", response_model=TaskResponse)
 def unassign_task(
     task_id: int,
+    request: Request,
+    response: Response,
     db: Session = Depends(get_db)
 ):
     """
     Unassign a task (remove employee assignment)
+    Honors If-Match with the task's ETag (412 if it changed)
     """
     task = db.query(Task).filter(Task.id == task_id).first()
     
     if not task:
         raise HTTPException(status_code=404, detail="Task not found")
     
+    check_if_match(request, lambda: task_validator(db, task_id))
+    
+    previous_employee_id = task.employee_id
     task.employee_id = None
     task.updated_at = datetime.utcnow()
     
+    refresh_workloads(db, [previous_employee_id])
     db.commit()
     db.refresh(task)
+    invalidate_tasks([task.id], [previous_employee_id])
+    publish_tasks(db, "task.unassigned", [task.id], [previous_employee_id])
+    response.headers.update(task_validator(db, task.id).headers())
     
     return task
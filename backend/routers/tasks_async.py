@@ -0,0 +1,480 @@
+"""
+Task router on an AsyncSession (DB_ASYNC)
+Same routes and behaviour as routers.tasks, as async def handlers that
+await their queries on the event loop; statements and response bodies come
+from the builders in routers.tasks
+"""
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi.responses import StreamingResponse
+from sqlalchemy import delete, insert, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Literal, Optional, Union
+from datetime import date, timedelta, datetime
+
+from assignment import balance, employee_loads_async
+from bulk import chunked, existing_pairs_async, existing_values_async
+from cache import cache_key, response_cache
+from changes import changes_page_async, record_deletions_async
+from conditional import Validator, check_if_match_async, is_fresh, not_modified
+from database import get_async_db
+from events import broker
+from export import EXPORT_RESPONSES, export_response
+from serialization import json_response
+from workload import refresh_workloads_async
+from models.task import Task, TaskStatus, TaskPriority
+from models.employee import Employee
+from routers.tasks import (
+    TASK_CHANGE_ROWS,
+    TASK_ROWS,
+    TaskBulkPlan,
+    assignment_update,
+    auto_assign_queries,
+    auto_assign_response,
+    due_tasks_query,
+    due_tasks_response,
+    employee_missing,
+    invalidate_tasks,
+    new_task,
+    no_active_employees,
+    task_count_query,
+    task_detail_query,
+    task_detail_response,
+    task_export_query,
+    task_list_query,
+    task_list_response,
+    task_list_tags,
+    task_validator_from_row,
+    task_validator_query,
+    unavailable_tasks
+)
+from schemas.task import (
+    TaskCreate,
+    TaskUpdate,
+    TaskResponse,
+    TaskWithEmployee,
+    TaskAssign,
+    TaskBulkRequest,
+    TaskAutoAssign,
+    AutoAssignResult
+)
+from schemas.bulk import BulkResult
+from schemas.pagination import Changes, CountedPage, Page
+
+router = APIRouter()
+
+
+async def publish_tasks(db: AsyncSession, event_type: str, task_ids, employee_ids=()):
+    """Announce committed task changes on the change feed, with the assignees' departments"""
+    departments = (await existing_pairs_async(db, Employee.id, Employee.department, employee_ids)).values()
+    broker.publish(event_type, task_ids, employee_ids, departments)
+
+
+async def task_validator(db: AsyncSession, task_id: int) -> Optional[Validator]:
+    """Validator of a task's detail representation; None if the task does not exist"""
+    return task_validator_from_row(task_id, (await db.execute(task_validator_query(task_id))).first())
+
+
+async def find_task(db: AsyncSession, task_id: int) -> Task:
+    task = await db.get(Task, task_id)
+    if not task:
+        raise HTTPException(status_code=404, detail="Task not found")
+    return task
+
+
+async def require_employee(db: AsyncSession, employee_id: int) -> None:
+    if await db.get(Employee, employee_id) is None:
+        raise employee_missing(employee_id)
+
+
+@router.get("", response_model=Union[List[TaskWithEmployee], Page[TaskWithEmployee], CountedPage[TaskWithEmployee]])
+async def list_tasks(
+    request: Request,
+    status: Optional[TaskStatus] = Query(None, description="Filter by status"),
+    priority: Optional[TaskPriority] = Query(None, description="Filter by priority"),
+    employee_id: Optional[int] = Query(None, description="Filter by assigned employee"),
+    due_before: Optional[date] = Query(None, description="Filter tasks due before date"),
+    due_after: Optional[date] = Query(None, description="Filter tasks due after date"),
+    search: Optional[str] = Query(None, description="Search by title or description (prefix match)"),
+    page: int = Query(1, ge=1, description="Page number"),
+    page_size: int = Query(50, ge=1, le=100, description="Items per page"),
+    cursor: Optional[str] = Query(None, description="Keyset cursor from next_cursor (empty for the first page); returns a page envelope"),
+    order_by: Literal["id", "due_date"] = Query("id", description="Sort key"),
+    include_total: bool = Query(False, description="Return a page envelope with total and has_more"),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    Get list of tasks with optional filters and pagination
+    Uses page/page_size offsets, or constant-cost keyset pages when cursor is given
+    include_total adds one count over the filtered set; other pages cost only their rows
+    Answers 304 when If-None-Match matches the ETag of the page's rows
+    """
+    key = cache_key(
+        "tasks.list", status=status, priority=priority, employee_id=employee_id,
+        due_before=due_before, due_after=due_after, search=search, page=page,
+        page_size=page_size, cursor=cursor, order_by=order_by, include_total=include_total or None
+    )
+    cached = response_cache.lookup(key, request)
+    if cached:
+        return cached
+    
+    bind = db.get_bind()
+    filters = (status, priority, employee_id, due_before, due_after, search)
+    query = task_list_query(bind, *filters, page, page_size, cursor, order_by)
+    total = None
+    if include_total:
+        total = (await db.execute(task_count_query(bind, *filters))).scalar()
+    tasks = TASK_ROWS.dicts(await db.execute(query))
+    return task_list_response(
+        request, key, task_list_tags(employee_id), tasks, total, page, page_size, cursor, order_by
+    )
+
+
+@router.get("/export", response_class=StreamingResponse, responses=EXPORT_RESPONSES)
+async def export_tasks(
+    fmt: Literal["ndjson", "csv"] = Query("ndjson", alias="format", description="Output format"),
+    status: Optional[TaskStatus] = Query(None, description="Filter by status"),
+    priority: Optional[TaskPriority] = Query(None, description="Filter by priority"),
+    employee_id: Optional[int] = Query(None, description="Filter by assigned employee"),
+    due_before: Optional[date] = Query(None, description="Filter tasks due before date"),
+    due_after: Optional[date] = Query(None, description="Filter tasks due after date"),
+    search: Optional[str] = Query(None, description="Search by title or description (prefix match)")
+):
+    """
+    Stream all tasks matching the list filters as NDJSON or CSV
+    """
+    query = task_export_query(status, priority, employee_id, due_before, due_after, search)
+    return export_response(query, fmt, "tasks", is_async=True)
+
+
+@router.get("/changes", response_model=Changes[TaskResponse])
+async def task_changes(
+    since: Optional[str] = Query(None, description="next_since from the previous call (empty for a full sync)"),
+    limit: int = Query(500, ge=1, le=1000, description="Maximum rows and deletions returned"),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    Tasks created, updated or deleted since a sync token
+    Costs O(changes); rows carry employee_id only, assignee details come
+    from /api/employees/changes
+    """
+    return json_response(await changes_page_async(db, "tasks", TASK_CHANGE_ROWS, Task, since, limit))
+
+
+async def due_tasks_page(
+    db: AsyncSession,
+    request: Request,
+    route: str,
+    due_from: Optional[date],
+    due_to: date,
+    employee_id: Optional[int],
+    cursor: Optional[str],
+    page_size: int
+) -> Response:
+    """Keyset page of open tasks due between due_from and due_to (see due_tasks_query)"""
+    key = cache_key(route, due_from=due_from, due_to=due_to, employee_id=employee_id, cursor=cursor, page_size=page_size)
+    cached = response_cache.lookup(key, request)
+    if cached:
+        return cached
+    
+    query = due_tasks_query(due_from, due_to, employee_id, cursor, page_size)
+    tasks = TASK_ROWS.dicts(await db.execute(query))
+    return due_tasks_response(request, key, task_list_tags(employee_id), tasks, page_size)
+
+
+@router.get("/overdue", response_model=Page[TaskWithEmployee])
+async def list_overdue_tasks(
+    request: Request,
+    employee_id: Optional[int] = Query(None, description="Filter by assigned employee"),
+    page_size: int = Query(50, ge=1, le=100, description="Items per page"),
+    cursor: Optional[str] = Query(None, description="Keyset cursor from next_cursor (empty for the first page)"),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    Open tasks whose due date has passed, most overdue first
+    """
+    yesterday = date.today() - timedelta(days=1)
+    return await due_tasks_page(db, request, "tasks.overdue", None, yesterday, employee_id, cursor, page_size)
+
+
+@router.get("/due-soon", response_model=Page[TaskWithEmployee])
+async def list_due_soon_tasks(
+    request: Request,
+    days: int = Query(7, ge=0, le=365, description="Look-ahead window in days from today"),
+    employee_id: Optional[int] = Query(None, description="Filter by assigned employee"),
+    page_size: int = Query(50, ge=1, le=100, description="Items per page"),
+    cursor: Optional[str] = Query(None, description="Keyset cursor from next_cursor (empty for the first page)"),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    Open tasks due between today and today + days, soonest first
+    """
+    today = date.today()
+    return await due_tasks_page(
+        db, request, "tasks.due_soon", today, today + timedelta(days=days), employee_id, cursor, page_size
+    )
+
+
+@router.get("/{task_id}", response_model=TaskWithEmployee)
+async def get_task(
+    task_id: int,
+    request: Request,
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    Get single task by ID with employee information if assigned
+    Supports If-None-Match / If-Modified-Since (304 Not Modified)
+    """
+    key = cache_key("tasks.get", task_id=task_id)
+    cached = response_cache.lookup(key, request)
+    if cached:
+        return cached
+    
+    validator = await task_validator(db, task_id)
+    if validator is None:
+        raise HTTPException(status_code=404, detail="Task not found")
+    if is_fresh(request, validator.headers()):
+        return not_modified(validator.headers())
+    
+    task = (await db.execute(task_detail_query(task_id))).scalars().first()
+    
+    if not task:
+        raise HTTPException(status_code=404, detail="Task not found")
+    
+    return task_detail_response(key, task, validator)
+
+
+@router.post("", response_model=TaskResponse, status_code=201)
+async def create_task(
+    task_data: TaskCreate,
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    Create a new task
+    """
+    if task_data.employee_id:
+        await require_employee(db, task_data.employee_id)
+    
+    task = new_task(task_data)
+    db.add(task)
+    await refresh_workloads_async(db, [task.employee_id])
+    await db.commit()
+    await db.refresh(task)
+    invalidate_tasks([task.id], [task.employee_id])
+    await publish_tasks(db, "task.created", [task.id], [task.employee_id])
+    
+    return task
+
+
+@router.post("/bulk", response_model=BulkResult)
+async def bulk_tasks(
+    bulk_data: TaskBulkRequest,
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    Create, update and delete many tasks in one transaction
+    Foreign keys and task IDs are validated with set-based queries; in atomic
+    mode any invalid item rejects the request, in partial mode valid items
+    are applied and invalid ones reported
+    """
+    # Validate referenced employees and tasks in one pass each
+    known_employees = await existing_values_async(db, Employee.id, TaskBulkPlan.bulk_employee_ids(bulk_data))
+    # Current assignee of each referenced task, for validation and cache invalidation
+    known_tasks = await existing_pairs_async(db, Task.id, Task.employee_id, TaskBulkPlan.bulk_task_ids(bulk_data))
+    plan = TaskBulkPlan(bulk_data, known_employees, known_tasks)
+    
+    # Apply all writes in a single transaction
+    new_ids = []
+    if plan.create_rows:
+        new_ids = (await db.execute(
+            insert(Task).returning(Task.id, sort_by_parameter_order=True),
+            plan.create_rows
+        )).scalars().all()
+    
+    if plan.update_rows:
+        await db.execute(update(Task), plan.update_rows)
+    
+    for chunk in chunked(plan.delete_ids):
+        await record_deletions_async(db, "tasks", Task.id, Task.id.in_(chunk))
+        await db.execute(delete(Task).where(Task.id.in_(chunk)))
+    
+    await refresh_workloads_async(db, plan.affected_employees)
+    
+    await db.commit()
+    plan.applied(new_ids)
+    
+    invalidate_tasks(plan.changed_ids, plan.affected_employees)
+    if plan.changed_ids:
+        await publish_tasks(db, "task.bulk", plan.changed_ids, plan.affected_employees)
+    
+    return plan.report.to_result(committed=True)
+
+
+@router.post("/auto-assign", response_model=AutoAssignResult)
+async def auto_assign_tasks(
+    assign_data: TaskAutoAssign,
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    Assign unassigned open tasks to active employees, balancing their load
+    Tasks weigh their priority, more when due within a week; each goes to
+    the least-loaded employee, counting the open tasks they already have.
+    All assignments are written in one transaction
+    """
+    today = date.today()
+    tasks = []
+    for query in auto_assign_queries(assign_data, today):
+        tasks += (await db.execute(query)).all()
+    skipped = unavailable_tasks(assign_data, tasks)
+    
+    loads = await employee_loads_async(db, today, assign_data.department)
+    if tasks and not loads:
+        raise no_active_employees()
+    assignments = balance(tasks, loads)
+    
+    committed = False
+    if assignments and not assign_data.dry_run:
+        result = await db.execute(*assignment_update(assignments))
+        # Tasks assigned by someone else since they were read keep that
+        # assignee; rowcount is -1 where the driver does not report it
+        if result.rowcount != len(assignments):
+            current = await existing_pairs_async(
+                db, Task.id, Task.employee_id, [task_id for task_id, _ in assignments]
+            )
+            lost = {task_id for task_id, employee_id in assignments if current.get(task_id) != employee_id}
+            skipped += sorted(lost)
+            assignments = [pair for pair in assignments if pair[0] not in lost]
+        employee_ids = {employee_id for _, employee_id in assignments}
+        await refresh_workloads_async(db, employee_ids, today)
+        await db.commit()
+        committed = True
+    
+        task_ids = [task_id for task_id, _ in assignments]
+        invalidate_tasks(task_ids, employee_ids)
+        await publish_tasks(db, "task.assigned", task_ids, employee_ids)
+    
+    return auto_assign_response(committed, assignments, skipped)
+
+
+async def save_task(
+    db: AsyncSession,
+    task: Task,
+    event_type: str,
+    previous_employee_id: Optional[int],
+    response: Response
+) -> Task:
+    """Commit a changed task, then invalidate, publish and set the new validator headers"""
+    task.updated_at = datetime.utcnow()
+    
+    await refresh_workloads_async(db, [previous_employee_id, task.employee_id])
+    await db.commit()
+    await db.refresh(task)
+    invalidate_tasks([task.id], [previous_employee_id, task.employee_id])
+    await publish_tasks(db, event_type, [task.id], [previous_employee_id, task.employee_id])
+    response.headers.update((await task_validator(db, task.id)).headers())
+    
+    return task
+
+
+@router.put("/{task_id}", response_model=TaskResponse)
+async def update_task(
+    task_id: int,
+    task_data: TaskUpdate,
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    Full update of a task
+    Honors If-Match with the task's ETag (412 if it changed)
+    """
+    task = await find_task(db, task_id)
+    await check_if_match_async(request, lambda: task_validator(db, task_id))
+    
+    update_data = task_data.model_dump(exclude_unset=True)
+    previous_employee_id = task.employee_id
+    
+    # Validate employee_id if being updated
+    if update_data.get("employee_id"):
+        await require_employee(db, update_data["employee_id"])
+    
+    for key, value in update_data.items():
+        setattr(task, key, value)
+    
+    return await save_task(db, task, "task.updated", previous_employee_id, response)
+
+
+@router.patch("/{task_id}", response_model=TaskResponse)
+async def partial_update_task(
+    task_id: int,
+    task_data: TaskUpdate,
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    Partial update of a task
+    """
+    return await update_task(task_id, task_data, request, response, db)
+
+
+@router.delete("/{task_id}", status_code=204)
+async def delete_task(
+    task_id: int,
+    request: Request,
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    Delete a task
+    Honors If-Match with the task's ETag (412 if it changed)
+    """
+    task = await find_task(db, task_id)
+    await check_if_match_async(request, lambda: task_validator(db, task_id))
+    
+    await record_deletions_async(db, "tasks", Task.id, Task.id == task_id)
+    await db.delete(task)
+    await refresh_workloads_async(db, [task.employee_id])
+    await db.commit()
+    invalidate_tasks([task_id], [task.employee_id])
+    await publish_tasks(db, "task.deleted", [task_id], [task.employee_id])
+    
+    return None
+
+
+@router.post("/{task_id}/assign", response_model=TaskResponse)
+async def assign_task(
+    task_id: int,
+    assign_data: TaskAssign,
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    Assign a task to an employee
+    Honors If-Match with the task's ETag (412 if it changed)
+    """
+    task = await find_task(db, task_id)
+    await check_if_match_async(request, lambda: task_validator(db, task_id))
+    await require_employee(db, assign_data.employee_id)
+    
+    previous_employee_id = task.employee_id
+    task.employee_id = assign_data.employee_id
+    return await save_task(db, task, "task.assigned", previous_employee_id, response)
+
+
+@router.post("/{task_id}/unassign", response_model=TaskResponse)
+async def unassign_task(
+    task_id: int,
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    Unassign a task (remove employee assignment)
+    Honors If-Match with the task's ETag (412 if it changed)
+    """
+    task = await find_task(db, task_id)
+    await check_if_match_async(request, lambda: task_validator(db, task_id))
+    
+    previous_employee_id = task.employee_id
+    task.employee_id = None
+    return await save_task(db, task, "task.unassigned", previous_employee_id, response)
@@ -0,0 +1,91 @@
+"""
+Periodic due-date scanner
+A background task started in the lifespan wakes every
+DUE_SCAN_INTERVAL_SECONDS. Each tick refreshes the workload rows whose
+overdue counts went stale overnight and publishes task.overdue for tasks
+that have passed their due date, at most DUE_SCAN_BATCH rows of each
+"""
+import asyncio
+import logging
+from collections import defaultdict
+from datetime import date, timedelta
+from typing import Dict, List, Optional, Tuple
+
+logger = logging.getLogger("prou.scanner")
+
+# Sorts after every task id, so a starting position skips a whole day
+MAX_ID = 2 ** 63 - 1
+
+
+class DueScanner:
+    """
+    Remembers the (due_date, id) of the last task announced as overdue, so
+    each task is announced once; tasks already overdue when the scanner
+    starts are not announced
+    """
+
+    def __init__(self, batch: int):
+        self.batch = batch
+        self.position: Optional[Tuple[date, int]] = None
+        self.ticks = 0
+        self.refreshed = 0
+        self.announced = 0
+
+    def tick(self, today: Optional[date] = None) -> Tuple[int, int]:
+        """One bounded pass, blocking; returns (workload rows refreshed, tasks announced)"""
+        from sqlalchemy import select, tuple_
+
+        from database import SessionLocal
+        from events import broker
+        from models.employee import Employee
+        from models.task import Task, TaskStatus
+        from models.workload import EmployeeWorkload
+        from workload import refresh_workloads
+
+        today = today or date.today()
+        if self.position is None:
+            self.position = (today - timedelta(days=1), MAX_ID)
+
+        with SessionLocal() as db:
+            stale = db.execute(
+                select(EmployeeWorkload.employee_id)
+                .where(EmployeeWorkload.refreshed_on < today, EmployeeWorkload.next_due_date < today)
+                .limit(self.batch)
+            ).scalars().all()
+            refresh_workloads(db, stale, today)
+            db.commit()
+
+            # Walks the partial index on open tasks from the last position
+            due = db.execute(
+                select(Task.id, Task.due_date, Task.employee_id, Employee.department)
+                .outerjoin(Employee, Task.employee_id == Employee.id)
+                .where(
+                    Task.status != TaskStatus.DONE,
+                    Task.due_date < today,
+                    tuple_(Task.due_date, Task.id) > tuple_(*self.position)
+                )
+                .order_by(Task.due_date, Task.id)
+                .limit(self.batch)
+            ).all()
+
+        by_assignee: Dict[Tuple[Optional[int], Optional[str]], List[int]] = defaultdict(list)
+        for task_id, _, employee_id, department in due:
+            by_assignee[(employee_id, department)].append(task_id)
+        for (employee_id, department), task_ids in by_assignee.items():
+            broker.publish("task.overdue", task_ids, [employee_id], [department])
+        if due:
+            self.position = (due[-1].due_date, due[-1].id)
+
+        self.ticks += 1
+        self.refreshed += len(stale)
+        self.announced += len(due)
+        return len(stale), len(due)
+
+    async def run(self, interval: float) -> None:
+        """Tick every interval seconds off the event loop until cancelled"""
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await asyncio.to_thread(self.tick)
+            except Exception:
+                logger.exception("Due-date scan failed")
@@ -1,35 +1,43 @@
 """
 Pydantic schemas package
+Submodules are imported on first attribute access, so importing one schema
+module does not build the models of every other one
 """
-from schemas.employee import (
-    EmployeeBase,
-    EmployeeCreate,
-    EmployeeUpdate,
-    EmployeeResponse,
-    EmployeeWithTasks
-)
-from schemas.task import (
-    TaskBase,
-    TaskCreate,
-    TaskUpdate,
-    TaskResponse,
-    TaskWithEmployee,
-    TaskAssign
-)
-from schemas.auth import Token, LoginRequest
+from importlib import import_module
 
-__all__ = [
-    "EmployeeBase",
-    "EmployeeCreate",
-    "EmployeeUpdate",
-    "EmployeeResponse",
-    "EmployeeWithTasks",
-    "TaskBase",
-    "TaskCreate",
-    "TaskUpdate",
-    "TaskResponse",
-    "TaskWithEmployee",
-    "TaskAssign",
-    "Token",
-    "LoginRequest"
-]
+_EXPORTS = {
+    "EmployeeBase": "schemas.employee",
+    "EmployeeCreate": "schemas.employee",
+    "EmployeeUpdate": "schemas.employee",
+    "EmployeeResponse": "schemas.employee",
+    "EmployeeWithTasks": "schemas.employee",
+    "EmployeeBulkUpdate": "schemas.employee",
+    "EmployeeBulkRequest": "schemas.employee",
+    "TaskBase": "schemas.task",
+    "TaskCreate": "schemas.task",
+    "TaskUpdate": "schemas.task",
+    "TaskResponse": "schemas.task",
+    "TaskWithEmployee": "schemas.task",
+    "TaskAssign": "schemas.task",
+    "TaskBulkUpdate": "schemas.task",
+    "TaskBulkRequest": "schemas.task",
+    "TaskAutoAssign": "schemas.task",
+    "TaskAssignment": "schemas.task",
+    "AutoAssignResult": "schemas.task",
+    "BulkItemResult": "schemas.bulk",
+    "BulkResult": "schemas.bulk",
+    "Token": "schemas.auth",
+    "LoginRequest": "schemas.auth",
+    "DashboardStats": "schemas.stats",
+    "WorkloadResponse": "schemas.workload",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(_EXPORTS[name]), name)
+    globals()[name] = value
+    return value
@@ -15,3 +15,9 @@ class Token(BaseModel):
     access_token: str
     token_type: str = "bearer"
     user: dict
+
+
+class EventsToken(BaseModel):
+    """Schema for a short-lived /api/events token"""
+    access_token: str
+    expires_in: int
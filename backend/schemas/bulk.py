@@ -0,0 +1,28 @@
+"""
+Pydantic schemas shared by bulk endpoints
+"""
+from pydantic import BaseModel
+from typing import List, Literal, Optional
+
+# Upper bound on items per bulk request
+MAX_BULK_ITEMS = 10000
+
+BulkMode = Literal["atomic", "partial"]
+
+
+class BulkItemResult(BaseModel):
+    """Outcome of one item in a bulk request"""
+    op: Literal["create", "update", "delete"]
+    index: int
+    id: Optional[int] = None
+    success: bool
+    error: Optional[str] = None
+
+
+class BulkResult(BaseModel):
+    """Bulk request summary with per-item results"""
+    committed: bool
+    created: int
+    updated: int
+    deleted: int
+    results: List[BulkItemResult]
@@ -2,8 +2,12 @@
 Pydantic schemas for Employee endpoints
 """
 from pydantic import BaseModel, EmailStr, Field, field_validator
+from sqlalchemy.orm import selectinload
 from datetime import datetime, date
-from typing import List, Optional, Literal, Union
+from typing import ClassVar, List, Optional, Literal, Union
+
+from models.employee import Employee
+from schemas.bulk import BulkMode, MAX_BULK_ITEMS
 
 
 class EmployeeBase(BaseModel):
@@ -78,6 +82,9 @@ class EmployeeResponse(BaseModel):
     created_at: datetime
     updated_at: datetime
     
+    # Loader options for queries serialized with this schema
+    load_options: ClassVar[tuple] = ()
+    
     class Config:
         from_attributes = True
 
@@ -98,5 +105,24 @@ class EmployeeWithTasks(EmployeeResponse):
     """Employee response with associated tasks"""
     tasks: List[TaskSummary] = []
     
+    load_options: ClassVar[tuple] = (selectinload(Employee.tasks),)
+    
     class Config:
         from_attributes = True
+
+
+class EmployeeBulkUpdate(EmployeeUpdate):
+    """Partial update of one employee in a bulk request"""
+    id: int = Field(..., description="Employee ID to update")
+
+
+class EmployeeBulkRequest(BaseModel):
+    """Schema for creating, updating and deleting employees in one transaction"""
+    mode: BulkMode = Field(default="atomic", description="atomic: all or nothing, partial: apply valid items")
+    create: List[EmployeeCreate] = Field(default_factory=list, max_length=MAX_BULK_ITEMS)
+    update: List[EmployeeBulkUpdate] = Field(default_factory=list, max_length=MAX_BULK_ITEMS)
+    delete: List[int] = Field(
+        default_factory=list,
+        max_length=MAX_BULK_ITEMS,
+        description="Employee IDs to delete (their tasks are deleted too)"
+    )
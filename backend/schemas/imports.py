@@ -0,0 +1,31 @@
+"""
+Pydantic schemas for import jobs
+"""
+from pydantic import BaseModel
+from datetime import datetime
+from typing import List, Optional
+
+
+class ImportRowError(BaseModel):
+    """Validation or insert error for one input row"""
+    row: int
+    error: str
+
+
+class ImportJobResponse(BaseModel):
+    """Progress of an import job"""
+    id: str
+    resource: str
+    format: str
+    status: str
+    rows_processed: int
+    rows_imported: int
+    rows_failed: int
+    errors: List[ImportRowError]
+    detail: Optional[str] = None
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    
+    class Config:
+        from_attributes = True
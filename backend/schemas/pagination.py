@@ -0,0 +1,27 @@
+"""
+Pydantic schemas for paginated responses
+"""
+from pydantic import BaseModel, Field
+from typing import Generic, List, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class Page(BaseModel, Generic[T]):
+    """Envelope returned by list endpoints in cursor mode"""
+    items: List[T]
+    next_cursor: Optional[str] = Field(None, description="Cursor for the next page, null on the last page")
+
+
+class CountedPage(Page[T], Generic[T]):
+    """Envelope returned by list endpoints with include_total=true"""
+    total: int = Field(..., description="Number of items matching the filters, across all pages")
+    has_more: bool = Field(..., description="Whether pages follow this one")
+
+
+class Changes(BaseModel, Generic[T]):
+    """Response of the incremental sync (/changes) endpoints"""
+    items: List[T] = Field(..., description="Rows created or updated since the token, oldest change first")
+    deleted: List[int] = Field(..., description="IDs deleted since the token; apply before items")
+    next_since: str = Field(..., description="Token for the next call")
+    has_more: bool = Field(..., description="Whether more changes are waiting; call again with next_since")
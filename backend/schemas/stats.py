@@ -0,0 +1,33 @@
+"""
+Pydantic schemas for dashboard statistics
+"""
+from pydantic import BaseModel
+from typing import Dict, List
+
+
+class EmployeeStats(BaseModel):
+    """Employee headcount aggregates"""
+    total: int
+    by_status: Dict[str, int]
+
+
+class TaskStats(BaseModel):
+    """Task aggregates by status and priority"""
+    total: int
+    unassigned: int
+    by_status: Dict[str, int]
+    by_priority: Dict[str, int]
+
+
+class DepartmentStats(BaseModel):
+    """Per-department employee and task counts"""
+    department: str
+    employees: int
+    tasks: int
+
+
+class DashboardStats(BaseModel):
+    """Compact dashboard payload computed with grouped queries"""
+    employees: EmployeeStats
+    tasks: TaskStats
+    departments: List[DepartmentStats]
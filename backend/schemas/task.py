@@ -2,10 +2,12 @@
 Pydantic schemas for Task endpoints
 """
 from pydantic import BaseModel, Field
+from sqlalchemy.orm import joinedload
 from datetime import datetime, date
-from typing import Optional
+from typing import ClassVar, List, Optional
 
-from models.task import TaskStatus, TaskPriority
+from models.task import Task, TaskStatus, TaskPriority
+from schemas.bulk import BulkMode, MAX_BULK_ITEMS
 
 
 class TaskBase(BaseModel):
@@ -39,6 +41,9 @@ class TaskResponse(TaskBase):
     created_at: datetime
     updated_at: datetime
     
+    # Loader options for queries serialized with this schema
+    load_options: ClassVar[tuple] = ()
+    
     class Config:
         from_attributes = True
 
@@ -58,6 +63,8 @@ class TaskWithEmployee(TaskResponse):
     """Task response with employee information"""
     employee: Optional[EmployeeSummary] = None
     
+    load_options: ClassVar[tuple] = (joinedload(Task.employee),)
+    
     class Config:
         from_attributes = True
 
@@ -65,3 +72,44 @@ class TaskWithEmployee(TaskResponse):
 class TaskAssign(BaseModel):
     """Schema for assigning a task to an employee"""
     employee_id: int = Field(..., description="Employee ID to assign task to")
+
+
+class TaskBulkUpdate(TaskUpdate):
+    """Partial update of one task in a bulk request"""
+    id: int = Field(..., description="Task ID to update")
+
+
+class TaskBulkRequest(BaseModel):
+    """Schema for creating, updating and deleting tasks in one transaction"""
+    mode: BulkMode = Field(default="atomic", description="atomic: all or nothing, partial: apply valid items")
+    create: List[TaskCreate] = Field(default_factory=list, max_length=MAX_BULK_ITEMS)
+    update: List[TaskBulkUpdate] = Field(default_factory=list, max_length=MAX_BULK_ITEMS)
+    delete: List[int] = Field(default_factory=list, max_length=MAX_BULK_ITEMS, description="Task IDs to delete")
+
+
+# Upper bound on tasks distributed by one auto-assign request
+MAX_AUTO_ASSIGN_TASKS = 50000
+
+
+class TaskAutoAssign(BaseModel):
+    """Schema for distributing unassigned tasks across active employees"""
+    task_ids: Optional[List[int]] = Field(
+        None, max_length=MAX_AUTO_ASSIGN_TASKS,
+        description="Unassigned open tasks to assign (oldest unassigned open tasks when omitted)"
+    )
+    department: Optional[str] = Field(None, description="Only assign to active employees of this department")
+    dry_run: bool = Field(False, description="Return the assignments without saving them")
+
+
+class TaskAssignment(BaseModel):
+    """One task given to an employee by auto-assign"""
+    task_id: int
+    employee_id: int
+
+
+class AutoAssignResult(BaseModel):
+    """Auto-assign summary"""
+    committed: bool
+    assigned: int
+    skipped: List[int] = Field(description="Requested task IDs that are missing, done or already assigned")
+    assignments: List[TaskAssignment]
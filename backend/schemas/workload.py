@@ -0,0 +1,23 @@
+"""
+Pydantic schemas for employee workload summaries
+"""
+from pydantic import BaseModel
+from typing import Literal, Optional
+from datetime import date
+
+
+class WorkloadResponse(BaseModel):
+    """Open-task summary of one employee, for assigning work"""
+    employee_id: int
+    name: str
+    role: str
+    department: str
+    status: Literal["active", "inactive"]
+    open_tasks: int
+    todo: int
+    in_progress: int
+    low: int
+    medium: int
+    high: int
+    overdue: int
+    next_due_date: Optional[date] = None
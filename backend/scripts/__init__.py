@@ -0,0 +1,3 @@
+"""
+Maintenance, check and benchmark scripts
+"""
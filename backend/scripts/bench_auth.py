@@ -0,0 +1,85 @@
+"""
+Microbenchmark of per-request authentication overhead
+
+Measures the auth dependency on its own (full JWT verification vs the
+decoded-token cache), then whole requests to a protected endpoint with
+the cache on and off, against an unauthenticated endpoint as baseline.
+
+Run from the backend directory:
+    python -m scripts.bench_auth --iterations 100000 --requests 2000
+"""
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+from fastapi.testclient import TestClient
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def per_call_us(fn, iterations: int) -> float:
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return (time.perf_counter() - start) / iterations * 1e6
+
+
+def per_request_us(client: TestClient, path: str, headers: dict, requests: int) -> float:
+    for _ in range(min(requests, 100)):
+        client.get(path, headers=headers)
+    start = time.perf_counter()
+    for _ in range(requests):
+        client.get(path, headers=headers)
+    return (time.perf_counter() - start) / requests * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=100000, help="calls per dependency measurement")
+    parser.add_argument("--requests", type=int, default=2000, help="requests per endpoint measurement")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        # The app only checks the schema version at startup, so bench against
+        # a migrated throwaway database instead of the default one
+        os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(tmp, 'bench_auth.db')}"
+        os.environ.pop("DB_AUTO_MIGRATE", None)
+        os.environ.pop("SEED_ON_STARTUP", None)
+        subprocess.run(
+            [sys.executable, "manage.py", "seed"], cwd=BACKEND_DIR, check=True, capture_output=True
+        )
+        run(args)
+
+
+def run(args):
+    from main import app
+    from security import authenticate, create_access_token, decode_token, token_cache
+
+    token = create_access_token({"email": "bench@prothink.com", "name": "Bench", "role": "Administrator"})
+    headers = {"Authorization": f"Bearer {token}"}
+    ttl = token_cache.ttl
+
+    print("Auth dependency")
+    full = per_call_us(lambda: decode_token(token), args.iterations)
+    authenticate(token)
+    cached = per_call_us(lambda: authenticate(token), args.iterations)
+    print(f"  jwt.decode every call:  {full:8.2f} us")
+    print(f"  cached claims:          {cached:8.2f} us  ({full / cached:.0f}x faster)")
+
+    print("Whole request (TestClient, in process)")
+    with TestClient(app) as client:
+        baseline = per_request_us(client, "/api/health", {}, args.requests)
+        token_cache.ttl = 0
+        uncached = per_request_us(client, "/api/auth/verify", headers, args.requests)
+        token_cache.ttl = ttl
+        cached_request = per_request_us(client, "/api/auth/verify", headers, args.requests)
+    print(f"  no auth (/api/health):  {baseline:8.1f} us")
+    print(f"  auth, cache off:        {uncached:8.1f} us  (+{uncached - baseline:.1f} us)")
+    print(f"  auth, cache on:         {cached_request:8.1f} us  (+{cached_request - baseline:.1f} us)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,147 @@
+"""
+Benchmark auto-assign: weighting and heap balancing of unassigned tasks,
+then the same request end to end against a seeded SQLite database
+
+"compute" is the in-memory greedy heap over weighted tasks; the end-to-end
+run adds fetching the task weights, the load query and the batched write.
+Spread is (max - min) / mean of the final weighted loads.
+
+Run from the backend directory:
+    python -m scripts.bench_auto_assign --tasks 50000 --employees 5000
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+
+from fastapi.testclient import TestClient
+from sqlalchemy import insert, select
+from sqlalchemy.orm import sessionmaker
+
+from assignment import PRIORITY_WEIGHTS, URGENCY, balance, employee_loads
+from database import create_db_engine, get_db
+from main import app
+from migrations import migrate
+from models.employee import Employee
+from models.task import Task, TaskPriority, TaskStatus
+from security import get_current_user
+
+TODAY = date.today()
+
+
+def _synthetic(tasks: int, employees: int, seed: int = 0):
+    """(task id, weight) pairs drawn from the weights auto-assign produces, and starting loads"""
+    rng = random.Random(seed)
+    weights = [
+        weight * factor
+        for weight in PRIORITY_WEIGHTS.values()
+        for factor in [1.0] + [factor for _, factor in URGENCY]
+    ]
+    rows = [(i, rng.choice(weights)) for i in range(1, tasks + 1)]
+    loads = {i: float(rng.randint(0, 20)) for i in range(1, employees + 1)}
+    return rows, loads
+
+
+def _spread(assignments, weights, loads) -> float:
+    final = dict(loads)
+    weight = dict(weights)
+    for task_id, employee_id in assignments:
+        final[employee_id] += weight[task_id]
+    values = list(final.values())
+    return (max(values) - min(values)) / (sum(values) / len(values))
+
+
+def _best(fn, repeat: int):
+    best, result = float("inf"), None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def _seed(engine, tasks: int, employees: int) -> None:
+    rng = random.Random(1)
+    priorities, statuses = list(TaskPriority), [TaskStatus.TODO, TaskStatus.IN_PROGRESS, TaskStatus.DONE]
+    with engine.begin() as conn:
+        conn.execute(insert(Employee), [
+            {"name": f"Employee {i}", "email": f"bench{i}@prothink.com", "role": "Developer",
+             "department": f"Department {i % 10}"}
+            for i in range(employees)
+        ])
+        employee_ids = conn.execute(select(Employee.id)).scalars().all()
+        # Existing assigned work, then the unassigned backlog
+        conn.execute(insert(Task), [
+            {"title": f"Assigned {i}", "priority": rng.choice(priorities), "status": rng.choice(statuses),
+             "due_date": TODAY + timedelta(days=rng.randint(-5, 60)), "employee_id": rng.choice(employee_ids)}
+            for i in range(employees * 2)
+        ])
+        conn.execute(insert(Task), [
+            {"title": f"Backlog {i}", "priority": rng.choice(priorities), "status": TaskStatus.TODO,
+             "due_date": TODAY + timedelta(days=rng.randint(-5, 60)), "employee_id": None}
+            for i in range(tasks)
+        ])
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--tasks", type=int, default=50000)
+    parser.add_argument("--employees", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=5, help="best of this many compute runs")
+    parser.add_argument("--budget-ms", type=float, default=500, help="fail when compute exceeds this")
+    args = parser.parse_args()
+
+    rows, loads = _synthetic(args.tasks, args.employees)
+    elapsed, assignments = _best(lambda: balance(rows, loads), args.repeat)
+    print(
+        f"compute     {args.tasks} tasks x {args.employees} employees: {elapsed * 1000:.0f} ms "
+        f"(spread {_spread(assignments, rows, loads):.3f})"
+    )
+
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_db_engine(f"sqlite:///{os.path.join(tmp, 'bench.db')}")
+        migrate(engine, log=lambda message: None)
+        _seed(engine, args.tasks, args.employees)
+        SessionBench = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+        db = SessionBench()
+        try:
+            start = time.perf_counter()
+            employee_loads(db, TODAY)
+            print(f"load query  {args.employees} employees: {(time.perf_counter() - start) * 1000:.0f} ms")
+        finally:
+            db.close()
+
+        def get_test_db():
+            db = SessionBench()
+            try:
+                yield db
+            finally:
+                db.close()
+
+        app.dependency_overrides[get_db] = get_test_db
+        app.dependency_overrides[get_current_user] = lambda: None
+        try:
+            client = TestClient(app)
+            start = time.perf_counter()
+            response = client.post("/api/tasks/auto-assign", json={})
+            total = time.perf_counter() - start
+        finally:
+            app.dependency_overrides.clear()
+            engine.dispose()
+        body = response.json()
+        if response.status_code != 200 or body["assigned"] != args.tasks:
+            raise SystemExit(f"auto-assign failed: {response.status_code} {str(body)[:200]}")
+        print(f"end to end  {body['assigned']} tasks assigned and committed: {total * 1000:.0f} ms")
+
+    if elapsed * 1000 > args.budget_ms:
+        print(f"FAIL compute took {elapsed * 1000:.0f} ms (budget {args.budget_ms:.0f} ms)")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,92 @@
+"""
+Measure worker cold-start time, before and after versioned migrations
+
+Each run starts a fresh interpreter (like a worker waking up), imports the
+app and runs its startup hooks against an existing, already seeded
+database. Import and startup times are reported separately; the median of
+all runs is printed.
+
+"migrations" is the current startup (one schema version check);
+"create_all" is the previous one, which ran Base.metadata.create_all and
+seed_database() in every worker.
+
+Run from the backend directory:
+    python -m scripts.bench_boot --runs 10
+    python -m scripts.bench_boot --modes migrations
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+WORKER = """
+import asyncio, json, sys, time
+started = time.perf_counter()
+import main
+imported = time.perf_counter()
+
+if sys.argv[1] == "create_all":
+    # Startup before migrations: create missing tables and seed on every boot
+    from database import Base, seed_database
+
+    def create_all_and_seed(bind):
+        import models  # registers every table, as the eager routers used to
+        Base.metadata.create_all(bind=bind)
+        seed_database()
+
+    main.check_schema = create_all_and_seed
+
+async def boot():
+    async with main.app.router.lifespan_context(main.app):
+        pass
+
+asyncio.run(boot())
+print(json.dumps({"import": imported - started, "startup": time.perf_counter() - imported}))
+"""
+
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _run(env: dict, mode: str) -> dict:
+    output = subprocess.run(
+        [sys.executable, "-c", WORKER, mode], env=env, cwd=BACKEND_DIR, check=True, capture_output=True, text=True
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--database-url", help="defaults to a throwaway SQLite file")
+    parser.add_argument("--modes", nargs="+", choices=["create_all", "migrations"], default=["create_all", "migrations"])
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        env = dict(os.environ)
+        env["DATABASE_URL"] = args.database_url or f"sqlite:///{os.path.join(tmp, 'boot.db')}"
+        # Create and seed the database once, outside the measured runs
+        subprocess.run(
+            [sys.executable, "manage.py", "seed"], env=env, cwd=BACKEND_DIR, check=True, capture_output=True
+        )
+        # Interleaved, so both modes see the same machine load
+        runs = {mode: [] for mode in args.modes}
+        for _ in range(args.runs):
+            for mode in args.modes:
+                runs[mode].append(_run(env, mode))
+
+    for mode in args.modes:
+        print(mode)
+        for phase in ("import", "startup"):
+            values = [run[phase] * 1000 for run in runs[mode]]
+            print(f"  {phase:8} median {statistics.median(values):8.1f} ms   min {min(values):8.1f} ms")
+        total = [(run["import"] + run["startup"]) * 1000 for run in runs[mode]]
+        print(f"  {'total':8} median {statistics.median(total):8.1f} ms   min {min(total):8.1f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
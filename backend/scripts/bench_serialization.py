@@ -0,0 +1,136 @@
+"""
+Benchmark list serialization: ORM objects validated into Pydantic models
+versus selected column tuples encoded directly
+
+For each payload size the same rows (tasks with their assignee) are fetched
+and encoded to JSON bytes both ways; rows/sec covers fetching and encoding,
+"encode" only the JSON step.
+
+Run from the backend directory:
+    python -m scripts.bench_serialization --sizes 100 1000 10000
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+from typing import List
+
+from pydantic import TypeAdapter
+from pydantic_core import to_json
+from sqlalchemy.orm import sessionmaker
+
+import serialization
+from database import create_db_engine
+from migrations import migrate
+from models.employee import Employee
+from models.task import Task, TaskPriority, TaskStatus
+from routers.tasks import TASK_ROWS
+from schemas.task import TaskWithEmployee
+
+ADAPTER = TypeAdapter(List[TaskWithEmployee])
+
+
+def _seed(SessionBench, rows: int):
+    db = SessionBench()
+    try:
+        employees = [
+            Employee(name=f"Employee {i}", email=f"bench{i}@prothink.com", role="Developer", department="Engineering")
+            for i in range(max(1, rows // 10))
+        ]
+        db.add_all(employees)
+        db.flush()
+        statuses, priorities = list(TaskStatus), list(TaskPriority)
+        db.add_all(
+            Task(
+                title=f"Task {i}",
+                description=f"Description of task {i}",
+                status=statuses[i % len(statuses)],
+                priority=priorities[i % len(priorities)],
+                due_date=date.today() + timedelta(days=i % 30),
+                employee_id=employees[i % len(employees)].id if i % 5 else None
+            )
+            for i in range(rows)
+        )
+        db.commit()
+    finally:
+        db.close()
+
+
+def orm_models(db) -> bytes:
+    tasks = db.query(Task).options(*TaskWithEmployee.load_options).order_by(Task.id).all()
+    return ADAPTER.dump_json(ADAPTER.validate_python(tasks, from_attributes=True))
+
+
+def column_rows(db, encode=serialization.dumps) -> bytes:
+    rows = (
+        db.query(*TASK_ROWS.columns)
+        .select_from(Task)
+        .outerjoin(Employee, Task.employee_id == Employee.id)
+        .order_by(Task.id)
+    )
+    return encode(TASK_ROWS.dicts(rows))
+
+
+def _best(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1000, 10000])
+    parser.add_argument("--repeat", type=int, default=5, help="best of this many runs")
+    args = parser.parse_args()
+
+    encoder = "orjson" if serialization.orjson is not None else "pydantic_core"
+    paths = [
+        ("ORM + Pydantic models", orm_models, None),
+        (f"columns + {encoder}", column_rows, serialization.dumps),
+        ("columns + pydantic_core", lambda db: column_rows(db, to_json), to_json),
+    ]
+    if encoder == "pydantic_core":
+        paths.pop()
+
+    print(f"{'rows':>6}  {'path':28} {'rows/s':>10} {'encode rows/s':>14}")
+    for size in args.sizes:
+        with tempfile.TemporaryDirectory() as tmp:
+            engine = create_db_engine(f"sqlite:///{os.path.join(tmp, 'bench.db')}")
+            migrate(engine, log=lambda message: None)
+            SessionBench = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+            _seed(SessionBench, size)
+
+            db = SessionBench()
+            try:
+                expected = orm_models(db)
+                tasks = ADAPTER.validate_python(
+                    db.query(Task).options(*TaskWithEmployee.load_options).order_by(Task.id).all(),
+                    from_attributes=True
+                )
+                dicts = TASK_ROWS.dicts(
+                    db.query(*TASK_ROWS.columns).select_from(Task)
+                    .outerjoin(Employee, Task.employee_id == Employee.id).order_by(Task.id)
+                )
+                for name, fetch_and_encode, encode in paths:
+                    if fetch_and_encode(db) != expected:
+                        raise SystemExit(f"{name} produced different JSON than the response model")
+                    # Fresh session per run so the identity map does not cache ORM objects
+                    total = _best(lambda: fetch_and_encode(SessionBench()), args.repeat)
+                    if encode is None:
+                        encoding = _best(lambda: ADAPTER.dump_json(tasks), args.repeat)
+                    else:
+                        encoding = _best(lambda: encode(dicts), args.repeat)
+                    print(f"{size:>6}  {name:28} {size / total:>10.0f} {size / encoding:>14.0f}")
+            finally:
+                db.close()
+                engine.dispose()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,118 @@
+"""
+Check the number of SQL statements emitted per request
+
+Seeds a throwaway SQLite database, calls the list/detail endpoints and
+exits non-zero when any of them exceeds its statement budget (e.g. when a
+relationship falls back to lazy loading).
+
+Run from the backend directory:
+    python -m scripts.check_query_counts
+    DB_ASYNC=true python -m scripts.check_query_counts   # async def routers
+"""
+import asyncio
+import os
+import sys
+import tempfile
+
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import sessionmaker
+
+import config
+from database import Base, create_async_db_engine, create_db_engine, get_async_db, get_db
+from instrumentation import count_queries
+from main import app
+from security import get_current_user
+from models.employee import Employee
+from models.task import Task
+
+EMPLOYEES = 20
+TASKS = 100
+
+# (path, maximum number of statements), including any validator or count query
+BUDGETS = [
+    ("/api/tasks?page_size=100", 1),
+    ("/api/tasks?page_size=10&include_total=true", 2),
+    ("/api/tasks/1", 2),
+    ("/api/employees?page_size=100", 1),
+    ("/api/employees?cursor=&page_size=10&include_total=true", 2),
+    ("/api/employees/1", 3),
+    ("/api/employees/workload", 1),
+    ("/api/tasks/overdue?page_size=100", 1),
+    ("/api/tasks/due-soon?days=30", 1),
+]
+
+
+def _seed(SessionTest):
+    db = SessionTest()
+    try:
+        employees = [
+            Employee(
+                name=f"Employee {i}",
+                email=f"employee{i}@prothink.com",
+                role="Developer",
+                department=f"Department {i % 4}"
+            )
+            for i in range(EMPLOYEES)
+        ]
+        db.add_all(employees)
+        db.flush()
+        db.add_all(
+            Task(title=f"Task {i}", employee_id=employees[i % EMPLOYEES].id)
+            for i in range(TASKS)
+        )
+        db.commit()
+    finally:
+        db.close()
+
+
+def main() -> int:
+    with tempfile.TemporaryDirectory() as tmp:
+        url = f"sqlite:///{os.path.join(tmp, 'query_counts.db')}"
+        engine = create_db_engine(url)
+        Base.metadata.create_all(bind=engine)
+        SessionTest = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+        _seed(SessionTest)
+
+        def get_test_db():
+            db = SessionTest()
+            try:
+                yield db
+            finally:
+                db.close()
+
+        app.dependency_overrides[get_db] = get_test_db
+        app.dependency_overrides[get_current_user] = lambda: {"email": "check@prothink.com"}
+        counted = engine
+        if config.DB_ASYNC:
+            from sqlalchemy.ext.asyncio import async_sessionmaker
+
+            async_engine = create_async_db_engine(url)
+            SessionAsync = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+
+            async def get_test_async_db():
+                async with SessionAsync() as db:
+                    yield db
+
+            app.dependency_overrides[get_async_db] = get_test_async_db
+            counted = async_engine.sync_engine
+        client = TestClient(app)
+        failures = 0
+        try:
+            for path, budget in BUDGETS:
+                with count_queries(counted) as counter:
+                    response = client.get(path)
+                response.raise_for_status()
+                ok = counter.count <= budget
+                failures += not ok
+                print(f"{'ok  ' if ok else 'FAIL'} {path}: {counter.count} statements (budget {budget})")
+        finally:
+            app.dependency_overrides.clear()
+            engine.dispose()
+            if config.DB_ASYNC:
+                asyncio.run(async_engine.dispose())
+
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
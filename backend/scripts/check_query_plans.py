@@ -0,0 +1,154 @@
+"""
+Check that filtered list queries are answered from an index
+
+Seeds a throwaway SQLite database, calls the list endpoints with each filter
+combination the frontend uses, runs EXPLAIN QUERY PLAN on every statement
+they emit and exits non-zero when one of them scans a whole table.
+
+Run from the backend directory:
+    python -m scripts.check_query_plans
+"""
+import os
+import re
+import sys
+import tempfile
+from datetime import date, timedelta
+
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+from sqlalchemy.orm import sessionmaker
+
+from cache import response_cache
+from database import create_db_engine, get_db
+from main import app
+from migrations import migrate
+from pagination import encode_cursor
+from security import get_current_user
+from models.employee import Employee, EmployeeStatus
+from models.task import Task, TaskPriority, TaskStatus
+
+EMPLOYEES = 40
+TASKS = 400
+
+TODAY = date.today()
+RANGE = f"due_after={TODAY}&due_before={TODAY + timedelta(days=30)}"
+# Sync token positioned mid-table in both rows and tombstones
+SINCE = [f"{TODAY}T00:00:00", 1, f"{TODAY}T00:00:00", 1, f"{TODAY}T00:00:00", None]
+
+# Filter combinations used by the task and employee pages
+FILTERS = [
+    "/api/tasks?status=todo",
+    "/api/tasks?priority=high",
+    "/api/tasks?employee_id=1",
+    f"/api/tasks?due_before={TODAY}",
+    f"/api/tasks?{RANGE}",
+    "/api/tasks?status=todo&employee_id=1",
+    f"/api/tasks?status=in_progress&{RANGE}",
+    "/api/tasks?employee_id=1&order_by=due_date",
+    "/api/tasks?employee_id=1&order_by=due_date&cursor=",
+    "/api/tasks?priority=high&status=todo",
+    f"/api/tasks?status=todo&employee_id=1&{RANGE}",
+    "/api/employees?status=active",
+    "/api/employees?department=Department%201",
+    "/api/employees?role=Developer",
+    "/api/employees?department=Department%201&status=active",
+    "/api/employees?status=active&role=Developer",
+    "/api/employees?department=Department%201&role=Developer",
+    "/api/stats?department=Department%201",
+    "/api/employees/workload?department=Department%201",
+    "/api/tasks/overdue",
+    "/api/tasks/due-soon?days=14&employee_id=1",
+    f"/api/tasks/due-soon?cursor={encode_cursor('tasks.due', [str(TODAY), 1])}",
+    # Incremental sync, first call and from a token
+    "/api/tasks/changes",
+    f"/api/tasks/changes?since={encode_cursor('tasks.changes', SINCE)}",
+    "/api/employees/changes",
+    f"/api/employees/changes?since={encode_cursor('employees.changes', SINCE)}",
+]
+
+# "SCAN tasks" without "USING ... INDEX" reads every row of the table
+FULL_SCAN = re.compile(r"^SCAN (tasks|employees|tombstones)\b(?!.*\bUSING\b)")
+
+
+def _seed(SessionTest):
+    db = SessionTest()
+    try:
+        employees = [
+            Employee(
+                name=f"Employee {i}",
+                email=f"employee{i}@prothink.com",
+                role="Developer" if i % 2 else "Designer",
+                department=f"Department {i % 4}",
+                status=EmployeeStatus.ACTIVE if i % 5 else EmployeeStatus.INACTIVE
+            )
+            for i in range(EMPLOYEES)
+        ]
+        db.add_all(employees)
+        db.flush()
+        statuses, priorities = list(TaskStatus), list(TaskPriority)
+        db.add_all(
+            Task(
+                title=f"Task {i}",
+                status=statuses[i % len(statuses)],
+                priority=priorities[i % len(priorities)],
+                due_date=TODAY + timedelta(days=i % 60 - 20),
+                employee_id=employees[i % EMPLOYEES].id
+            )
+            for i in range(TASKS)
+        )
+        db.commit()
+    finally:
+        db.close()
+
+
+def main() -> int:
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_db_engine(f"sqlite:///{os.path.join(tmp, 'query_plans.db')}")
+        migrate(engine, log=lambda message: None)
+        SessionTest = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+        _seed(SessionTest)
+
+        def get_test_db():
+            db = SessionTest()
+            try:
+                yield db
+            finally:
+                db.close()
+
+        statements = []
+
+        def capture(conn, cursor, statement, parameters, context, executemany):
+            if statement.lstrip().upper().startswith("SELECT"):
+                statements.append((statement, parameters))
+
+        app.dependency_overrides[get_db] = get_test_db
+        app.dependency_overrides[get_current_user] = lambda: {"email": "check@prothink.com"}
+        client = TestClient(app)
+        failures = 0
+        try:
+            for path in FILTERS:
+                response_cache.clear()
+                statements.clear()
+                event.listen(engine, "before_cursor_execute", capture)
+                try:
+                    client.get(path).raise_for_status()
+                finally:
+                    event.remove(engine, "before_cursor_execute", capture)
+
+                scans = []
+                with engine.connect() as conn:
+                    for statement, parameters in statements:
+                        plan = conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters).all()
+                        scans += [row[-1] for row in plan if FULL_SCAN.match(row[-1])]
+                failures += bool(scans)
+                detail = f" ({'; '.join(scans)})" if scans else ""
+                print(f"{'FAIL' if scans else 'ok  '} {path}: {len(statements)} statements{detail}")
+        finally:
+            app.dependency_overrides.clear()
+            engine.dispose()
+
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
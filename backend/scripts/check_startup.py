@@ -0,0 +1,179 @@
+"""
+Check worker cold-start time against a budget
+
+Runs fresh interpreters against a throwaway seeded SQLite database and
+exits non-zero when one of these regresses:
+- modules that should load on first use are imported by "import main"
+- import time of main (total, and the share spent in this project's own
+  modules) from python -X importtime
+- time from interpreter start to the first response of /api/health and of
+  an authenticated /api/tasks
+
+Run from the backend directory:
+    python -m scripts.check_startup
+    python -m scripts.check_startup --scale 2   # slower CI machine
+
+STARTUP_BUDGET_SCALE sets the default --scale, so shared CI runners can
+relax every budget without touching the command line.
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Loaded by the first request that needs them, never by "import main"
+LAZY_MODULES = [
+    "routers.auth",
+    "routers.employees",
+    "routers.tasks",
+    "routers.employees_async",
+    "routers.tasks_async",
+    "routers.stats",
+    "routers.imports",
+    "routers.debug",
+    "routers.events",
+    "events",
+    "assignment",
+    "models",
+    "schemas.employee",
+    "schemas.task",
+    "passwords",
+    "importer",
+    "redis",
+    "sqlalchemy.ext.asyncio",
+]
+
+# Milliseconds; multiplied by --scale (default STARTUP_BUDGET_SCALE, or 1)
+BUDGETS = {
+    "import main": 1500,
+    "import main (project modules)": 60,
+    "first response /api/health": 1600,
+    "first response /api/tasks": 2000,
+}
+
+FIRST_RESPONSE = """
+import time
+started = time.perf_counter()
+import asyncio, json, os
+import main
+
+async def request(path):
+    headers = [(b"authorization", f"Bearer {os.environ['CHECK_TOKEN']}".encode())]
+    scope = {
+        "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": "GET",
+        "scheme": "http", "path": path, "raw_path": path.encode(), "root_path": "",
+        "query_string": b"", "headers": headers, "client": ("127.0.0.1", 0), "server": ("testserver", 80),
+    }
+    messages = []
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        messages.append(message)
+
+    await main.app(scope, receive, send)
+    assert messages[0]["status"] == 200, (path, messages[0]["status"])
+    return (time.perf_counter() - started) * 1000
+
+async def run():
+    async with main.app.router.lifespan_context(main.app):
+        return await request(os.environ["CHECK_PATH"])
+
+print(json.dumps(asyncio.run(run())))
+"""
+
+
+def _project_modules() -> set:
+    names = set()
+    for entry in os.listdir(BACKEND_DIR):
+        path = os.path.join(BACKEND_DIR, entry)
+        if entry.endswith(".py"):
+            names.add(entry[:-3])
+        elif os.path.isfile(os.path.join(path, "__init__.py")):
+            names.add(entry)
+    return names
+
+
+def _import_times(env: dict) -> dict:
+    """Self and cumulative microseconds per module from -X importtime"""
+    stderr = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import main"],
+        env=env, cwd=BACKEND_DIR, check=True, capture_output=True, text=True
+    ).stderr
+    times = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        times[name.strip()] = (int(self_us), int(cumulative_us))
+    return times
+
+
+def _first_response(env: dict, path: str) -> float:
+    output = subprocess.run(
+        [sys.executable, "-c", FIRST_RESPONSE], env={**env, "CHECK_PATH": path},
+        cwd=BACKEND_DIR, check=True, capture_output=True, text=True
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=5, help="median of this many interpreters per measurement")
+    parser.add_argument(
+        "--scale", type=float, default=float(os.environ.get("STARTUP_BUDGET_SCALE", "1")),
+        help="multiply every time budget"
+    )
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        env = dict(os.environ)
+        env["DATABASE_URL"] = f"sqlite:///{os.path.join(tmp, 'startup.db')}"
+        env.pop("DB_AUTO_MIGRATE", None)
+        env.pop("SEED_ON_STARTUP", None)
+        subprocess.run(
+            [sys.executable, "manage.py", "seed"], env=env, cwd=BACKEND_DIR, check=True, capture_output=True
+        )
+        from security import create_access_token
+        env["CHECK_TOKEN"] = create_access_token({"sub": "admin@prothink.com", "role": "Administrator"})
+
+        project = _project_modules()
+        runs = [_import_times(env) for _ in range(args.runs)]
+        eager = [name for name in LAZY_MODULES if name in runs[0]]
+        measured = {
+            "import main": statistics.median(run["main"][1] / 1000 for run in runs),
+            "import main (project modules)": statistics.median(
+                sum(self_us for name, (self_us, _) in run.items() if name.split(".")[0] in project) / 1000
+                for run in runs
+            ),
+        }
+        for path in ("/api/health", "/api/tasks"):
+            measured[f"first response {path}"] = statistics.median(
+                _first_response(env, path) for _ in range(args.runs)
+            )
+
+    failures = 0
+    for name in LAZY_MODULES:
+        ok = name not in eager
+        failures += not ok
+        if not ok:
+            print(f"FAIL {name} is imported at startup")
+    if not eager:
+        print(f"ok   {len(LAZY_MODULES)} lazily loaded modules stay unimported at startup")
+    for name, budget in BUDGETS.items():
+        budget *= args.scale
+        ok = measured[name] <= budget
+        failures += not ok
+        print(f"{'ok  ' if ok else 'FAIL'} {name}: {measured[name]:.0f} ms (budget {budget:.0f} ms)")
+
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
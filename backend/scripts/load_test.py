@@ -0,0 +1,199 @@
+"""
+HTTP load test comparing the sync and async (DB_ASYNC) request stacks
+
+Starts a uvicorn server per stack on a throwaway SQLite database, then
+drives it with N concurrent keep-alive clients and reports requests/sec
+and latency percentiles. Clients log in as the seeded admin user unless
+an Authorization header is given.
+
+Requires httpx (pip install httpx). Run from the backend directory:
+    python -m scripts.load_test --concurrency 50 500 --duration 10
+    python -m scripts.load_test --stacks async --path /api/employees/1
+    python -m scripts.load_test --env THREADPOOL_SIZE=100 --env DB_POOL_SIZE=20
+    python -m scripts.load_test --concurrency 20 --login-clients 0 50
+"""
+import argparse
+import asyncio
+import json
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Dict, List, NamedTuple, Optional
+
+import httpx
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# Server environment of each stack
+STACKS = {"sync": {"DB_ASYNC": "false"}, "async": {"DB_ASYNC": "true"}}
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_server(port: int, env: Dict[str, str]) -> subprocess.Popen:
+    """Start uvicorn and wait until the health check answers"""
+    process = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "main:app", "--host", "127.0.0.1",
+         "--port", str(port), "--log-level", "warning", "--no-access-log"],
+        cwd=BACKEND_DIR,
+        env={**os.environ, **env},
+    )
+    deadline = time.monotonic() + 30
+    while time.monotonic() < deadline:
+        try:
+            if httpx.get(f"http://127.0.0.1:{port}/api/health").status_code == 200:
+                return process
+        except httpx.TransportError:
+            pass
+        time.sleep(0.2)
+    process.terminate()
+    raise RuntimeError("server did not start")
+
+
+def login(base_url: str, email: str, password: str) -> str:
+    """Return a bearer token for the given credentials"""
+    response = httpx.post(f"{base_url}/api/auth/login", json={"email": email, "password": password})
+    response.raise_for_status()
+    return response.json()["access_token"]
+
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(round(pct / 100 * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+class Workload(NamedTuple):
+    """A group of identical clients issuing one request in a loop"""
+    name: str
+    method: str
+    path: str
+    body: Optional[dict]
+    headers: Dict[str, str]
+    concurrency: int
+
+
+async def _run_workload(base_url: str, workload: Workload, stop_at: float) -> dict:
+    latencies: List[float] = []
+    errors = 0
+    limits = httpx.Limits(
+        max_connections=workload.concurrency,
+        max_keepalive_connections=workload.concurrency
+    )
+
+    async with httpx.AsyncClient(
+        base_url=base_url, limits=limits, headers=workload.headers, timeout=60
+    ) as client:
+        async def client_loop():
+            nonlocal errors
+            while time.perf_counter() < stop_at:
+                start = time.perf_counter()
+                try:
+                    response = await client.request(workload.method, workload.path, json=workload.body)
+                    if response.status_code >= 400:
+                        errors += 1
+                except httpx.HTTPError:
+                    errors += 1
+                latencies.append(time.perf_counter() - start)
+
+        started = time.perf_counter()
+        await asyncio.gather(*(client_loop() for _ in range(workload.concurrency)))
+        elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        "requests": len(latencies),
+        "errors": errors,
+        "rps": len(latencies) / elapsed,
+        "p50_ms": percentile(latencies, 50) * 1000,
+        "p99_ms": percentile(latencies, 99) * 1000,
+    }
+
+
+async def drive(base_url: str, workloads: List[Workload], duration: float) -> Dict[str, dict]:
+    """Run all workloads side by side for duration seconds and collect latencies"""
+    stop_at = time.perf_counter() + duration
+    results = await asyncio.gather(*(
+        _run_workload(base_url, workload, stop_at)
+        for workload in workloads if workload.concurrency > 0
+    ))
+    return {workload.name: result for workload, result in zip(
+        [w for w in workloads if w.concurrency > 0], results
+    )}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--stacks", nargs="+", choices=list(STACKS), default=list(STACKS), help="stacks to compare")
+    parser.add_argument("--concurrency", nargs="+", type=int, default=[50, 500])
+    parser.add_argument("--duration", type=float, default=10, help="seconds per run")
+    parser.add_argument("--method", default="GET")
+    parser.add_argument("--path", default="/api/tasks")
+    parser.add_argument("--json", dest="body", type=json.loads, default=None, help="JSON request body")
+    parser.add_argument("--header", action="append", default=[], help="extra header, e.g. 'Authorization: Bearer ...'")
+    parser.add_argument("--env", action="append", default=[], help="extra server env var, e.g. DB_POOL_SIZE=20")
+    parser.add_argument("--user", default="admin@prothink.com:password123", help="email:password to log in with")
+    parser.add_argument(
+        "--login-clients", nargs="+", type=int, default=[0],
+        help="extra clients logging in continuously alongside the main load (login storm)"
+    )
+    args = parser.parse_args()
+
+    headers = dict(h.split(":", 1) for h in args.header)
+    headers = {k.strip(): v.strip() for k, v in headers.items()}
+    extra_env = dict(e.split("=", 1) for e in args.env)
+    email, password = args.user.split(":", 1)
+
+    print(f"{args.method} {args.path}, {args.duration:.0f}s per run")
+    print(
+        f"{'stack':>7} {'clients':>7} {'logins':>6} {'load':<6} {'requests':>9} {'errors':>7} "
+        f"{'req/s':>9} {'p50 ms':>8} {'p99 ms':>8}"
+    )
+    for stack in args.stacks:
+        with tempfile.TemporaryDirectory() as tmp:
+            env = {
+                "DATABASE_URL": f"sqlite:///{os.path.join(tmp, 'load_test.db')}",
+                **STACKS[stack],
+                **extra_env,
+            }
+            # The server only checks the schema version, so create and seed it first
+            subprocess.run(
+                [sys.executable, "manage.py", "seed"], env={**os.environ, **env},
+                cwd=BACKEND_DIR, check=True, capture_output=True
+            )
+            port = _free_port()
+            server = start_server(port, env)
+            base_url = f"http://127.0.0.1:{port}"
+            try:
+                run_headers = dict(headers)
+                if "Authorization" not in run_headers:
+                    run_headers["Authorization"] = f"Bearer {login(base_url, email, password)}"
+                runs = [(c, l) for c in args.concurrency for l in args.login_clients]
+                for concurrency, login_clients in runs:
+                    results = asyncio.run(drive(base_url, [
+                        Workload("main", args.method, args.path, args.body, run_headers, concurrency),
+                        Workload(
+                            "login", "POST", "/api/auth/login",
+                            {"email": email, "password": password}, {}, login_clients
+                        ),
+                    ], args.duration))
+                    for name, result in results.items():
+                        print(
+                            f"{stack:>7} {concurrency:>7} {login_clients:>6} {name:<6} "
+                            f"{result['requests']:>9} {result['errors']:>7} {result['rps']:>9.0f} "
+                            f"{result['p50_ms']:>8.1f} {result['p99_ms']:>8.1f}"
+                        )
+            finally:
+                server.terminate()
+                server.wait()
+
+
+if __name__ == "__main__":
+    main()
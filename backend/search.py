@@ -0,0 +1,114 @@
+"""
+Full-text search backed by SQLite FTS5
+Other database backends fall back to case-insensitive LIKE matching
+"""
+import re
+from typing import Dict, List, Optional
+
+from sqlalchemy import column, false, or_, select, table, text
+from sqlalchemy.engine import Connection, Engine
+
+# Indexed columns for each searchable table
+FTS_TABLES: Dict[str, List[str]] = {
+    "employees": ["name", "email", "role", "department"],
+    "tasks": ["title", "description"],
+}
+
+
+def _ddl(source: str, columns: List[str]) -> List[str]:
+    """DDL for an external-content FTS5 table and the triggers that keep it in sync"""
+    fts = f"{source}_fts"
+    cols = ", ".join(columns)
+    new_values = ", ".join(f"new.{c}" for c in columns)
+    old_values = ", ".join(f"old.{c}" for c in columns)
+    return [
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {fts} USING fts5("
+        f"{cols}, content='{source}', content_rowid='id')",
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_ai AFTER INSERT ON {source} BEGIN "
+        f"INSERT INTO {fts}(rowid, {cols}) VALUES (new.id, {new_values}); END",
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_ad AFTER DELETE ON {source} BEGIN "
+        f"INSERT INTO {fts}({fts}, rowid, {cols}) VALUES ('delete', old.id, {old_values}); END",
+        # Only reindex when an indexed column changes, not on status/assignment updates
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_au AFTER UPDATE OF {cols} ON {source} BEGIN "
+        f"INSERT INTO {fts}({fts}, rowid, {cols}) VALUES ('delete', old.id, {old_values}); "
+        f"INSERT INTO {fts}(rowid, {cols}) VALUES (new.id, {new_values}); END",
+    ]
+
+
+def is_supported(bind) -> bool:
+    """FTS5 indexes are only maintained on SQLite"""
+    return bind.dialect.name == "sqlite"
+
+
+def install_search_index(conn: Connection) -> None:
+    """
+    Create FTS tables and sync triggers if missing
+    Newly created indexes are populated from the existing rows
+    """
+    if not is_supported(conn):
+        return
+
+    for source, columns in FTS_TABLES.items():
+        exists = conn.execute(
+            text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = :name"),
+            {"name": f"{source}_fts"}
+        ).first()
+        for statement in _ddl(source, columns):
+            conn.execute(text(statement))
+        if not exists:
+            _rebuild(conn, source)
+
+
+def _rebuild(conn: Connection, source: str) -> None:
+    fts = f"{source}_fts"
+    conn.execute(text(f"INSERT INTO {fts}({fts}) VALUES ('rebuild')"))
+
+
+def rebuild_search_index(bind: Engine) -> None:
+    """Recreate missing FTS objects and rebuild every index from its source table"""
+    if not is_supported(bind):
+        print("Full-text search requires SQLite, nothing to rebuild")
+        return
+
+    with bind.begin() as conn:
+        install_search_index(conn)
+        for source in FTS_TABLES:
+            _rebuild(conn, source)
+            print(f"Rebuilt {source}_fts")
+
+
+def build_match_query(search: str) -> Optional[str]:
+    """
+    Turn free text into an FTS5 query that prefix-matches every term
+    e.g. 'ali john' -> '"ali"* "john"*'
+    """
+    terms = re.findall(r"\w+", search)
+    if not terms:
+        return None
+    return " ".join(f'"{term}"*' for term in terms)
+
+
+def apply_search(query, model, search: str, fallback_columns, bind=None):
+    """
+    Restrict an ORM query or Core select to rows matching search text
+    Returns (query, rank_column); rank_column is None when results can't be ranked
+    """
+    if bind is None:
+        bind = query.session.get_bind()
+    if not is_supported(bind):
+        pattern = f"%{search}%"
+        return query.filter(or_(*(col.ilike(pattern) for col in fallback_columns))), None
+
+    match = build_match_query(search)
+    if match is None:
+        # Only punctuation: FTS has nothing to match, so nothing does
+        return query.filter(false()), None
+
+    fts_name = f"{model.__tablename__}_fts"
+    fts = table(fts_name, column("rowid"), column("rank"))
+    hits = (
+        select(fts.c.rowid.label("id"), fts.c.rank.label("rank"))
+        .where(text(f"{fts_name} MATCH :match").bindparams(match=match))
+        .subquery()
+    )
+    return query.join(hits, hits.c.id == model.id), hits.c.rank
@@ -0,0 +1,230 @@
+"""
+JWT issuing and verification
+Verified tokens are cached by hash until they expire, so signature checking
+and claim decoding run once per token instead of once per request
+"""
+import hashlib
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from typing import Dict, Optional
+
+import jwt
+from fastapi import Depends, HTTPException, Query
+from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+
+import config
+
+# Missing credentials are answered with 401 by get_current_user, not 403
+security = HTTPBearer(auto_error=False)
+
+# Scope of the short-lived tokens that may be passed in the /api/events URL
+EVENTS_SCOPE = "events"
+
+
+def unauthorized(detail: str) -> HTTPException:
+    """401 with the challenge clients use to tell a missing or bad token from a refusal"""
+    return HTTPException(status_code=401, detail=detail, headers={"WWW-Authenticate": "Bearer"})
+
+
+def parse_signing_keys(spec: str) -> "OrderedDict[str, str]":
+    """Parse 'kid:secret,kid:secret'; a bare secret gets the kid 'default'"""
+    keys = OrderedDict()
+    for item in spec.split(","):
+        item = item.strip()
+        if not item:
+            continue
+        kid, sep, secret = item.partition(":")
+        if not sep:
+            kid, secret = "default", item
+        keys[kid.strip()] = secret.strip()
+    if not keys:
+        raise ValueError("JWT_SECRET_KEYS must define at least one key")
+    return keys
+
+
+SIGNING_KEYS = parse_signing_keys(config.JWT_SECRET_KEYS)
+# New tokens are signed with the first key
+ACTIVE_KID = next(iter(SIGNING_KEYS))
+
+
+class TokenCache:
+    """
+    Bounded LRU of verified token hash -> claims
+    Entries live for at most ttl seconds and never past the token's exp
+    """
+
+    def __init__(self, max_entries: int = 10000, ttl: int = 300):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[bytes, tuple[dict, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(token: str) -> bytes:
+        return hashlib.sha256(token.encode()).digest()
+
+    def get(self, token: str) -> Optional[dict]:
+        if not self.ttl:
+            return None
+        key = self._key(token)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[1] > time.time():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[0]
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+            return None
+
+    def put(self, token: str, claims: dict) -> None:
+        if not self.ttl:
+            return
+        expires_at = time.time() + self.ttl
+        if "exp" in claims:
+            expires_at = min(expires_at, claims["exp"])
+        key = self._key(token)
+        with self._lock:
+            self._entries[key] = (claims, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def size(self) -> int:
+        return len(self._entries)
+
+
+class RevocationList:
+    """Revoked token IDs (jti), kept until the tokens would have expired anyway"""
+
+    def __init__(self):
+        self._revoked: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def revoke(self, jti: str, exp: float) -> None:
+        now = time.time()
+        with self._lock:
+            self._revoked[jti] = exp
+            for expired in [k for k, v in self._revoked.items() if v <= now]:
+                del self._revoked[expired]
+
+    def is_revoked(self, jti: Optional[str]) -> bool:
+        return jti is not None and jti in self._revoked
+
+
+token_cache = TokenCache(config.AUTH_CACHE_MAX_ENTRIES, config.AUTH_CACHE_TTL_SECONDS)
+revoked_tokens = RevocationList()
+
+
+def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
+    """Create a JWT access token signed with the active key"""
+    now = datetime.utcnow()
+    to_encode = data.copy()
+    to_encode.update({
+        "iat": now,
+        "exp": now + (expires_delta or timedelta(minutes=config.ACCESS_TOKEN_EXPIRE_MINUTES)),
+        "jti": uuid.uuid4().hex
+    })
+    return jwt.encode(
+        to_encode,
+        SIGNING_KEYS[ACTIVE_KID],
+        algorithm=config.JWT_ALGORITHM,
+        headers={"kid": ACTIVE_KID}
+    )
+
+
+def create_events_token(claims: dict) -> str:
+    """
+    Short-lived token that only opens the event stream
+    It names the session it was issued from (sid), so logging out ends both
+    """
+    user = {key: claims[key] for key in ("email", "name", "role") if key in claims}
+    return create_access_token(
+        {**user, "scope": EVENTS_SCOPE, "sid": claims.get("jti")},
+        timedelta(seconds=config.EVENTS_TOKEN_EXPIRE_SECONDS)
+    )
+
+
+def decode_token(token: str) -> dict:
+    """Verify signature and expiry with the key named by the token's kid"""
+    try:
+        # Tokens issued before key rotation carry no kid
+        kid = jwt.get_unverified_header(token).get("kid", "default")
+        secret = SIGNING_KEYS.get(kid)
+        if secret is None:
+            raise unauthorized("Invalid token")
+        return jwt.decode(token, secret, algorithms=[config.JWT_ALGORITHM])
+    except jwt.ExpiredSignatureError:
+        raise unauthorized("Token has expired")
+    except jwt.InvalidTokenError:
+        raise unauthorized("Invalid token")
+
+
+def authenticate(token: str) -> dict:
+    """Return the claims of a valid, unrevoked token (cached after first use)"""
+    claims = token_cache.get(token)
+    if claims is None:
+        claims = decode_token(token)
+        token_cache.put(token, claims)
+    if revoked_tokens.is_revoked(claims.get("jti")):
+        raise unauthorized("Token has been revoked")
+    return claims
+
+
+def revoke_token(claims: dict) -> None:
+    """Revoke a token by its jti until it expires"""
+    if "jti" in claims:
+        revoked_tokens.revoke(claims["jti"], claims.get("exp", time.time()))
+
+
+def get_current_user(credentials: Optional[HTTPAuthorizationCredentials] = Depends(security)) -> dict:
+    """Dependency that requires a valid bearer token and returns its claims"""
+    if credentials is None:
+        raise unauthorized("Not authenticated")
+    claims = authenticate(credentials.credentials)
+    # Scoped tokens travel in URLs and only open what they were issued for
+    if "scope" in claims:
+        raise unauthorized("Invalid token")
+    return claims
+
+
+def get_events_user(
+    access_token: Optional[str] = Query(None, description="Events token, for clients that can't send headers"),
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(security)
+) -> dict:
+    """
+    Dependency for the event stream: a bearer token, or an events token in
+    the query string since browsers' EventSource can't set headers
+    """
+    if credentials is not None:
+        return get_current_user(credentials)
+    if access_token is None:
+        raise unauthorized("Not authenticated")
+    claims = authenticate(access_token)
+    if claims.get("scope") != EVENTS_SCOPE or revoked_tokens.is_revoked(claims.get("sid")):
+        raise unauthorized("Invalid token")
+    return claims
+
+
+ADMIN_ROLE = "Administrator"
+
+
+def is_admin(claims: dict) -> bool:
+    return claims.get("role") == ADMIN_ROLE
+
+
+def require_admin(user: dict = Depends(get_current_user)) -> dict:
+    """Dependency that only lets administrators through"""
+    if not is_admin(user):
+        raise HTTPException(status_code=403, detail="Administrator role required")
+    return user
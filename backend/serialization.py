@@ -0,0 +1,78 @@
+"""
+JSON encoding of selected column tuples
+List and export endpoints select plain columns and encode them in one pass,
+without building an ORM object and a Pydantic model per row. orjson is used
+when installed; pydantic_core.to_json produces the same bytes otherwise
+"""
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Type
+
+from fastapi import Response
+from pydantic import BaseModel
+from pydantic_core import to_json
+
+from instrumentation import timed_serialization
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+
+def dumps(value: Any) -> bytes:
+    """Compact JSON; enums as values, dates and datetimes in ISO format"""
+    if orjson is not None:
+        return orjson.dumps(value)
+    return to_json(value)
+
+
+def json_response(value: Any) -> Response:
+    """Response with dumps(value), timed as the request's serialization"""
+    with timed_serialization():
+        body = dumps(value)
+    return Response(content=body, media_type="application/json")
+
+
+class RowShape:
+    """
+    Columns to select for a response schema and how to turn the result rows
+    into dicts with the schema's fields, in the schema's order, so encoding
+    them gives the same JSON as response_model serialization
+
+    nested maps a field holding a sub-schema to the entity its columns come
+    from (typically outer-joined); the field is None when that entity's id is
+    """
+
+    def __init__(
+        self,
+        schema: Type[BaseModel],
+        entity,
+        nested: Optional[Dict[str, Tuple[Type[BaseModel], Any]]] = None
+    ):
+        nested = nested or {}
+        self.columns: List[Any] = []
+        # (field name, column index) or (field name, [(sub field, column index)])
+        self._layout: List[Tuple[str, Any]] = []
+        for name in schema.model_fields:
+            if name in nested:
+                sub_schema, sub_entity = nested[name]
+                fields = []
+                for sub_name in sub_schema.model_fields:
+                    fields.append((sub_name, len(self.columns)))
+                    self.columns.append(getattr(sub_entity, sub_name).label(f"{name}__{sub_name}"))
+                self._layout.append((name, fields))
+            else:
+                self._layout.append((name, len(self.columns)))
+                self.columns.append(getattr(entity, name))
+
+    def dict(self, row) -> dict:
+        item = {}
+        for name, index in self._layout:
+            if isinstance(index, list):
+                values = {sub_name: row[i] for sub_name, i in index}
+                item[name] = values if values.get("id") is not None else None
+            else:
+                item[name] = row[index]
+        return item
+
+    def dicts(self, rows: Iterable) -> List[dict]:
+        return [self.dict(row) for row in rows]
@@ -0,0 +1,25 @@
+"""
+Shared fixtures for the backend checks
+
+Each check script runs in its own interpreter, the way CI and a developer
+run it, so its throwaway database and dependency overrides never leak into
+another test.
+"""
+import os
+import subprocess
+import sys
+
+import pytest
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@pytest.fixture
+def run_script():
+    """Run "python -m scripts.<name>" from the backend directory"""
+    def run(name: str, *args: str, env: dict = None) -> subprocess.CompletedProcess:
+        return subprocess.run(
+            [sys.executable, "-m", f"scripts.{name}", *args],
+            cwd=BACKEND_DIR, env={**os.environ, **(env or {})}, capture_output=True, text=True
+        )
+    return run
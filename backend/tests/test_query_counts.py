@@ -0,0 +1,11 @@
+"""
+SQL statements per request stay within scripts.check_query_counts budgets,
+for the sync routers and their DB_ASYNC versions
+"""
+import pytest
+
+
+@pytest.mark.parametrize("db_async", ["false", "true"])
+def test_query_counts_within_budget(run_script, db_async):
+    result = run_script("check_query_counts", env={"DB_ASYNC": db_async})
+    assert result.returncode == 0, result.stdout + result.stderr
@@ -0,0 +1,8 @@
+"""
+Filtered list queries keep using an index (scripts.check_query_plans)
+"""
+
+
+def test_query_plans_use_indexes(run_script):
+    result = run_script("check_query_plans")
+    assert result.returncode == 0, result.stdout + result.stderr
@@ -0,0 +1,10 @@
+"""
+Cold start stays within scripts.check_startup budgets
+
+The time budgets are scaled by STARTUP_BUDGET_SCALE (2 in CI).
+"""
+
+
+def test_startup_within_budget(run_script):
+    result = run_script("check_startup")
+    assert result.returncode == 0, result.stdout + result.stderr
@@ -0,0 +1,150 @@
+"""
+Per-employee workload summary
+employee_workloads holds each employee's open-task counts by status and
+priority, earliest due date and overdue count. Task write paths recompute
+the rows of the employees they touch in the same transaction, with one
+aggregate over those employees' open tasks
+"""
+from datetime import date
+from typing import TYPE_CHECKING, Iterable, List, Optional
+
+from sqlalchemy import and_, case, delete, func, insert, literal, select
+from sqlalchemy.orm import Session
+
+from bulk import chunked
+from models.task import Task, TaskPriority, TaskStatus
+from models.workload import EmployeeWorkload
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+# Order of the values produced by workload_select
+COLUMNS = [
+    "employee_id", "open_tasks", "todo", "in_progress", "low", "medium", "high",
+    "overdue", "next_due_date", "refreshed_on",
+]
+
+
+def _count(condition):
+    return func.sum(case((condition, 1), else_=0))
+
+
+def workload_select(today: date):
+    """Workload of every employee with open tasks, one row per employee"""
+    return (
+        select(
+            Task.employee_id,
+            func.count(Task.id),
+            _count(Task.status == TaskStatus.TODO),
+            _count(Task.status == TaskStatus.IN_PROGRESS),
+            _count(Task.priority == TaskPriority.LOW),
+            _count(Task.priority == TaskPriority.MEDIUM),
+            _count(Task.priority == TaskPriority.HIGH),
+            _count(Task.due_date < today),
+            func.min(Task.due_date),
+            literal(today),
+        )
+        .where(Task.employee_id.isnot(None), Task.status != TaskStatus.DONE)
+        .group_by(Task.employee_id)
+    )
+
+
+def _refreshes(employee_ids: Iterable[Optional[int]], today: date):
+    """Delete and re-insert statements for the workload rows of employee_ids"""
+    for chunk in chunked(list({i for i in employee_ids if i is not None})):
+        yield delete(EmployeeWorkload).where(EmployeeWorkload.employee_id.in_(chunk))
+        yield insert(EmployeeWorkload).from_select(
+            COLUMNS, workload_select(today).where(Task.employee_id.in_(chunk))
+        )
+
+
+def _drops(employee_ids: Iterable[int]):
+    for chunk in chunked(list(set(employee_ids))):
+        yield delete(EmployeeWorkload).where(EmployeeWorkload.employee_id.in_(chunk))
+
+
+def refresh_workloads(db, employee_ids: Iterable[Optional[int]], today: Optional[date] = None) -> None:
+    """
+    Recompute the workload rows of the given employees from their tasks
+    Call in the transaction that changed the tasks, before committing;
+    pending ORM changes are flushed first
+    """
+    if isinstance(db, Session):
+        db.flush()
+    for statement in _refreshes(employee_ids, today or date.today()):
+        db.execute(statement)
+
+
+async def refresh_workloads_async(
+    db: "AsyncSession", employee_ids: Iterable[Optional[int]], today: Optional[date] = None
+) -> None:
+    """refresh_workloads on an AsyncSession"""
+    await db.flush()
+    for statement in _refreshes(employee_ids, today or date.today()):
+        await db.execute(statement)
+
+
+def drop_workloads(db, employee_ids: Iterable[int]) -> None:
+    """Remove the rows of employees that are being deleted"""
+    for statement in _drops(employee_ids):
+        db.execute(statement)
+
+
+async def drop_workloads_async(db: "AsyncSession", employee_ids: Iterable[int]) -> None:
+    """drop_workloads on an AsyncSession"""
+    for statement in _drops(employee_ids):
+        await db.execute(statement)
+
+
+def is_stale(next_due_date: Optional[date], refreshed_on: Optional[date], today: date) -> bool:
+    """
+    Whether a row's overdue count may have changed since it was computed
+    Only rows whose earliest open task has come due since then are affected
+    """
+    return refreshed_on is not None and refreshed_on < today and next_due_date is not None and next_due_date < today
+
+
+def overdue_expression(today: date):
+    """
+    Overdue count of a workload row as of today, for reads
+    Stale rows (see is_stale) count their overdue tasks with a correlated
+    subquery; the rest use the stored count, so reads never write
+    """
+    counted = (
+        select(func.count(Task.id))
+        .where(
+            Task.employee_id == EmployeeWorkload.employee_id,
+            Task.status != TaskStatus.DONE,
+            Task.due_date < today
+        )
+        .correlate(EmployeeWorkload)
+        .scalar_subquery()
+    )
+    stale = and_(EmployeeWorkload.refreshed_on < today, EmployeeWorkload.next_due_date < today)
+    return case((stale, counted), else_=EmployeeWorkload.overdue)
+
+
+def rebuild_workloads(db, today: Optional[date] = None) -> int:
+    """Recompute every workload row from the tasks table; returns the rows written"""
+    today = today or date.today()
+    db.execute(delete(EmployeeWorkload))
+    return db.execute(insert(EmployeeWorkload).from_select(COLUMNS, workload_select(today))).rowcount
+
+
+def find_drift(db, today: Optional[date] = None) -> List[int]:
+    """IDs of employees whose stored workload differs from their tasks"""
+    today = today or date.today()
+    columns = [getattr(EmployeeWorkload, name) for name in COLUMNS]
+    stored = {row[0]: row for row in db.execute(select(*columns)).all()}
+    expected = {row[0]: row for row in db.execute(workload_select(today)).all()}
+    drift = []
+    for employee_id in set(stored) | set(expected):
+        have, want = stored.get(employee_id), expected.get(employee_id)
+        if have is None or want is None:
+            drift.append(employee_id)
+            continue
+        # Overdue counts of stale rows are recomputed when read
+        skip = {"overdue", "refreshed_on"} if is_stale(have.next_due_date, have.refreshed_on, today) else {"refreshed_on"}
+        if any(have[i] != want[i] for i, name in enumerate(COLUMNS) if name not in skip):
+            drift.append(employee_id)
+    return sorted(drift)
@@ -11,4 +11,10 @@ export const authAPI = {
     const { data } = await api.get('/auth/verify')
     return data
   },
+
+  logout: async (token: string): Promise<void> => {
+    await api.post('/auth/logout', null, {
+      headers: { Authorization: `Bearer ${token}` },
+    })
+  },
 }
@@ -0,0 +1,15 @@
+import api from './client'
+import { DashboardStats } from '../types'
+
+export interface StatsFilters {
+  department?: string
+  date_from?: string
+  date_to?: string
+}
+
+export const statsAPI = {
+  getDashboard: async (filters?: StatsFilters): Promise<DashboardStats> => {
+    const { data } = await api.get<DashboardStats>('/stats', { params: filters })
+    return data
+  },
+}
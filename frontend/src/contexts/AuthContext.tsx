@@ -1,5 +1,6 @@
 import { createContext, useState, useEffect, ReactNode } from 'react'
 import { AuthResponse } from '../types'
+import { authAPI } from '../api/auth'
 
 interface AuthContextType {
   isAuthenticated: boolean
@@ -36,6 +37,11 @@ export const AuthProvider = ({ children }: { children: ReactNode }) => {
   }
 
   const logout = () => {
+    // Revoke the token server-side; the local session ends either way
+    const token = localStorage.getItem('token')
+    if (token) {
+      authAPI.logout(token).catch(() => undefined)
+    }
     localStorage.removeItem('token')
     localStorage.removeItem('user')
     setIsAuthenticated(false)
@@ -25,6 +25,7 @@ export const useCreateEmployee = () => {
     mutationFn: (employee: EmployeeCreate) => employeesAPI.create(employee),
     onSuccess: () => {
       queryClient.invalidateQueries({ queryKey: ['employees'] })
+      queryClient.invalidateQueries({ queryKey: ['stats'] })
       toast.success('Employee created successfully')
     },
     onError: (error: any) => {
@@ -41,6 +42,7 @@ export const useUpdateEmployee = () => {
       employeesAPI.update(id, data),
     onSuccess: () => {
       queryClient.invalidateQueries({ queryKey: ['employees'] })
+      queryClient.invalidateQueries({ queryKey: ['stats'] })
       toast.success('Employee updated successfully')
     },
     onError: (error: any) => {
@@ -56,6 +58,7 @@ export const useDeleteEmployee = () => {
     mutationFn: (id: number) => employeesAPI.delete(id),
     onSuccess: () => {
       queryClient.invalidateQueries({ queryKey: ['employees'] })
+      queryClient.invalidateQueries({ queryKey: ['stats'] })
       toast.success('Employee deleted successfully')
     },
     onError: (error: any) => {
@@ -0,0 +1,9 @@
+import { useQuery } from '@tanstack/react-query'
+import { statsAPI, StatsFilters } from '../api/stats'
+
+export const useDashboardStats = (filters?: StatsFilters) => {
+  return useQuery({
+    queryKey: ['stats', filters],
+    queryFn: () => statsAPI.getDashboard(filters),
+  })
+}
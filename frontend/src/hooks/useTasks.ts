@@ -26,6 +26,7 @@ export const useCreateTask = () => {
     onSuccess: () => {
       queryClient.invalidateQueries({ queryKey: ['tasks'] })
       queryClient.invalidateQueries({ queryKey: ['employees'] })
+      queryClient.invalidateQueries({ queryKey: ['stats'] })
       toast.success('Task created successfully')
     },
     onError: (error: any) => {
@@ -43,6 +44,7 @@ export const useUpdateTask = () => {
     onSuccess: () => {
       queryClient.invalidateQueries({ queryKey: ['tasks'] })
       queryClient.invalidateQueries({ queryKey: ['employees'] })
+      queryClient.invalidateQueries({ queryKey: ['stats'] })
       toast.success('Task updated successfully')
     },
     onError: (error: any) => {
@@ -59,6 +61,7 @@ export const useDeleteTask = () => {
     onSuccess: () => {
       queryClient.invalidateQueries({ queryKey: ['tasks'] })
       queryClient.invalidateQueries({ queryKey: ['employees'] })
+      queryClient.invalidateQueries({ queryKey: ['stats'] })
       toast.success('Task deleted successfully')
     },
     onError: (error: any) => {
@@ -76,6 +79,7 @@ export const useAssignTask = () => {
     onSuccess: () => {
       queryClient.invalidateQueries({ queryKey: ['tasks'] })
       queryClient.invalidateQueries({ queryKey: ['employees'] })
+      queryClient.invalidateQueries({ queryKey: ['stats'] })
       toast.success('Task assigned successfully')
     },
     onError: (error: any) => {
@@ -92,6 +96,7 @@ export const useUnassignTask = () => {
     onSuccess: () => {
       queryClient.invalidateQueries({ queryKey: ['tasks'] })
       queryClient.invalidateQueries({ queryKey: ['employees'] })
+      queryClient.invalidateQueries({ queryKey: ['stats'] })
       toast.success('Task unassigned successfully')
     },
     onError: (error: any) => {
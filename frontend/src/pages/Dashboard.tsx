@@ -1,29 +1,27 @@
-import { useEmployees } from '../hooks/useEmployees'
-import { useTasks } from '../hooks/useTasks'
+import { useDashboardStats } from '../hooks/useStats'
 import Loading from '../components/Loading'
 import ErrorMessage from '../components/ErrorMessage'
 import { Users, UserCheck, CheckSquare, Clock, CheckCircle, AlertCircle } from 'lucide-react'
 import { PieChart, Pie, Cell, ResponsiveContainer, Legend, Tooltip, BarChart, Bar, XAxis, YAxis, CartesianGrid } from 'recharts'
 
 export default function Dashboard() {
-  const { data: employees, isLoading: employeesLoading, error: employeesError } = useEmployees()
-  const { data: tasks, isLoading: tasksLoading, error: tasksError } = useTasks()
+  const { data: stats, isLoading, error } = useDashboardStats()
 
-  if (employeesLoading || tasksLoading) {
+  if (isLoading) {
     return <Loading message="Loading dashboard..." />
   }
 
-  if (employeesError || tasksError) {
+  if (error || !stats) {
     return <ErrorMessage message="Failed to load dashboard data" />
   }
 
-  // Calculate stats
-  const totalEmployees = employees?.length || 0
-  const activeEmployees = employees?.filter(e => e.status === 'active').length || 0
-  const totalTasks = tasks?.length || 0
-  const todoTasks = tasks?.filter(t => t.status === 'todo').length || 0
-  const inProgressTasks = tasks?.filter(t => t.status === 'in_progress').length || 0
-  const doneTasks = tasks?.filter(t => t.status === 'done').length || 0
+  // Stats are aggregated server-side by /api/stats
+  const totalEmployees = stats.employees.total
+  const activeEmployees = stats.employees.by_status.active
+  const totalTasks = stats.tasks.total
+  const todoTasks = stats.tasks.by_status.todo
+  const inProgressTasks = stats.tasks.by_status.in_progress
+  const doneTasks = stats.tasks.by_status.done
 
   // Task status data for pie chart
   const taskStatusData = [
@@ -33,22 +31,15 @@ export default function Dashboard() {
   ]
 
   // Tasks by department
-  const departmentStats = employees?.reduce((acc: any, emp) => {
-    const dept = emp.department
-    const empTasks = tasks?.filter(t => t.employee_id === emp.id).length || 0
-    acc[dept] = (acc[dept] || 0) + empTasks
-    return acc
-  }, {}) || {}
-
-  const departmentData = Object.entries(departmentStats).map(([name, value]) => ({
-    name,
-    tasks: value
+  const departmentData = stats.departments.map(dept => ({
+    name: dept.department,
+    tasks: dept.tasks
   }))
 
   // Priority distribution
-  const highPriority = tasks?.filter(t => t.priority === 'high').length || 0
-  const mediumPriority = tasks?.filter(t => t.priority === 'medium').length || 0
-  const lowPriority = tasks?.filter(t => t.priority === 'low').length || 0
+  const highPriority = stats.tasks.by_priority.high
+  const mediumPriority = stats.tasks.by_priority.medium
+  const lowPriority = stats.tasks.by_priority.low
 
   return (
     <div className="space-y-6">
@@ -78,13 +78,22 @@ export interface AuthResponse {
   }
 }
 
+export interface DepartmentStats {
+  department: string
+  employees: number
+  tasks: number
+}
+
 export interface DashboardStats {
-  totalEmployees: number
-  activeEmployees: number
-  totalTasks: number
-  tasksByStatus: {
-    todo: number
-    in_progress: number
-    done: number
+  employees: {
+    total: number
+    by_status: Record<'active' | 'inactive', number>
+  }
+  tasks: {
+    total: number
+    unassigned: number
+    by_status: Record<'todo' | 'in_progress' | 'done', number>
+    by_priority: Record<'low' | 'medium' | 'high', number>
   }
+  departments: DepartmentStats[]
 }
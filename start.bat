@@ -52,6 +52,7 @@ cd backend
 REM Activate virtual environment
 if exist venv\Scripts\activate.bat (
     call venv\Scripts\activate.bat
+    python manage.py seed
     echo Backend server starting on http://localhost:8000
     python main.py
 ) else (
@@ -45,6 +45,9 @@ start_backend() {
         touch venv/installed
     fi
     
+    # Apply migrations and load demo data into an empty database
+    python manage.py seed
+    
     # Start the server
     echo "🚀 Backend server starting on http://localhost:8000"
     python main.py